@@ -0,0 +1,47 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Micro-benchmark of the per-call cost of the ``get_freq_label`` backends.
+
+Run it from the repository root with ``python benchmarks/bench_freq_label.py``.
+"""
+
+import argparse
+import timeit
+
+from smjsindustry.finance.utils import FREQ_LABEL_BACKENDS, get_freq_label
+
+DATE_VALUES = ["2021-01-01", "2020-5-17", "2019-12", "2018-02-28", "2020Q3"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000, help="calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case")
+    args = parser.parse_args()
+
+    print(f"{'freq':<6}{'backend':<10}{'usec/call':>10}")
+    for freq in ["D", "W", "M", "Q", "Y"]:
+        date_values = [value for value in DATE_VALUES if not value.endswith("Q3") or freq == "Q"]
+        if freq in ("D", "W"):
+            date_values = [value for value in date_values if value.count("-") == 2]
+        for backend in FREQ_LABEL_BACKENDS:
+            timer = timeit.Timer(
+                lambda: [get_freq_label(value, freq, backend) for value in date_values]
+            )
+            best = min(timer.repeat(repeat=args.repeat, number=args.number))
+            usec = best / (args.number * len(date_values)) * 1e6
+            print(f"{freq:<6}{backend:<10}{usec:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
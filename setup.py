@@ -40,7 +40,10 @@ required_packages = [
 
 
 # Specific use case dependencies
-extras = {}
+extras = {
+    "arrow": ["pyarrow>=14.0"],
+    "nlp": ["nltk>=3.6", "scipy>=1.8", "gensim>=4.0"],
+}
 # Meta dependency groups
 extras["all"] = [item for group in extras.values() for item in group]
 # Tests specific dependencies (do not need to be included in 'all')
@@ -28,7 +28,29 @@ from smjsindustry.finance.processor_config import (  # noqa: F401
     KMedoidsSummarizerConfig,
     NLPScorerConfig,
 )
-from smjsindustry.finance.build_tabText import build_tabText  # noqa: F401
+from smjsindustry.finance.build_tabText import (  # noqa: F401
+    TabTextStreamStats,
+    build_tabText,
+    build_tabText_arrow,
+    build_tabText_chunked,
+    build_tabText_multi_freq,
+)
+from smjsindustry.finance.local_scorer import (  # noqa: F401
+    readability_scores,
+    score_csv,
+    score_dataframe,
+    score_text,
+)
+from smjsindustry.finance.local_summarizer import (  # noqa: F401
+    SummaryBatch,
+    SummaryStreamStats,
+    iter_summarized_csv,
+    summarize_batch,
+    summarize_csv,
+    summarize_csv_streaming,
+    summarize_dataframe,
+    summarize_text,
+)
 
 __all__ = [
     "Summarizer",
@@ -42,4 +64,20 @@ __all__ = [
     "NLPScoreType",
     "NLPSCORE_NO_WORD_LIST",
     "build_tabText",
+    "build_tabText_arrow",
+    "build_tabText_chunked",
+    "build_tabText_multi_freq",
+    "TabTextStreamStats",
+    "summarize_text",
+    "summarize_batch",
+    "SummaryBatch",
+    "summarize_dataframe",
+    "summarize_csv",
+    "summarize_csv_streaming",
+    "iter_summarized_csv",
+    "SummaryStreamStats",
+    "score_text",
+    "score_dataframe",
+    "score_csv",
+    "readability_scores",
 ]
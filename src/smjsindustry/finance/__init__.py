@@ -12,7 +12,49 @@
 # language governing permissions and limitations under the License.
 """smjsindustry Finance module."""
 
-from smjsindustry.finance.build_tabText import build_tabText  # noqa: F401
+from smjsindustry.finance.build_tabText import (  # noqa: F401
+    TabTextStreamStats,
+    build_tabText,
+    build_tabText_arrow,
+    build_tabText_chunked,
+    build_tabText_multi_freq,
+)
+from smjsindustry.finance.embeddings import (  # noqa: F401
+    Doc2VecEmbedder,
+    EmbeddingCache,
+    HashingEmbedder,
+    PrecomputedEmbedder,
+    SentenceEmbedder,
+)
+from smjsindustry.finance.kmedoids import (  # noqa: F401
+    KMedoidsComparison,
+    KMedoidsResult,
+    clara,
+    compare_with_pam,
+    kmedoids,
+    pairwise_distances,
+)
+from smjsindustry.finance.lexicon import (  # noqa: F401
+    CompiledLexicon,
+    compile_lexicon,
+    load_lexicon,
+)
+from smjsindustry.finance.local_scorer import (  # noqa: F401
+    readability_scores,
+    score_csv,
+    score_dataframe,
+    score_text,
+)
+from smjsindustry.finance.local_summarizer import (  # noqa: F401
+    SummaryBatch,
+    SummaryStreamStats,
+    iter_summarized_csv,
+    summarize_batch,
+    summarize_csv,
+    summarize_csv_streaming,
+    summarize_dataframe,
+    summarize_text,
+)
 from smjsindustry.finance.nlp_score_type import (  # noqa: F401
     NLPScoreType,
     NLPSCORE_NO_WORD_LIST,
@@ -30,8 +72,12 @@ from smjsindustry.finance.processor_config import (  # noqa: F401
     NLPScorerConfig,
 )
 from smjsindustry.finance.utils import (  # noqa: F401
+    FreqLabelCache,
     FreqLiteral,
+    format_freq_ordinals,
     get_freq_label,
+    get_freq_labels,
+    get_freq_ordinals,
     load_image_uri_config,
     retrieve_image,
 )
@@ -48,8 +94,42 @@ __all__ = [
     "NLPScoreType",
     "NLPSCORE_NO_WORD_LIST",
     "build_tabText",
+    "build_tabText_arrow",
+    "build_tabText_chunked",
+    "build_tabText_multi_freq",
+    "TabTextStreamStats",
+    "summarize_text",
+    "summarize_batch",
+    "SummaryBatch",
+    "kmedoids",
+    "pairwise_distances",
+    "KMedoidsResult",
+    "clara",
+    "compare_with_pam",
+    "KMedoidsComparison",
+    "SentenceEmbedder",
+    "Doc2VecEmbedder",
+    "HashingEmbedder",
+    "PrecomputedEmbedder",
+    "EmbeddingCache",
+    "summarize_dataframe",
+    "summarize_csv",
+    "summarize_csv_streaming",
+    "iter_summarized_csv",
+    "SummaryStreamStats",
+    "score_text",
+    "score_dataframe",
+    "score_csv",
+    "readability_scores",
+    "compile_lexicon",
+    "load_lexicon",
+    "CompiledLexicon",
     "get_freq_label",
+    "get_freq_labels",
+    "get_freq_ordinals",
+    "format_freq_ordinals",
     "load_image_uri_config",
     "retrieve_image",
     "FreqLiteral",
+    "FreqLabelCache",
 ]
@@ -12,15 +12,66 @@
 # language governing permissions and limitations under the License.
 """The module that builds a TabText dataframe."""
 
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from typing import Literal  # Added for strict type checking of pd.merge 'how'
-from smjsindustry.finance.utils import FreqLiteral, get_freq_label
+from pandas.errors import MergeError
+from typing import (  # Added for strict type checking of pd.merge 'how'
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from smjsindustry.finance.utils import (
+    FreqLabelCache,
+    FreqLiteral,
+    convert_day_ordinals,
+    format_freq_ordinals,
+    get_freq_labels,
+    get_freq_ordinals,
+    is_temporal_dates,
+)
+
+try:
+    import pyarrow as pa  # type: ignore[import]
+    import pyarrow.compute as pc  # type: ignore[import]
+    import pyarrow.dataset as ds  # type: ignore[import]
+    import pyarrow.parquet as pq  # type: ignore[import]
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pa = None
+    pc = None
+    ds = None
+    pq = None
+
+logger = logging.getLogger(__name__)
 
 
 JUMPSTART_NORMALIZED_DATE = "jumpstart-normalized-date"
+JUMPSTART_TABULAR_POSITION = "jumpstart-tabular-position"
+JUMPSTART_TEXT_POSITION = "jumpstart-text-position"
 
 # Define the acceptable merge 'how' types as a literal for clarity
 MergeHow = Literal["left", "right", "outer", "inner"]
+TabTextHow = Literal["left", "right", "outer", "inner", "asof"]
+AsofDirection = Literal["backward", "forward", "nearest"]
+StreamingMergeHow = Literal["left", "inner"]
+TextSource = Union[str, "os.PathLike[str]", Iterable[pd.DataFrame]]
+TabTextSink = Union[str, "os.PathLike[str]", Callable[[pd.DataFrame], Any]]
+ArrowSource = Union[pd.DataFrame, "pa.Table", str, "os.PathLike[str]"]
+ArrowOutputFormat = Literal["arrow", "pandas"]
+
+_PARQUET_EXTENSIONS = (".parquet", ".pq")
 
 
 def build_tabText(
@@ -30,8 +81,12 @@ def build_tabText(
     text_df: pd.DataFrame,
     text_key: str,
     text_date_column: str,
-    how: MergeHow = "inner",  # Changed type hint to Literal for strict type checking
+    how: TabTextHow = "inner",  # Changed type hint to Literal for strict type checking
     freq: FreqLiteral = "Q",
+    label_cache: Optional[FreqLabelCache] = None,
+    n_jobs: int = 1,
+    tolerance: Optional[Union[str, pd.Timedelta]] = None,
+    direction: AsofDirection = "backward",
 ) -> pd.DataFrame:
     """Builds a TabText dataframe by joining the columns in the tabular and text dataframes.
 
@@ -41,6 +96,10 @@ def build_tabText(
     according to the given frequency, the two dataframes can be merged using
     the key column and the normalized date column.
 
+    The input dataframes are not modified, so the function can be called
+    concurrently on shared dataframes. Only the key columns are merged; the other
+    columns are gathered once from the inputs at the matched rows.
+
     Args:
         tabular_df (pandas.DataFrame): The tabular dataframe to be joined, requiring a date column.
         tabular_key (str): The tabular dataframe's key column to be joined on.
@@ -51,33 +110,1270 @@ def build_tabText(
         text_date_column (str): The text dataframe's date column to be joined on,
             in a format of ``"yyyy-mm-dd"``, ``"yyyy-mm"``, or ``"yyyy"``.
         how (str): The type of join to be performed; possible values:
-            ``{'left', 'right', 'outer', 'inner'}`` (default: ``'inner'``).
+            ``{'left', 'right', 'outer', 'inner', 'asof'}`` (default: ``'inner'``).
+            An ``'asof'`` join keeps every tabular row and matches it to the text
+            row with the same key and the nearest date in the given ``direction``,
+            instead of an equal ``freq`` label.
         freq (str): Specify how the date field should be joined,
             by year, quarter, month, week or day. Possible values:
-            ``{'Y', 'Q', 'M', 'W', 'D'}`` (default: ``'Q'``).
+            ``{'Y', 'Q', 'M', 'W', 'D'}`` (default: ``'Q'``). Not used by ``'asof'`` joins.
+        label_cache (FreqLabelCache): An optional cache of normalized dates shared
+            across calls, for example when the same panel is joined repeatedly
+            (default: None). The cache is not used by parallel joins.
+        n_jobs (int): The number of worker processes that normalize the dates and
+            merge the keys (default: 1). With more than one job, both dataframes are
+            hash-partitioned on their keys, and the key and date columns of each
+            partition are handed to the workers as Arrow files in shared memory.
+            The result has the same rows as with one job, in a deterministic order:
+            the order of :func:`pandas.merge` for left, right and outer joins, and
+            tabular rows then text rows for inner joins. Requires ``pyarrow``.
+            ``'asof'`` joins run in a single process.
+        tolerance (str or pandas.Timedelta): The largest distance between the dates
+            of an ``'asof'`` match, such as ``"90D"`` (default: None, no limit).
+        direction (str): Whether an ``'asof'`` join matches the latest text date on
+            or before the tabular date, the earliest on or after it, or the closest
+            one; possible values: ``{'backward', 'forward', 'nearest'}``
+            (default: ``'backward'``).
 
     Returns:
         pandas.DataFrame: The joined dataframe object.
     """
+    if not isinstance(n_jobs, int) or n_jobs < 1:
+        raise ValueError("build_tabText requires n_jobs to be a positive integer.")
+    if how == "asof":
+        return _asof_join(
+            tabular_df,
+            tabular_key,
+            tabular_date_column,
+            text_df,
+            text_key,
+            text_date_column,
+            tolerance,
+            direction,
+        )
+    if n_jobs > 1 and tabular_date_column and text_date_column:
+        return _parallel_join(
+            tabular_df,
+            tabular_key,
+            tabular_date_column,
+            text_df,
+            text_key,
+            text_date_column,
+            how,
+            freq,
+            n_jobs,
+        )
+    tabular_on: List[str] = [tabular_key]
+    text_on: List[str] = [text_key]
+    tabular_keys = tabular_df[[tabular_key]]
+    text_keys = text_df[[text_key]]
     if tabular_date_column and text_date_column:
-        # Replaced loop with vectorized apply + astype(str) to fix Scalar to str error
-        tabular_df[JUMPSTART_NORMALIZED_DATE] = tabular_df[tabular_date_column].astype(str).apply(
-            lambda date_value: get_freq_label(date_value, freq)
+        tabular_dates, text_dates = _normalize_dates(
+            tabular_df[tabular_date_column], text_df[text_date_column], freq, label_cache
+        )
+        tabular_keys = tabular_keys.assign(**{JUMPSTART_NORMALIZED_DATE: tabular_dates})
+        text_keys = text_keys.assign(**{JUMPSTART_NORMALIZED_DATE: text_dates})
+        tabular_on.append(JUMPSTART_NORMALIZED_DATE)
+        text_on.append(JUMPSTART_NORMALIZED_DATE)
+    return _join_on_keys(tabular_df, tabular_keys, tabular_on, text_df, text_keys, text_on, how)
+
+
+def _date_values(column: pd.Series) -> pd.Series:
+    """Gets the values of a date column to label, keeping datetimes, periods and dates as is."""
+    return column if is_temporal_dates(column) else column.astype(str)
+
+
+def _normalize_dates(
+    tabular_dates: pd.Series,
+    text_dates: pd.Series,
+    freq: FreqLiteral,
+    label_cache: Optional[FreqLabelCache] = None,
+) -> Tuple[Any, Any]:
+    """Normalizes the date columns of both dataframes to comparable period keys.
+
+    When both columns hold datetimes, periods or dates, the keys are integer period
+    ordinals and no label is rendered; otherwise they are the frequency labels.
+    """
+    if is_temporal_dates(tabular_dates) and is_temporal_dates(text_dates):
+        return get_freq_ordinals(tabular_dates, freq), get_freq_ordinals(text_dates, freq)
+    return (
+        get_freq_labels(_date_values(tabular_dates), freq, label_cache),
+        get_freq_labels(_date_values(text_dates), freq, label_cache),
+    )
+
+
+def _is_identity(positions: np.ndarray) -> bool:
+    """Checks whether the row positions select every row in its original order."""
+    return bool((positions == np.arange(len(positions))).all())
+
+
+def _take(column: pd.Series, positions: np.ndarray, has_missing: bool) -> pd.Series:
+    """Gathers the values of a column at row positions, where ``-1`` stands for a missing row."""
+    if len(positions) == len(column) and not has_missing and _is_identity(positions):
+        return column.reset_index(drop=True)
+    values = column.array.take(positions, allow_fill=has_missing)
+    # Keep the gathered dtype, so object columns are not re-inferred (and copied) as strings.
+    return pd.Series(values, dtype=values.dtype, copy=False)
+
+
+def _join_on_keys(
+    tabular_df: pd.DataFrame,
+    tabular_keys: pd.DataFrame,
+    tabular_on: List[str],
+    text_df: pd.DataFrame,
+    text_keys: pd.DataFrame,
+    text_on: List[str],
+    how: MergeHow,
+) -> pd.DataFrame:
+    """Joins two dataframes by merging their key columns only.
+
+    Only the key columns and the row positions of both dataframes are merged. The
+    remaining columns, such as long text columns, are gathered once from the inputs
+    at the matched positions, so neither input is modified or copied as a whole.
+    The result has the same columns, column order, suffixes and rows as
+    ``pandas.merge(tabular_df, text_df, left_on=..., right_on=..., how=how)``.
+
+    Args:
+        tabular_df (pandas.DataFrame): The tabular dataframe to be joined.
+        tabular_keys (pandas.DataFrame): The columns of ``tabular_on``, row-aligned
+            with ``tabular_df``.
+        tabular_on (List[str]): The tabular key columns; the first one is a column
+            of ``tabular_df`` and the others are derived keys dropped from the result.
+        text_df (pandas.DataFrame): The text dataframe to be joined.
+        text_keys (pandas.DataFrame): The columns of ``text_on``, row-aligned with ``text_df``.
+        text_on (List[str]): The text key columns, like ``tabular_on``.
+        how (str): The type of join to be performed.
+
+    Returns:
+        pandas.DataFrame: The joined dataframe object.
+    """
+    tabular_key, text_key = tabular_on[0], text_on[0]
+    merged = pd.merge(
+        tabular_keys.reset_index(drop=True).assign(
+            **{JUMPSTART_TABULAR_POSITION: np.arange(len(tabular_keys))}
+        ),
+        text_keys.reset_index(drop=True).assign(
+            **{JUMPSTART_TEXT_POSITION: np.arange(len(text_keys))}
+        ),
+        left_on=tabular_on,
+        right_on=text_on,
+        how=how,
+    )
+    tabular_positions = merged[JUMPSTART_TABULAR_POSITION].fillna(-1).to_numpy(dtype=np.intp)
+    text_positions = merged[JUMPSTART_TEXT_POSITION].fillna(-1).to_numpy(dtype=np.intp)
+    return _gather_columns(
+        tabular_df,
+        tabular_positions,
+        tabular_key,
+        text_df,
+        text_positions,
+        text_key,
+        key_columns={tabular_key: merged[tabular_key], text_key: merged[text_key]},
+    )
+
+
+def _joined_columns(
+    tabular_columns: Iterable[str],
+    tabular_key: str,
+    text_columns: Iterable[str],
+    text_key: str,
+) -> List[Tuple[str, str, str]]:
+    """Lists the columns of a joined dataframe in the order and with the suffixes of a merge.
+
+    Returns:
+        List[Tuple[str, str, str]]: The ``(side, column, name)`` of each joined column,
+        where ``side`` is ``"tabular"`` or ``"text"``.
+    """
+    tabular_columns, text_columns = list(tabular_columns), list(text_columns)
+    # Key columns with the same name in both dataframes are merged into one column;
+    # any other column present in both dataframes gets the usual suffixes.
+    shared_keys = {tabular_key} if tabular_key == text_key else set()
+    overlap = set(tabular_columns).intersection(text_columns) - shared_keys
+    joined = [
+        ("tabular", column, f"{column}_x" if column in overlap else column)
+        for column in tabular_columns
+    ]
+    joined.extend(
+        ("text", column, f"{column}_y" if column in overlap else column)
+        for column in text_columns
+        if column not in shared_keys
+    )
+    # Like pd.merge, refuse suffixed names that collide with another joined column.
+    unsuffixed = {
+        "tabular": set(text_columns) - overlap,
+        "text": set(tabular_columns) - overlap,
+    }
+    sides = {
+        side: [name for joined_side, _, name in joined if joined_side == side]
+        for side in unsuffixed
+    }
+    duplicates = {
+        name
+        for side, column, name in joined
+        if column in overlap and (sides[side].count(name) > 1 or name in unsuffixed[side])
+    }
+    if duplicates:
+        raise MergeError(
+            f"Passing 'suffixes' which cause duplicate columns {duplicates} is not allowed."
+        )
+    return joined
+
+
+def _gather_columns(
+    tabular_df: pd.DataFrame,
+    tabular_positions: np.ndarray,
+    tabular_key: str,
+    text_df: pd.DataFrame,
+    text_positions: np.ndarray,
+    text_key: str,
+    key_columns: Optional[Dict[str, pd.Series]] = None,
+) -> pd.DataFrame:
+    """Gathers the joined dataframe from the matched row positions of both dataframes.
+
+    Args:
+        tabular_df (pandas.DataFrame): The tabular dataframe.
+        tabular_positions (numpy.ndarray): The tabular row of each joined row, or ``-1``.
+        tabular_key (str): The tabular key column.
+        text_df (pandas.DataFrame): The text dataframe.
+        text_positions (numpy.ndarray): The text row of each joined row, or ``-1``.
+        text_key (str): The text key column.
+        key_columns (Dict[str, pandas.Series]): Already joined key columns, used
+            instead of gathering the key columns from the inputs (default: None).
+
+    Returns:
+        pandas.DataFrame: The joined dataframe, with the columns ordered and suffixed
+        like ``pandas.merge`` orders and suffixes them.
+    """
+    key_columns = key_columns or {}
+    tabular_missing = bool((tabular_positions < 0).any())
+    text_missing = bool((text_positions < 0).any())
+    columns = {}
+    for side, column, name in _joined_columns(
+        tabular_df.columns, tabular_key, text_df.columns, text_key
+    ):
+        key = tabular_key if side == "tabular" else text_key
+        if column == key and column in key_columns:
+            columns[name] = key_columns[column].reset_index(drop=True)
+        elif side == "tabular":
+            columns[name] = _take(tabular_df[column], tabular_positions, tabular_missing)
+        else:
+            columns[name] = _take(text_df[column], text_positions, text_missing)
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(tabular_positions)), copy=False)
+
+
+_PARTITION_KEY = "key"
+_PARTITION_DATE = "date"
+
+
+def _parse_dates(column: pd.Series) -> np.ndarray:
+    """Parses a date column in a format of ``"yyyy-mm-dd"``, ``"yyyy-mm"``, or ``"yyyy"``.
+
+    Datetime, ``Period`` and ``datetime.date`` columns are converted without parsing.
+    """
+    if column.isna().any():
+        raise ValueError("The date column needs to be string")
+    if isinstance(column.dtype, pd.PeriodDtype):
+        return column.dt.start_time.to_numpy()
+    if is_temporal_dates(column):
+        return pd.to_datetime(column).to_numpy()
+    return pd.to_datetime(column.astype(str), format="ISO8601").to_numpy()
+
+
+def _asof_join(
+    tabular_df: pd.DataFrame,
+    tabular_key: str,
+    tabular_date_column: str,
+    text_df: pd.DataFrame,
+    text_key: str,
+    text_date_column: str,
+    tolerance: Optional[Union[str, pd.Timedelta]],
+    direction: AsofDirection,
+) -> pd.DataFrame:
+    """Matches each tabular row to the nearest text row with the same key.
+
+    Both key frames are sorted by date once and searched with
+    :func:`pandas.merge_asof` by key, so the join takes ``O((n + m) log(n + m))``
+    time instead of the ``O(n * m)`` of a cross join filtered on the dates.
+
+    Returns:
+        pandas.DataFrame: The joined dataframe, with the tabular rows in their
+        original order and the columns of a left join.
+    """
+    if not tabular_date_column or not text_date_column:
+        raise ValueError("build_tabText with how='asof' requires both date columns.")
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"build_tabText does not support direction={direction!r}.")
+    if tolerance is not None:
+        tolerance = pd.Timedelta(tolerance)
+        if tolerance < pd.Timedelta(0):
+            raise ValueError("build_tabText requires tolerance to be non-negative.")
+    tabular_keys = pd.DataFrame(
+        {
+            _PARTITION_KEY: tabular_df[tabular_key].to_numpy(),
+            _PARTITION_DATE: _parse_dates(tabular_df[tabular_date_column]),
+            JUMPSTART_TABULAR_POSITION: np.arange(len(tabular_df)),
+        }
+    )
+    text_keys = pd.DataFrame(
+        {
+            _PARTITION_KEY: text_df[text_key].to_numpy(),
+            _PARTITION_DATE: _parse_dates(text_df[text_date_column]),
+            JUMPSTART_TEXT_POSITION: np.arange(len(text_df)),
+        }
+    )
+    merged = pd.merge_asof(
+        tabular_keys.sort_values(_PARTITION_DATE, kind="stable"),
+        text_keys.sort_values(_PARTITION_DATE, kind="stable"),
+        on=_PARTITION_DATE,
+        by=_PARTITION_KEY,
+        tolerance=tolerance,
+        direction=direction,
+    )
+    tabular_positions = merged[JUMPSTART_TABULAR_POSITION].to_numpy(dtype=np.intp)
+    order = np.argsort(tabular_positions, kind="stable")
+    text_positions = merged[JUMPSTART_TEXT_POSITION].fillna(-1).to_numpy(dtype=np.intp)
+    return _gather_columns(
+        tabular_df,
+        tabular_positions[order],
+        tabular_key,
+        text_df,
+        text_positions[order],
+        text_key,
+    )
+
+
+def _shared_memory_dir() -> Optional[str]:
+    """Gets the directory of a memory-backed file system, if the platform has one."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _write_arrow_file(frame: pd.DataFrame, path: str):
+    """Writes a dataframe to an Arrow IPC file."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _read_arrow_file(path: str) -> pd.DataFrame:
+    """Reads a dataframe from an Arrow IPC file through a memory map."""
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def _join_partition(partition_dir: str, partition: int, freq: str, how: MergeHow) -> str:
+    """Normalizes the dates and merges the keys of one partition in a worker process.
+
+    Args:
+        partition_dir (str): The directory holding the Arrow files of the partitions.
+        partition (int): The partition number.
+        freq (str): The frequency of the normalized dates.
+        how (str): The type of join to be performed.
+
+    Returns:
+        str: The path of the Arrow file with the matched row positions and their
+        normalized dates.
+    """
+    merged_keys = []
+    for side, position in (
+        ("tabular", JUMPSTART_TABULAR_POSITION),
+        ("text", JUMPSTART_TEXT_POSITION),
+    ):
+        keys = _read_arrow_file(os.path.join(partition_dir, f"{side}-{partition}.arrow"))
+        dates = keys[_PARTITION_DATE]
+        if pd.api.types.is_integer_dtype(dates.dtype):
+            # Both sides hold temporal dates, sent as day ordinals.
+            dates = get_freq_ordinals(pd.Series(dates.to_numpy().astype("datetime64[D]")), freq)
+        else:
+            dates = get_freq_labels(dates, freq)
+        merged_keys.append(
+            pd.DataFrame(
+                {
+                    _PARTITION_KEY: keys[_PARTITION_KEY],
+                    JUMPSTART_NORMALIZED_DATE: dates,
+                    position: keys[position],
+                }
+            )
+        )
+    merged = pd.merge(
+        *merged_keys, on=[_PARTITION_KEY, JUMPSTART_NORMALIZED_DATE], how=how
+    )
+    path = os.path.join(partition_dir, f"joined-{partition}.arrow")
+    _write_arrow_file(
+        pd.DataFrame(
+            {
+                JUMPSTART_TABULAR_POSITION: merged[JUMPSTART_TABULAR_POSITION]
+                .fillna(-1)
+                .astype("int64"),
+                JUMPSTART_TEXT_POSITION: merged[JUMPSTART_TEXT_POSITION].fillna(-1).astype("int64"),
+                JUMPSTART_NORMALIZED_DATE: merged[JUMPSTART_NORMALIZED_DATE],
+            }
+        ),
+        path,
+    )
+    return path
+
+
+def _ranks(values: Any) -> np.ndarray:
+    """Gets non-negative integers that sort like the values, with missing values first."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return values - values.min(initial=0)
+    return pd.factorize(values, sort=True)[0] + 1
+
+
+def _merge_order(
+    how: MergeHow,
+    tabular_positions: np.ndarray,
+    text_positions: np.ndarray,
+    keys: Any,
+    labels: np.ndarray,
+) -> np.ndarray:
+    """Orders matched row positions deterministically, like a single merge orders them.
+
+    Args:
+        how (str): The type of join that matched the rows.
+        tabular_positions (numpy.ndarray): The tabular row of each match, or ``-1``.
+        text_positions (numpy.ndarray): The text row of each match, or ``-1``.
+        keys (array-like): The key of each match, from whichever side matched.
+        labels (numpy.ndarray): The normalized date of each match.
+
+    Returns:
+        numpy.ndarray: The order of the matches.
+    """
+    if how == "right":
+        first, second = text_positions, tabular_positions
+    else:
+        first, second = tabular_positions, text_positions
+    # One stable sort of a combined integer is much faster than a lexsort.
+    order = np.argsort(first * (second.max(initial=-1) + 2) + second + 1, kind="stable")
+    if how == "outer":
+        # An outer merge sorts the rows by their keys, then by their normalized dates.
+        key_ranks, label_ranks = _ranks(keys), _ranks(labels)
+        ranks = key_ranks * (label_ranks.max(initial=0) + 1) + label_ranks
+        order = order[np.argsort(ranks[order], kind="stable")]
+    return order
+
+
+def _parallel_join(
+    tabular_df: pd.DataFrame,
+    tabular_key: str,
+    tabular_date_column: str,
+    text_df: pd.DataFrame,
+    text_key: str,
+    text_date_column: str,
+    how: MergeHow,
+    freq: FreqLiteral,
+    n_jobs: int,
+) -> pd.DataFrame:
+    """Joins the dataframes like :func:`build_tabText`, with one process per key partition.
+
+    Only the key and date columns, partitioned by the hash of the key, are written
+    to Arrow files in shared memory for the workers; the workers return the matched
+    row positions the same way. The partial results are put in the row order of
+    a single merge before the columns are gathered from the inputs.
+    """
+    _require_pyarrow()
+    temporal = is_temporal_dates(tabular_df[tabular_date_column]) and is_temporal_dates(
+        text_df[text_date_column]
+    )
+    sides = [
+        (tabular_df, tabular_key, tabular_date_column, JUMPSTART_TABULAR_POSITION, "tabular"),
+        (text_df, text_key, text_date_column, JUMPSTART_TEXT_POSITION, "text"),
+    ]
+    with tempfile.TemporaryDirectory(dir=_shared_memory_dir(), prefix="smjsindustry-") as tmp:
+        for frame, key, date_column, position, side in sides:
+            keys = frame[key].to_numpy()
+            partitions = pd.util.hash_array(keys.astype(object)) % np.uint64(n_jobs)
+            dates = frame[date_column]
+            if temporal:
+                dates = get_freq_ordinals(dates, "D")
+            elif is_temporal_dates(dates):
+                dates = format_freq_ordinals(get_freq_ordinals(dates, "D"), "D")
+            else:
+                dates = dates.astype(str).to_numpy()
+            for partition in range(n_jobs):
+                rows = np.flatnonzero(partitions == partition)
+                _write_arrow_file(
+                    pd.DataFrame(
+                        {
+                            _PARTITION_KEY: keys[rows],
+                            _PARTITION_DATE: dates[rows],
+                            position: rows.astype("int64"),
+                        }
+                    ),
+                    os.path.join(tmp, f"{side}-{partition}.arrow"),
+                )
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            paths = list(
+                executor.map(
+                    _join_partition,
+                    [tmp] * n_jobs,
+                    range(n_jobs),
+                    [freq] * n_jobs,
+                    [how] * n_jobs,
+                )
+            )
+        positions = pd.concat([_read_arrow_file(path) for path in paths], ignore_index=True)
+
+    tabular_positions = positions[JUMPSTART_TABULAR_POSITION].to_numpy(dtype=np.intp)
+    text_positions = positions[JUMPSTART_TEXT_POSITION].to_numpy(dtype=np.intp)
+    tabular_keys = _take(tabular_df[tabular_key], tabular_positions, how in ("right", "outer"))
+    text_keys = _take(text_df[text_key], text_positions, how in ("left", "outer"))
+    # A key column shared by both dataframes holds the key of whichever side matched.
+    shared_keys = tabular_keys
+    if how == "outer":
+        shared_keys = tabular_keys.where(tabular_positions >= 0, text_keys)
+    elif how == "right":
+        shared_keys = text_keys
+    order = _merge_order(
+        how,
+        tabular_positions,
+        text_positions,
+        shared_keys,
+        positions[JUMPSTART_NORMALIZED_DATE].to_numpy(),
+    )
+    if tabular_key == text_key:
+        key_columns = {tabular_key: shared_keys}
+    else:
+        key_columns = {tabular_key: tabular_keys, text_key: text_keys}
+    return _gather_columns(
+        tabular_df,
+        tabular_positions[order],
+        tabular_key,
+        text_df,
+        text_positions[order],
+        text_key,
+        key_columns={name: column.iloc[order] for name, column in key_columns.items()},
+    )
+
+
+# Frequencies from the finest to the coarsest; days, months and quarters nest in the
+# coarser buckets that follow them, while weeks straddle months and years.
+_FREQ_ORDER = ("D", "W", "M", "Q", "Y")
+_LABEL_ORDINAL_PATTERN = r"^(\d+)(?:[WMQ](\d+))?$"
+
+
+def _multi_freq_dates(
+    tabular_dates: pd.Series,
+    text_dates: pd.Series,
+    freqs: List[str],
+    label_cache: Optional[FreqLabelCache] = None,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Normalizes the date columns of both dataframes for several frequencies at once.
+
+    Temporal columns are converted to days once, and the days to the ordinals of each
+    frequency. String columns are factorized once and only their distinct values are
+    labeled for each frequency; week, month, quarter and year labels are turned into
+    ``year * 100 + period`` integers, which sort like the periods.
+
+    Returns:
+        Dict[str, Tuple[numpy.ndarray, numpy.ndarray]]: The tabular and text date keys
+        of each frequency.
+    """
+    if is_temporal_dates(tabular_dates) and is_temporal_dates(text_dates):
+        days = [get_freq_ordinals(dates, "D") for dates in (tabular_dates, text_dates)]
+        return {
+            freq: (convert_day_ordinals(days[0], freq), convert_day_ordinals(days[1], freq))
+            for freq in freqs
+        }
+    factorized = [
+        pd.factorize(_date_values(dates), use_na_sentinel=False)
+        for dates in (tabular_dates, text_dates)
+    ]
+    date_keys = {}
+    for freq in freqs:
+        keys = []
+        for codes, uniques in factorized:
+            labels = get_freq_labels(pd.Series(uniques), freq, label_cache)
+            if freq != "D":
+                parts = labels.str.extract(_LABEL_ORDINAL_PATTERN).fillna("0").astype("int64")
+                labels = parts[0] * 100 + parts[1]
+            keys.append(labels.to_numpy().take(codes))
+        date_keys[freq] = (keys[0], keys[1])
+    return date_keys
+
+
+def _match_groups(
+    index_pairs: np.ndarray,
+    index_order: np.ndarray,
+    probe_pairs: np.ndarray,
+    keep_unmatched: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds the rows of an index side with the same pair code as each probe row.
+
+    The sorted index side is split into groups of equal pair codes, and the probe
+    rows are looked up in a hash table of the groups, in their own order. The matches
+    are listed by probe row, then by index row.
+
+    Args:
+        index_pairs (numpy.ndarray): The pair codes of the index side.
+        index_order (numpy.ndarray): The positions that stably sort ``index_pairs``.
+        probe_pairs (numpy.ndarray): The pair codes of the probe side.
+        keep_unmatched (bool): Whether to list probe rows without a match, with an
+            index row of ``-1``.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The matched index rows and probe rows.
+    """
+    if not len(index_pairs):
+        probe_rows = np.arange(len(probe_pairs)) if keep_unmatched else np.arange(0)
+        return np.full(len(probe_rows), -1, dtype=np.intp), probe_rows
+    sorted_pairs = index_pairs[index_order]
+    starts = np.flatnonzero(np.diff(sorted_pairs, prepend=sorted_pairs[:1] - 1))
+    sizes = np.diff(starts, append=len(sorted_pairs))
+    groups = pd.Index(sorted_pairs[starts]).get_indexer(probe_pairs)
+    found = groups >= 0
+    counts = np.where(found, sizes[groups], 0)
+    if keep_unmatched:
+        counts = np.maximum(counts, 1)
+    probe_rows = np.repeat(np.arange(len(probe_pairs)), counts)
+    offsets = np.arange(len(probe_rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    index_rows = np.where(
+        np.repeat(found, counts),
+        index_order[(np.repeat(starts[groups], counts) + offsets) % max(len(index_order), 1)],
+        -1,
+    )
+    return index_rows, probe_rows
+
+
+def _take_codes(codes: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Takes the codes at row positions, with an arbitrary code for a missing row ``-1``."""
+    if not len(codes):
+        return np.zeros(len(positions), dtype=codes.dtype)
+    return codes.take(positions, mode="clip")
+
+
+def _sort_order(pairs: np.ndarray, orders: List[np.ndarray]) -> np.ndarray:
+    """Gets the stable order of pair codes, reusing a known order if it is still stable.
+
+    The stable order of a finer date bucket also sorts every bucket it nests in, and
+    is still their stable order when the rows of each coarser bucket are in date
+    order, as in a panel sorted by key and date.
+    """
+    for order in orders:
+        steps = np.diff(pairs[order])
+        if ((steps > 0) | ((steps == 0) & (np.diff(order) > 0))).all():
+            return order
+    order = np.argsort(pairs, kind="stable")
+    orders.append(order)
+    return order
+
+
+def build_tabText_multi_freq(
+    tabular_df: pd.DataFrame,
+    tabular_key: str,
+    tabular_date_column: str,
+    text_df: pd.DataFrame,
+    text_key: str,
+    text_date_column: str,
+    freqs: List[FreqLiteral],
+    how: MergeHow = "inner",
+    output_format: Literal["dict", "long"] = "dict",
+    freq_column: str = "freq",
+    label_cache: Optional[FreqLabelCache] = None,
+) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """Builds TabText dataframes for several frequencies with one normalization pass.
+
+    It returns the joins that :func:`build_tabText` returns for each frequency, but
+    each date column is normalized in one pass for all the frequencies and the keys
+    are factorized once. The rows of the smaller dataframe are grouped by key and date
+    bucket with a stable sort, and the rows of the other one are looked up in a hash
+    table of the groups. Since days and months nest in the coarser months, quarters
+    and years, the sort order of a finer bucket is reused for every coarser one it
+    still sorts stably, which is the case for panels sorted by key and date.
+
+    The rows of each join are ordered like the rows of a parallel :func:`build_tabText`
+    join, except that outer joins order the dates of a key chronologically.
+
+    Args:
+        tabular_df (pandas.DataFrame): The tabular dataframe to be joined, requiring a date column.
+        tabular_key (str): The tabular dataframe's key column to be joined on.
+        tabular_date_column (str): The tabular dataframe's date column to be joined on.
+        text_df (pandas.DataFrame): The text dataframe to be joined, requiring a date column.
+        text_key (str): The text dataframe's key column to be joined on.
+        text_date_column (str): The text dataframe's date column to be joined on.
+        freqs (List[str]): The frequencies to join by; possible values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}``.
+        how (str): The type of join to be performed; possible values:
+            ``{'left', 'right', 'outer', 'inner'}`` (default: ``'inner'``).
+        output_format (str): Whether to return a dictionary of the joined dataframes
+            by frequency, or one long dataframe of all of them with a ``freq_column``;
+            possible values: ``{'dict', 'long'}`` (default: ``'dict'``).
+        freq_column (str): The name of the frequency column of a long dataframe
+            (default: ``'freq'``).
+        label_cache (FreqLabelCache): An optional cache of normalized dates shared
+            across calls (default: None).
+
+    Returns:
+        dict or pandas.DataFrame: The joined dataframes by frequency, or the long
+        joined dataframe.
+    """
+    if isinstance(freqs, str) or not freqs:
+        raise ValueError("build_tabText_multi_freq requires freqs to be a non-empty list.")
+    freqs = [freq.upper() for freq in freqs]
+    unsupported = [freq for freq in freqs if freq not in _FREQ_ORDER]
+    if unsupported:
+        raise ValueError(f"frequency {unsupported[0]} not supported")
+    if len(set(freqs)) != len(freqs):
+        raise ValueError("build_tabText_multi_freq requires freqs to be unique.")
+    if how not in ("left", "right", "outer", "inner"):
+        raise ValueError(f"build_tabText_multi_freq does not support how={how!r}.")
+    if output_format not in ("dict", "long"):
+        raise ValueError(
+            f"build_tabText_multi_freq does not support output_format={output_format!r}."
+        )
+
+    date_keys = _multi_freq_dates(
+        tabular_df[tabular_date_column], text_df[text_date_column], freqs, label_cache
+    )
+    # Sorted factorization, so the key codes order the keys of an outer join.
+    key_codes, _ = pd.factorize(
+        np.concatenate([tabular_df[tabular_key].to_numpy(), text_df[text_key].to_numpy()]),
+        sort=True,
+    )
+    tabular_codes, text_codes = key_codes[: len(tabular_df)], key_codes[len(tabular_df) :]
+    tabular_is_index = len(tabular_df) <= len(text_df)
+    index_orders: List[np.ndarray] = []
+    joined = {}
+    for freq in sorted(freqs, key=_FREQ_ORDER.index):
+        tabular_dates, text_dates = date_keys[freq]
+        if tabular_dates.dtype == object:
+            date_codes, _ = pd.factorize(np.concatenate([tabular_dates, text_dates]), sort=True)
+            tabular_dates, text_dates = np.split(date_codes, [len(tabular_dates)])
+        low = min(tabular_dates.min(initial=0), text_dates.min(initial=0))
+        span = max(tabular_dates.max(initial=0), text_dates.max(initial=0)) - low + 1
+        tabular_pairs = tabular_codes * span + (tabular_dates - low)
+        text_pairs = text_codes * span + (text_dates - low)
+        index_pairs, probe_pairs = (
+            (tabular_pairs, text_pairs) if tabular_is_index else (text_pairs, tabular_pairs)
         )
-        text_df[JUMPSTART_NORMALIZED_DATE] = text_df[text_date_column].astype(str).apply(
-            lambda date_value: get_freq_label(date_value, freq)
+        # Probe rows without a match are kept when the join keeps every probe row.
+        probe_side_kept = how == "outer" or how == ("right" if tabular_is_index else "left")
+        index_rows, probe_rows = _match_groups(
+            index_pairs, _sort_order(index_pairs, index_orders), probe_pairs, probe_side_kept
         )
-        
-        joined = pd.merge(
+        if tabular_is_index:
+            tabular_positions, text_positions = index_rows, probe_rows
+        else:
+            tabular_positions, text_positions = probe_rows, index_rows
+        if how == "outer" or how == ("left" if tabular_is_index else "right"):
+            index_size = len(tabular_df) if tabular_is_index else len(text_df)
+            matched = np.zeros(index_size, dtype=bool)
+            matched[index_rows[index_rows >= 0]] = True
+            unmatched = np.flatnonzero(~matched)
+            missing = np.full(len(unmatched), -1)
+            if tabular_is_index:
+                tabular_positions = np.concatenate([tabular_positions, unmatched])
+                text_positions = np.concatenate([text_positions, missing])
+            else:
+                tabular_positions = np.concatenate([tabular_positions, missing])
+                text_positions = np.concatenate([text_positions, unmatched])
+        # Probing in row order already lists the rows of an inner or left join by
+        # tabular row, or of a right join by text row; other joins are sorted.
+        if how == "outer" or (how == "right") != tabular_is_index:
+            matched_tabular = tabular_positions >= 0
+            pair_keys = np.where(
+                matched_tabular,
+                _take_codes(tabular_codes, tabular_positions),
+                _take_codes(text_codes, text_positions),
+            )
+            pair_dates = np.where(
+                matched_tabular,
+                _take_codes(tabular_dates, tabular_positions),
+                _take_codes(text_dates, text_positions),
+            )
+            order = _merge_order(how, tabular_positions, text_positions, pair_keys, pair_dates)
+            tabular_positions, text_positions = tabular_positions[order], text_positions[order]
+        key_columns = {}
+        if tabular_key == text_key and how in ("right", "outer"):
+            key_columns[tabular_key] = _take(
+                tabular_df[tabular_key], tabular_positions, True
+            ).where(
+                tabular_positions >= 0,
+                _take(text_df[text_key], text_positions, True),
+            )
+        joined[freq] = _gather_columns(
             tabular_df,
+            tabular_positions,
+            tabular_key,
             text_df,
-            left_on=[tabular_key, JUMPSTART_NORMALIZED_DATE],
-            right_on=[text_key, JUMPSTART_NORMALIZED_DATE],
-            how=how,
+            text_positions,
+            text_key,
+            key_columns=key_columns,
         )
-        tabular_df.drop(columns=[JUMPSTART_NORMALIZED_DATE], inplace=True)
-        text_df.drop(columns=[JUMPSTART_NORMALIZED_DATE], inplace=True)
-        joined.drop(columns=[JUMPSTART_NORMALIZED_DATE], inplace=True)
+    joined = {freq: joined[freq] for freq in freqs}
+    if output_format == "dict":
+        return joined
+    return pd.concat(
+        [frame.assign(**{freq_column: freq}) for freq, frame in joined.items()],
+        ignore_index=True,
+    )
+
+
+class TabTextStreamStats(NamedTuple):
+    """Statistics of a :func:`build_tabText_chunked` run.
+
+    Attributes:
+        chunks (int): The number of text chunks that were joined.
+        text_rows (int): The number of text rows that were read.
+        output_rows (int): The number of joined rows that were written.
+        elapsed_seconds (float): The wall-clock duration of the run.
+    """
+
+    chunks: int
+    text_rows: int
+    output_rows: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Gets the number of text rows joined per second."""
+        return self.text_rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def _is_parquet_path(path: str) -> bool:
+    """Checks whether the path names a Parquet file."""
+    return path.lower().endswith(_PARQUET_EXTENSIONS)
+
+
+def _require_pyarrow():
+    """Raises an error if the optional ``pyarrow`` dependency is not installed."""
+    if pa is None:
+        raise RuntimeError("pyarrow is required to read or write Parquet files. Install pyarrow.")
+
+
+def _iter_text_chunks(
+    text_source: TextSource, chunksize: int, read_csv_kwargs: Optional[Dict[str, Any]]
+) -> Iterator[pd.DataFrame]:
+    """Iterates over the text dataframe in chunks.
+
+    Args:
+        text_source: A CSV or Parquet file path, or an iterable of dataframes.
+        chunksize (int): The number of rows per chunk read from a file.
+        read_csv_kwargs (Dict[str, Any]): Extra arguments of ``pandas.read_csv``.
+
+    Yields:
+        pandas.DataFrame: The text chunks.
+    """
+    if isinstance(text_source, pd.DataFrame):
+        raise TypeError(
+            "build_tabText_chunked requires text_source to be a file path or an iterable "
+            "of dataframes; use build_tabText to join an in-memory dataframe."
+        )
+    if isinstance(text_source, (str, os.PathLike)):
+        path = os.fspath(text_source)
+        if _is_parquet_path(path):
+            _require_pyarrow()
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            with pd.read_csv(path, chunksize=chunksize, **(read_csv_kwargs or {})) as reader:
+                yield from reader
+        return
+    yield from text_source
+
+
+class _ChunkWriter:
+    """Writes joined chunks to a CSV file, a Parquet file or a callable."""
+
+    def __init__(self, output: TabTextSink):
+        self._output = output
+        self._parquet_writer = None
+        self._csv_header = True
+
+    def write(self, chunk: pd.DataFrame):
+        """Writes one joined chunk."""
+        if callable(self._output):
+            self._output(chunk)
+            return
+        path = os.fspath(self._output)
+        if _is_parquet_path(path):
+            _require_pyarrow()
+            if self._parquet_writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                self._parquet_writer = pq.ParquetWriter(path, table.schema)
+            else:
+                # Later chunks may miss values in every row (e.g. unmatched left rows),
+                # so they are converted with the schema of the first chunk.
+                table = pa.Table.from_pandas(
+                    chunk,
+                    schema=self._parquet_writer.schema,
+                    preserve_index=False,
+                )
+            self._parquet_writer.write_table(table)
+        else:
+            chunk.to_csv(
+                path, mode="w" if self._csv_header else "a", header=self._csv_header, index=False
+            )
+            self._csv_header = False
+
+    def close(self):
+        """Closes the Parquet writer, if any."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+
+def build_tabText_chunked(
+    tabular_df: pd.DataFrame,
+    tabular_key: str,
+    tabular_date_column: str,
+    text_source: TextSource,
+    text_key: str,
+    text_date_column: str,
+    output: TabTextSink,
+    how: StreamingMergeHow = "inner",
+    freq: FreqLiteral = "Q",
+    chunksize: int = 10000,
+    label_cache: Optional[FreqLabelCache] = None,
+    read_csv_kwargs: Optional[Dict[str, Any]] = None,
+) -> TabTextStreamStats:
+    """Builds a TabText dataset from a text dataset that does not fit in memory.
+
+    The tabular dataframe is indexed once on its key and normalized date. The text
+    dataset is then read chunk by chunk, for example from the CSV file written by
+    the :class:`~smjsindustry.DataLoader`, each chunk is probed against the index,
+    and the joined rows are written to ``output`` before the next chunk is read.
+    Memory is bounded by the tabular dataframe and one chunk.
+
+    The joined rows have the same columns as the :func:`build_tabText` result. They
+    are written in the order of the text chunks; within a chunk, in the order of
+    the tabular rows. With ``how='left'``, the tabular rows that matched no text
+    row are written after the last chunk.
+
+    Args:
+        tabular_df (pandas.DataFrame): The tabular dataframe to be joined, requiring a date column.
+        tabular_key (str): The tabular dataframe's key column to be joined on.
+        tabular_date_column (str): The tabular dataframe's date column to be joined on,
+            in a format of ``"yyyy-mm-dd"``, ``"yyyy-mm"``, or ``"yyyy"``.
+        text_source (str or Iterable[pandas.DataFrame]): A CSV or Parquet file path,
+            or an iterable of text dataframe chunks.
+        text_key (str): The text dataset's key column to be joined on.
+        text_date_column (str): The text dataset's date column to be joined on,
+            in a format of ``"yyyy-mm-dd"``, ``"yyyy-mm"``, or ``"yyyy"``.
+        output (str or Callable): A CSV or Parquet file path the joined rows are written
+            to, or a callable that is called with each joined chunk.
+        how (str): The type of join to be performed; possible values:
+            ``{'left', 'inner'}`` (default: ``'inner'``).
+        freq (str): Specify how the date field should be joined,
+            by year, quarter, month, week or day. Possible values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}`` (default: ``'Q'``).
+        chunksize (int): The number of text rows read per chunk from a file (default: 10000).
+        label_cache (FreqLabelCache): An optional cache of normalized dates (default: None).
+        read_csv_kwargs (Dict[str, Any]): Extra arguments passed to ``pandas.read_csv``
+            when ``text_source`` is a CSV file, such as ``dtype`` (default: None).
+
+    Returns:
+        TabTextStreamStats: The numbers of chunks and rows, and the throughput.
+    """
+    if how not in ("left", "inner"):
+        raise ValueError(f"build_tabText_chunked does not support how={how!r}.")
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise ValueError("build_tabText_chunked requires chunksize to be a positive integer.")
+
+    start = time.perf_counter()
+    # Index the distinct (key, normalized date) pairs of the tabular dataframe once;
+    # the rows of each pair are stored contiguously in ``tabular_order``.
+    tabular_labels = get_freq_labels(
+        _date_values(tabular_df[tabular_date_column]), freq, label_cache
+    )
+    tabular_codes, tabular_pairs = pd.MultiIndex.from_arrays(
+        [tabular_df[tabular_key].to_numpy(), tabular_labels.to_numpy()]
+    ).factorize()
+    indexed = tabular_codes >= 0
+    tabular_order = np.flatnonzero(indexed)[np.argsort(tabular_codes[indexed], kind="stable")]
+    tabular_offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(tabular_codes[indexed], minlength=len(tabular_pairs)))]
+    )
+    matched = np.zeros(len(tabular_df), dtype=bool)
+
+    writer = _ChunkWriter(output)
+    chunks = text_rows = output_rows = 0
+    try:
+        for chunk in _iter_text_chunks(text_source, chunksize, read_csv_kwargs):
+            chunk = chunk.reset_index(drop=True)
+            chunk_labels = get_freq_labels(_date_values(chunk[text_date_column]), freq, label_cache)
+            pair_codes = tabular_pairs.get_indexer(
+                pd.MultiIndex.from_arrays([chunk[text_key].to_numpy(), chunk_labels.to_numpy()])
+            )
+            hit = pair_codes >= 0
+            counts = np.zeros(len(chunk), dtype=np.intp)
+            counts[hit] = tabular_offsets[pair_codes[hit] + 1] - tabular_offsets[pair_codes[hit]]
+            text_positions = np.repeat(np.arange(len(chunk)), counts)
+            # Position of every output row inside the run of rows of its tabular pair.
+            run_offsets = np.arange(len(text_positions)) - np.repeat(
+                np.cumsum(counts) - counts, counts
+            )
+            tabular_positions = tabular_order[
+                np.repeat(tabular_offsets[np.maximum(pair_codes, 0)], counts) + run_offsets
+            ]
+            order = np.lexsort((text_positions, tabular_positions))
+            tabular_positions, text_positions = tabular_positions[order], text_positions[order]
+            matched[tabular_positions] = True
+
+            joined = _gather_columns(
+                tabular_df, tabular_positions, tabular_key, chunk, text_positions, text_key
+            )
+            writer.write(joined)
+            chunks += 1
+            text_rows += len(chunk)
+            output_rows += len(joined)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                "Joined text chunk %d: %d text rows, %d joined rows, %.0f text rows/sec.",
+                chunks,
+                text_rows,
+                output_rows,
+                text_rows / elapsed if elapsed else 0.0,
+            )
+            template = chunk.iloc[:0]
+
+        if how == "left" and not matched.all():
+            if chunks == 0:
+                raise ValueError(
+                    "build_tabText_chunked requires at least one text chunk for how='left'."
+                )
+            unmatched = np.flatnonzero(~matched)
+            joined = _gather_columns(
+                tabular_df,
+                unmatched,
+                tabular_key,
+                template,
+                np.full(len(unmatched), -1, dtype=np.intp),
+                text_key,
+            )
+            writer.write(joined)
+            output_rows += len(joined)
+    finally:
+        writer.close()
+
+    stats = TabTextStreamStats(chunks, text_rows, output_rows, time.perf_counter() - start)
+    logger.info(
+        "Joined %d text rows in %d chunks into %d rows at %.0f text rows/sec.",
+        stats.text_rows,
+        stats.chunks,
+        stats.output_rows,
+        stats.rows_per_second,
+    )
+    return stats
+
+
+# The date formats Arrow parses, as the suffix completing them to a day, by frequency.
+_ARROW_DATE_FORMATS = {
+    "W": [(r"^\d{4}-\d{2}-\d{2}$", "")],
+    "M": [(r"^\d{4}-\d{2}-\d{2}$", ""), (r"^\d{4}-\d{2}$", "-01")],
+    "Q": [(r"^\d{4}-\d{2}-\d{2}$", ""), (r"^\d{4}-\d{2}$", "-01")],
+    "Y": [(r"^\d{4}-\d{2}-\d{2}$", ""), (r"^\d{4}-\d{2}$", "-01"), (r"^\d{4}$", "-01-01")],
+}
+_ARROW_JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+
+def _read_arrow_source(source: ArrowSource) -> "pa.Table":
+    """Reads a dataframe, an Arrow table or a Parquet dataset path as an Arrow table."""
+    if isinstance(source, pa.Table):
+        return source
+    if isinstance(source, pd.DataFrame):
+        return pa.Table.from_pandas(source, preserve_index=False)
+    if isinstance(source, (str, os.PathLike)):
+        return ds.dataset(os.fspath(source), format="parquet").to_table()
+    raise TypeError(
+        "build_tabText_arrow requires a pandas.DataFrame, a pyarrow.Table or a Parquet path."
+    )
+
+
+def _arrow_timestamp_labels(timestamps: "pa.Array", freq: str) -> "pa.Array":
+    """Labels timestamps with their period, like :func:`get_freq_labels` labels dates."""
+    if freq == "D":
+        return pc.strftime(timestamps, format="%Y-%m-%d")
+    year = pc.cast(pc.year(timestamps), pa.string())
+    if freq == "Y":
+        return year
+    period = {"W": pc.iso_week, "M": pc.month, "Q": pc.quarter}[freq](timestamps)
+    return pc.binary_join_element_wise(year, freq, pc.cast(period, pa.string()), "")
+
+
+def _arrow_string_labels(values: "pa.Array", freq: str) -> "pa.Array":
+    """Labels distinct date strings with their period.
+
+    Zero-padded dates are parsed and labeled with Arrow kernels. Any other value,
+    such as an unpadded date, an existing label or an invalid date, is labeled by
+    :func:`~smjsindustry.finance.utils.get_freq_labels`, which raises the same
+    errors as a pandas join.
+    """
+    values = pc.cast(values, pa.string())
+    if freq == "D":
+        labels = values
+        parsed = pc.match_substring_regex(values, r"^\d{4}-\d{1,2}-\d{1,2}$")
     else:
-        joined = pd.merge(tabular_df, text_df, left_on=tabular_key, right_on=text_key, how=how)
-    return joined
+        days = pa.nulls(len(values), pa.string())
+        for pattern, suffix in reversed(_ARROW_DATE_FORMATS[freq]):
+            days = pc.if_else(
+                pc.match_substring_regex(values, pattern),
+                pc.binary_join_element_wise(values, suffix, ""),
+                days,
+            )
+        timestamps = pc.strptime(days, format="%Y-%m-%d", unit="s", error_is_null=True)
+        # Arrow rolls invalid days over to the next month, so only round trips are kept.
+        parsed = pc.equal(pc.strftime(timestamps, format="%Y-%m-%d"), days)
+        labels = _arrow_timestamp_labels(timestamps, freq)
+    fallback = pc.invert(pc.fill_null(parsed, False))
+    if pc.any(fallback).as_py():
+        others = values.filter(fallback).to_pandas()
+        labels = pc.replace_with_mask(
+            labels, fallback, pa.array(get_freq_labels(others, freq), pa.string())
+        )
+    return labels
+
+
+def _arrow_freq_labels(column: "pa.ChunkedArray", freq: str) -> "pa.Array":
+    """Labels a string, date or timestamp column with the period of each date."""
+    if freq not in ("W", "M", "Q", "Y", "D"):
+        raise ValueError(f"frequency {freq} not supported")
+    if column.null_count:
+        raise ValueError("The date column needs to be string")
+    column = column.combine_chunks()
+    if pa.types.is_date(column.type) or pa.types.is_timestamp(column.type):
+        return _arrow_timestamp_labels(pc.cast(column, pa.timestamp("s")), freq)
+    # Each distinct date is labeled once.
+    encoded = pc.dictionary_encode(column)
+    return _arrow_string_labels(encoded.dictionary, freq).take(encoded.indices)
+
+
+def _arrow_codes(
+    tabular_column: "pa.ChunkedArray", text_column: "pa.ChunkedArray"
+) -> Tuple["pa.Array", np.ndarray]:
+    """Encodes the values of a tabular column and a text column with shared integer codes.
+
+    Returns:
+        Tuple[pyarrow.Array, numpy.ndarray]: The distinct values, and the code of each
+        tabular row followed by the code of each text row. Nulls get a code too, so
+        they match each other like they do in a pandas merge.
+    """
+    tabular_column = pa.chunked_array(tabular_column)
+    values = pa.chunked_array(
+        tabular_column.chunks + pa.chunked_array(text_column).cast(tabular_column.type).chunks,
+        tabular_column.type,
+    )
+    encoded = pc.dictionary_encode(values, null_encoding="encode").combine_chunks()
+    return encoded.dictionary, encoded.indices.to_numpy().astype(np.int64)
+
+
+def _arrow_ranks(values: "pa.Array") -> np.ndarray:
+    """Ranks distinct values in sort order, with nulls last."""
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[pc.sort_indices(values).to_numpy()] = np.arange(len(values))
+    return ranks
+
+
+def _take_arrow(column: "pa.ChunkedArray", positions: np.ndarray) -> "pa.ChunkedArray":
+    """Gathers the values of an Arrow column at row positions, where ``-1`` stands for null."""
+    return column.take(pa.array(positions, mask=positions < 0))
+
+
+def build_tabText_arrow(
+    tabular: ArrowSource,
+    tabular_key: str,
+    tabular_date_column: str,
+    text: ArrowSource,
+    text_key: str,
+    text_date_column: str,
+    how: MergeHow = "inner",
+    freq: FreqLiteral = "Q",
+    output_format: ArrowOutputFormat = "arrow",
+) -> Union["pa.Table", pd.DataFrame]:
+    """Builds a TabText table with Arrow, without converting the text columns to Python strings.
+
+    It joins like :func:`build_tabText`, with the same columns, suffixes and rows,
+    but both inputs are read as Arrow tables, for example straight from Parquet. The
+    dates are normalized with Arrow compute kernels, each distinct date once, and
+    the keys are hash-joined in Arrow. Date columns may also be Arrow dates or
+    timestamps. The rows are ordered like the rows of a parallel
+    :func:`build_tabText` join.
+
+    Args:
+        tabular (pandas.DataFrame or pyarrow.Table or str): The tabular data to be
+            joined, or the path of a Parquet file or dataset directory.
+        tabular_key (str): The tabular key column to be joined on.
+        tabular_date_column (str): The tabular date column to be joined on.
+        text (pandas.DataFrame or pyarrow.Table or str): The text data to be joined,
+            or the path of a Parquet file or dataset directory.
+        text_key (str): The text key column to be joined on.
+        text_date_column (str): The text date column to be joined on.
+        how (str): The type of join to be performed; possible values:
+            ``{'left', 'right', 'outer', 'inner'}`` (default: ``'inner'``).
+        freq (str): Specify how the date field should be joined,
+            by year, quarter, month, week or day. Possible values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}`` (default: ``'Q'``).
+        output_format (str): Whether to return a ``pyarrow.Table`` or a
+            ``pandas.DataFrame`` whose string columns are backed by Arrow
+            (``string[pyarrow]``); possible values: ``{'arrow', 'pandas'}``
+            (default: ``'arrow'``).
+
+    Returns:
+        pyarrow.Table or pandas.DataFrame: The joined table.
+    """
+    _require_pyarrow()
+    if how not in _ARROW_JOIN_TYPES:
+        raise ValueError(f"build_tabText_arrow does not support how={how!r}.")
+    if output_format not in ("arrow", "pandas"):
+        raise ValueError(f"build_tabText_arrow does not support output_format={output_format!r}.")
+    tabular_table = _read_arrow_source(tabular)
+    text_table = _read_arrow_source(text)
+    keys, key_codes = _arrow_codes(tabular_table[tabular_key], text_table[text_key])
+    labels, label_codes = _arrow_codes(
+        _arrow_freq_labels(tabular_table[tabular_date_column], freq),
+        _arrow_freq_labels(text_table[text_date_column], freq),
+    )
+    # Each (key, label) pair is joined as one integer, which Arrow hashes much faster
+    # than a pair of strings.
+    pair_codes = key_codes * len(labels) + label_codes
+    joined = pa.table(
+        {
+            JUMPSTART_NORMALIZED_DATE: pair_codes[: tabular_table.num_rows],
+            JUMPSTART_TABULAR_POSITION: np.arange(tabular_table.num_rows),
+        }
+    ).join(
+        pa.table(
+            {
+                JUMPSTART_NORMALIZED_DATE: pair_codes[tabular_table.num_rows :],
+                JUMPSTART_TEXT_POSITION: np.arange(text_table.num_rows),
+            }
+        ),
+        keys=JUMPSTART_NORMALIZED_DATE,
+        join_type=_ARROW_JOIN_TYPES[how],
+        coalesce_keys=True,
+    )
+    tabular_positions = pc.fill_null(joined[JUMPSTART_TABULAR_POSITION], -1).to_numpy()
+    text_positions = pc.fill_null(joined[JUMPSTART_TEXT_POSITION], -1).to_numpy()
+    joined_key_codes, joined_label_codes = np.divmod(
+        joined[JUMPSTART_NORMALIZED_DATE].to_numpy(), len(labels)
+    )
+    order = _merge_order(
+        how,
+        tabular_positions,
+        text_positions,
+        _arrow_ranks(keys)[joined_key_codes],
+        _arrow_ranks(labels)[joined_label_codes],
+    )
+    tabular_positions, text_positions = tabular_positions[order], text_positions[order]
+    columns = {}
+    for side, column, name in _joined_columns(
+        tabular_table.column_names, tabular_key, text_table.column_names, text_key
+    ):
+        if tabular_key == text_key == column:
+            columns[name] = keys.take(joined_key_codes[order])
+        elif side == "tabular":
+            columns[name] = _take_arrow(tabular_table[column], tabular_positions)
+        else:
+            columns[name] = _take_arrow(text_table[column], text_positions)
+    result = pa.table(columns)
+    if output_format == "pandas":
+        string_dtype = pd.StringDtype("pyarrow")
+        return result.to_pandas(
+            types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get
+        )
+    return result
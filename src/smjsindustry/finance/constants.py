@@ -40,6 +40,7 @@ SUPPORTED_SEC_FORMS = [
 ]
 KMEDOIDS_SUMMARIZER_METRIC_VALUES = ["euclidean", "cosine", "dot-product"]
 KMEDOIDS_SUMMARIZER_INIT_VALUES = ["random", "heuristic", "k-medoids++", "build"]
+KMEDOIDS_SUMMARIZER_METHOD_VALUES = ["pam", "alternate", "clara"]
 IMAGE_CONFIG_FILE = "image_uri.json"
 REPOSITORY = "jumpstart-gecko"
 ECR_URI_TEMPLATE = "{account_id}.dkr.ecr.{region}.amazonaws.com/{repository}"
@@ -58,6 +59,7 @@ __all__ = [
     "SUPPORTED_SEC_FORMS",
     "KMEDOIDS_SUMMARIZER_METRIC_VALUES",
     "KMEDOIDS_SUMMARIZER_INIT_VALUES",
+    "KMEDOIDS_SUMMARIZER_METHOD_VALUES",
     "IMAGE_CONFIG_FILE",
     "REPOSITORY",
     "ECR_URI_TEMPLATE",
@@ -0,0 +1,354 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The module that embeds sentences for the local K-medoids summarizer.
+
+An embedder turns the sentences of one document into vectors. The embeddings can
+be stored in an :class:`EmbeddingCache`, so that the unchanged sentences of a
+revised filing are not embedded again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Mapping, Tuple, Union
+
+import numpy as np
+
+from smjsindustry.finance.processor_config import KMedoidsSummarizerConfig
+
+try:
+    from gensim.models.doc2vec import Doc2Vec, TaggedDocument  # type: ignore[import]
+except ImportError:  # pragma: no cover - gensim is an optional dependency
+    Doc2Vec = None
+    TaggedDocument = None
+
+logger = logging.getLogger(__name__)
+
+_HASHING_NONZEROS = 4
+_SQLITE_BATCH_SIZE = 500
+
+
+class SentenceEmbedder(ABC):
+    """The base class of the sentence embedders of the local K-medoids summarizer."""
+
+    contextual = False
+    """Whether the vector of a sentence depends on the other sentences of its document."""
+
+    @property
+    @abstractmethod
+    def parameters(self) -> Dict[str, Any]:
+        """Gets the parameters that determine the vectors, as a JSON-serializable dict."""
+
+    @abstractmethod
+    def embed(self, sentences: List[str], sentence_tokens: List[List[str]]) -> np.ndarray:
+        """Embeds the sentences of one document.
+
+        Args:
+            sentences (List[str]): The sentences of the document.
+            sentence_tokens (List[List[str]]): The lower-case tokens of each sentence.
+
+        Returns:
+            numpy.ndarray: A two-dimensional array with one vector per sentence.
+        """
+
+
+class Doc2VecEmbedder(SentenceEmbedder):
+    """Embeds sentences with a Doc2Vec model trained on their document.
+
+    This is the embedding of the K-medoids summarizer processing job. Requires
+    ``gensim``.
+
+    Args:
+        vector_size (int): The embedding dimensions (default: 100).
+        min_count (int): The minimal word occurrences to be included (default: 0).
+        epochs (int): The number of epochs in a training (default: 60).
+        seed (int): The seed of the training (default: 0).
+
+    """
+
+    contextual = True
+
+    def __init__(
+        self, vector_size: int = 100, min_count: int = 0, epochs: int = 60, seed: int = 0
+    ):
+        """Initializes a ``Doc2VecEmbedder`` instance."""
+        if Doc2Vec is None:
+            raise RuntimeError(
+                "gensim is required to embed sentences with Doc2Vec. "
+                "Install it with: pip install 'smjsindustry[nlp]'"
+            )
+        self._vector_size = vector_size
+        self._min_count = min_count
+        self._epochs = epochs
+        self._seed = seed
+
+    @classmethod
+    def from_config(cls, summarizer_config: KMedoidsSummarizerConfig) -> "Doc2VecEmbedder":
+        """Creates the embedder with the Doc2Vec parameters of a summarizer config."""
+        return cls(
+            vector_size=summarizer_config.vector_size,
+            min_count=summarizer_config.min_count,
+            epochs=summarizer_config.epochs,
+        )
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Gets the parameters that determine the vectors."""
+        return {
+            "embedder": "doc2vec",
+            "vector_size": self._vector_size,
+            "min_count": self._min_count,
+            "epochs": self._epochs,
+            "seed": self._seed,
+        }
+
+    def embed(self, sentences: List[str], sentence_tokens: List[List[str]]) -> np.ndarray:
+        """Trains a Doc2Vec model on the sentences and returns their vectors."""
+        model = Doc2Vec(
+            [TaggedDocument(tokens, [position]) for position, tokens in enumerate(sentence_tokens)],
+            vector_size=self._vector_size,
+            min_count=self._min_count,
+            epochs=self._epochs,
+            seed=self._seed,
+            workers=1,
+        )
+        return np.asarray(model.dv.vectors, dtype=np.float64)
+
+
+class HashingEmbedder(SentenceEmbedder):
+    """Embeds sentences with hashed term frequencies and a sparse random projection.
+
+    Each distinct token is hashed to ``4`` signed coordinates of the vector, and a
+    sentence adds ``1 + log(count)`` of each of its tokens to them; the vectors are
+    then scaled to unit length. This is a sparse random projection of the hashed
+    term-frequency vectors, so it needs no training, and the vector of a sentence
+    only depends on its own tokens.
+
+    Args:
+        vector_size (int): The embedding dimensions (default: 256).
+        seed (int): The seed of the hash functions (default: 0).
+
+    """
+
+    def __init__(self, vector_size: int = 256, seed: int = 0):
+        """Initializes a ``HashingEmbedder`` instance.
+
+        Raises:
+            ValueError: if ``vector_size`` (int) is not a positive integer
+        """
+        if not isinstance(vector_size, int) or vector_size <= 0:
+            raise ValueError("HashingEmbedder requires vector_size to be a positive integer.")
+        self._vector_size = vector_size
+        self._seed = seed
+        self._hash_key = str(seed).encode("utf-8")
+        self._coordinates: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Gets the parameters that determine the vectors."""
+        return {"embedder": "hashing", "vector_size": self._vector_size, "seed": self._seed}
+
+    def _token_coordinates(self, token: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the coordinates and the signs a token is projected to."""
+        coordinates = self._coordinates.get(token)
+        if coordinates is None:
+            digest = hashlib.blake2b(
+                token.encode("utf-8"), digest_size=8 * _HASHING_NONZEROS, key=self._hash_key
+            ).digest()
+            hashes = np.frombuffer(digest, dtype=np.uint32).reshape(2, _HASHING_NONZEROS)
+            coordinates = self._coordinates[token] = (
+                (hashes[0] % self._vector_size).astype(np.int64),
+                np.where(hashes[1] & 1, 1.0, -1.0),
+            )
+        return coordinates
+
+    def embed(self, sentences: List[str], sentence_tokens: List[List[str]]) -> np.ndarray:
+        """Projects the hashed term frequencies of the sentences."""
+        counters = [Counter(tokens) for tokens in sentence_tokens]
+        positions = np.repeat(np.arange(len(counters)), [len(counter) for counter in counters])
+        vectors = np.zeros(len(counters) * self._vector_size)
+        if len(positions):
+            projected = [
+                self._token_coordinates(token) for counter in counters for token in counter
+            ]
+            counts = np.fromiter(
+                (count for counter in counters for count in counter.values()),
+                dtype=np.float64,
+                count=len(positions),
+            )
+            coordinates = np.asarray([coordinate for coordinate, _ in projected])
+            signs = np.asarray([sign for _, sign in projected])
+            cells = positions[:, None] * self._vector_size + coordinates
+            weights = (1.0 + np.log(counts))[:, None] * signs
+            vectors = np.bincount(cells.ravel(), weights.ravel(), minlength=len(vectors))
+        vectors = vectors.reshape(len(counters), self._vector_size)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=vectors, where=norms > 0)
+
+
+class PrecomputedEmbedder(SentenceEmbedder):
+    """Looks up precomputed sentence vectors.
+
+    Args:
+        vectors (Mapping[str, numpy.ndarray]): The vector of each sentence, keyed by
+            the sentence text.
+        name (str): A name for the vectors, which keeps the cache entries of
+            different vector sets apart (default: ``"precomputed"``).
+
+    """
+
+    def __init__(self, vectors: Mapping[str, np.ndarray], name: str = "precomputed"):
+        """Initializes a ``PrecomputedEmbedder`` instance."""
+        self._vectors = vectors
+        self._name = name
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Gets the parameters that determine the vectors."""
+        return {"embedder": "precomputed", "name": self._name}
+
+    def embed(self, sentences: List[str], sentence_tokens: List[List[str]]) -> np.ndarray:
+        """Returns the precomputed vectors of the sentences."""
+        missing = [sentence for sentence in sentences if sentence not in self._vectors]
+        if missing:
+            raise ValueError(f"No precomputed vector for the sentence: {missing[0]!r}")
+        return np.asarray([self._vectors[sentence] for sentence in sentences], dtype=np.float64)
+
+
+class EmbeddingCache:
+    """A content-addressed on-disk cache of sentence embeddings.
+
+    Each vector is stored in an SQLite database under the SHA-256 hash of the
+    embedder parameters and the sentence. The vectors of contextual embedders such
+    as :class:`Doc2VecEmbedder` depend on the whole document, so their key also
+    includes the hash of the document. The cache can be shared by several processes.
+
+    Args:
+        path (str): The path of the cache database; it is created if needed.
+
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        """Initializes an ``EmbeddingCache`` instance."""
+        self._path = os.fspath(path)
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickles the path only, so each process opens its own connection."""
+        return {"_path": self._path}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restores a cache from its path."""
+        self.__init__(state["_path"])
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, creating the table if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=60)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB)"
+            )
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _keys(embedder: SentenceEmbedder, sentences: List[str]) -> List[bytes]:
+        """Computes the content-addressed keys of the sentences of one document."""
+        prefix = json.dumps(embedder.parameters, sort_keys=True)
+        if embedder.contextual:
+            document = hashlib.sha256("\0".join(sentences).encode("utf-8")).hexdigest()
+            prefix = f"{prefix}\0{document}"
+        return [
+            hashlib.sha256(f"{prefix}\0{sentence}".encode("utf-8")).digest()
+            for sentence in sentences
+        ]
+
+    def embed(
+        self, embedder: SentenceEmbedder, sentences: List[str], sentence_tokens: List[List[str]]
+    ) -> np.ndarray:
+        """Embeds the sentences of one document, reusing the cached vectors.
+
+        Only the sentences without a cached vector are passed to the embedder,
+        unless it is contextual, in which case the whole document is embedded on
+        any miss.
+
+        Args:
+            embedder (SentenceEmbedder): The embedder of the missing sentences.
+            sentences (List[str]): The sentences of the document.
+            sentence_tokens (List[List[str]]): The lower-case tokens of each sentence.
+
+        Returns:
+            numpy.ndarray: A two-dimensional array with one vector per sentence.
+        """
+        keys = self._keys(embedder, sentences)
+        connection = self._connection()
+        found: Dict[bytes, np.ndarray] = {}
+        distinct = list(dict.fromkeys(keys))
+        for start in range(0, len(distinct), _SQLITE_BATCH_SIZE):
+            batch = distinct[start : start + _SQLITE_BATCH_SIZE]
+            rows = connection.execute(
+                "SELECT key, vector FROM embeddings WHERE key IN "
+                f"({','.join('?' * len(batch))})",
+                batch,
+            )
+            found.update((key, np.frombuffer(vector, dtype=np.float64)) for key, vector in rows)
+        missing = [position for position, key in enumerate(keys) if key not in found]
+        self._hits += len(keys) - len(missing)
+        self._misses += len(missing)
+        if missing:
+            if embedder.contextual:
+                missing = list(range(len(sentences)))
+            vectors = embedder.embed(
+                [sentences[position] for position in missing],
+                [sentence_tokens[position] for position in missing],
+            )
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                    [
+                        (keys[position], np.ascontiguousarray(vector, dtype=np.float64).tobytes())
+                        for position, vector in zip(missing, vectors)
+                    ],
+                )
+            found.update((keys[position], vector) for position, vector in zip(missing, vectors))
+        if not keys:
+            return np.zeros((0, 0))
+        return np.asarray([found[key] for key in keys], dtype=np.float64)
+
+    def __len__(self) -> int:
+        """Gets the number of cached vectors."""
+        return self._connection().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def path(self) -> str:
+        """Gets the value of the ``path`` parameter."""
+        return self._path
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of sentence vectors that were found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of sentence vectors that were not found in the cache."""
+        return self._misses
+
@@ -0,0 +1,417 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The module that clusters sentence vectors with k-medoids.
+
+The distances between all the vectors are computed once with matrix products, and
+the medoids are refined with vectorized PAM swaps or alternating updates. For
+documents with thousands of sentences, :func:`clara` runs PAM on samples instead.
+"""
+
+import logging
+import time
+from typing import Literal, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from smjsindustry.finance.constants import (
+    KMEDOIDS_SUMMARIZER_INIT_VALUES,
+    KMEDOIDS_SUMMARIZER_METRIC_VALUES,
+)
+
+logger = logging.getLogger(__name__)
+
+KMedoidsMethod = Literal["pam", "alternate"]
+
+_KMEDOIDS_METHODS = ("pam", "alternate")
+_ASSIGN_BLOCK_SIZE = 4096
+
+
+class KMedoidsResult(NamedTuple):
+    """The result of a :func:`kmedoids` run.
+
+    Attributes:
+        medoids (numpy.ndarray): The positions of the medoid vectors, in the order
+            in which they were chosen.
+        labels (numpy.ndarray): The position in ``medoids`` of the nearest medoid
+            of each vector.
+        objective (float): The sum of the distances of the vectors to their
+            nearest medoid.
+        iterations (int): The number of swap or update iterations that ran.
+    """
+
+    medoids: np.ndarray
+    labels: np.ndarray
+    objective: float
+    iterations: int
+
+
+def _prepare(vectors: np.ndarray, metric: str) -> Tuple[np.ndarray, float]:
+    """Validates the vectors and prepares them for :func:`_cross_distances`.
+
+    Cosine vectors are scaled to unit length. The dot-product distances are shifted
+    by the largest inner product of two vectors, which is the largest squared norm.
+    """
+    if metric not in KMEDOIDS_SUMMARIZER_METRIC_VALUES:
+        raise ValueError(f"metric must be one of {KMEDOIDS_SUMMARIZER_METRIC_VALUES}.")
+    vectors = np.asarray(vectors, dtype=np.float64)
+    if vectors.ndim != 2:
+        raise ValueError("vectors must be a two-dimensional array.")
+    if metric == "cosine":
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    shift = 0.0
+    if metric == "dot-product":
+        shift = float(np.einsum("ij,ij->i", vectors, vectors).max(initial=0.0))
+    return vectors, shift
+
+
+def _cross_distances(
+    left: np.ndarray, right: np.ndarray, metric: str, shift: float
+) -> np.ndarray:
+    """Computes the distances between two sets of vectors prepared by :func:`_prepare`."""
+    products = left @ right.T
+    if metric == "cosine":
+        distances = 1.0 - products
+    elif metric == "dot-product":
+        distances = shift - products
+    else:
+        distances = np.einsum("ij,ij->i", left, left)[:, None] - 2.0 * products
+        distances += np.einsum("ij,ij->i", right, right)[None, :]
+        np.sqrt(np.maximum(distances, 0.0, out=distances), out=distances)
+    return np.maximum(distances, 0.0, out=distances)
+
+
+def pairwise_distances(vectors: np.ndarray, metric: str = "euclidean") -> np.ndarray:
+    """Computes the distances between all pairs of vectors.
+
+    Args:
+        vectors (numpy.ndarray): A two-dimensional array with one vector per row.
+        metric (str): The distance metric. Possible values are ``'euclidean'``,
+            ``'cosine'`` (one minus the cosine similarity) and ``'dot-product'``
+            (the largest inner product minus the inner product, so that the most
+            aligned pairs are the closest) (default: ``'euclidean'``).
+
+    Returns:
+        numpy.ndarray: The square matrix of distances.
+    """
+    vectors, shift = _prepare(vectors, metric)
+    distances = _cross_distances(vectors, vectors, metric, shift)
+    if metric != "dot-product":
+        np.fill_diagonal(distances, 0.0)
+    return distances
+
+
+def _initial_medoids(
+    distances: np.ndarray, n_clusters: int, init: str, rng: np.random.Generator
+) -> np.ndarray:
+    """Chooses the initial medoids with one of the ``init`` strategies."""
+    count = len(distances)
+    if init == "random":
+        return rng.choice(count, size=n_clusters, replace=False)
+    if init == "heuristic":
+        return np.argsort(distances.sum(axis=1), kind="stable")[:n_clusters]
+    if init == "k-medoids++":
+        medoids = [int(rng.integers(count))]
+        nearest = distances[medoids[0]].copy()
+        for _ in range(1, n_clusters):
+            weights = nearest**2
+            # With the dot-product metric a point is not at distance 0 from itself.
+            weights[medoids] = 0.0
+            total = weights.sum()
+            if total > 0:
+                candidate = int(rng.choice(count, p=weights / total))
+            else:
+                candidate = int(rng.choice(np.setdiff1d(np.arange(count), medoids)))
+            medoids.append(candidate)
+            np.minimum(nearest, distances[candidate], out=nearest)
+        return np.asarray(medoids)
+    medoids = [int(np.argmin(distances.sum(axis=1)))]
+    nearest = distances[medoids[0]].copy()
+    for _ in range(1, n_clusters):
+        gains = np.maximum(nearest[None, :] - distances, 0.0).sum(axis=1)
+        gains[medoids] = -1.0
+        candidate = int(np.argmax(gains))
+        medoids.append(candidate)
+        np.minimum(nearest, distances[candidate], out=nearest)
+    return np.asarray(medoids)
+
+
+def _nearest_two(
+    distances: np.ndarray, medoids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the nearest medoid of each vector and its distances to the nearest two."""
+    to_medoids = distances[medoids]
+    columns = np.arange(distances.shape[1])
+    if len(medoids) == 1:
+        labels = np.zeros(len(columns), dtype=np.int64)
+        return labels, to_medoids[0], np.full(len(columns), np.inf)
+    order = np.argpartition(to_medoids, 1, axis=0)
+    return order[0], to_medoids[order[0], columns], to_medoids[order[1], columns]
+
+
+def _pam_swaps(
+    distances: np.ndarray, medoids: np.ndarray, max_iter: int
+) -> Tuple[np.ndarray, int]:
+    """Applies the best swap of a medoid with a non-medoid until none lowers the objective.
+
+    The change of objective of every (medoid, candidate) swap is computed at once:
+    each vector either moves to the candidate when it is closer than its nearest
+    medoid, or, when its own medoid is removed, moves to the closer of the candidate
+    and its second nearest medoid.
+    """
+    iterations = 0
+    while iterations < max_iter:
+        labels, nearest, second = _nearest_two(distances, medoids)
+        gain_elsewhere = np.minimum(distances - nearest, 0.0)
+        own_cluster = np.minimum(distances, second) - nearest - gain_elsewhere
+        membership = np.zeros((len(distances), len(medoids)))
+        membership[np.arange(len(distances)), labels] = 1.0
+        deltas = gain_elsewhere.sum(axis=1)[:, None] + own_cluster @ membership
+        deltas[medoids] = np.inf
+        candidate, position = np.unravel_index(np.argmin(deltas), deltas.shape)
+        if deltas[candidate, position] >= -1e-12 * max(1.0, nearest.sum()):
+            break
+        medoids = medoids.copy()
+        medoids[position] = candidate
+        iterations += 1
+    return medoids, iterations
+
+
+def _alternate_updates(
+    distances: np.ndarray, medoids: np.ndarray, max_iter: int
+) -> Tuple[np.ndarray, int]:
+    """Moves each medoid to the member of its cluster closest to the others until stable.
+
+    Each medoid stays in its own cluster, so the medoids remain distinct.
+    """
+    iterations = 0
+    while iterations < max_iter:
+        labels = np.argmin(distances[medoids], axis=0)
+        labels[medoids] = np.arange(len(medoids))
+        updated = medoids.copy()
+        for position in range(len(medoids)):
+            members = np.flatnonzero(labels == position)
+            if len(members):
+                costs = distances[np.ix_(members, members)].sum(axis=1)
+                updated[position] = members[np.argmin(costs)]
+        iterations += 1
+        if np.array_equal(updated, medoids):
+            break
+        medoids = updated
+    return medoids, iterations
+
+
+def kmedoids(
+    distances: np.ndarray,
+    n_clusters: int,
+    init: str = "heuristic",
+    method: KMedoidsMethod = "pam",
+    max_iter: int = 300,
+    seed: int = 0,
+) -> KMedoidsResult:
+    """Clusters vectors into ``n_clusters`` clusters around medoids.
+
+    Args:
+        distances (numpy.ndarray): The square matrix of distances between the
+            vectors, for example from :func:`pairwise_distances`.
+        n_clusters (int): The number of medoids, at most the number of vectors.
+        init (str): The medoid initialization method. Possible values are
+            ``'random'``, ``'heuristic'`` (the vectors with the smallest total
+            distance), ``'k-medoids++'`` and ``'build'`` (the greedy PAM BUILD step)
+            (default: ``'heuristic'``).
+        method (str): ``'pam'`` swaps medoids with non-medoids while the objective
+            decreases, ``'alternate'`` updates each medoid within its cluster
+            (default: ``'pam'``).
+        max_iter (int): The maximum number of swap or update iterations
+            (default: 300).
+        seed (int): The seed of the random initializations (default: 0).
+
+    Returns:
+        KMedoidsResult: The medoids, the labels and the objective.
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    if distances.ndim != 2 or distances.shape[0] != distances.shape[1]:
+        raise ValueError("distances must be a square matrix.")
+    if not isinstance(n_clusters, int) or not 0 < n_clusters <= len(distances):
+        raise ValueError("n_clusters must be a positive integer no larger than the vector count.")
+    if init not in KMEDOIDS_SUMMARIZER_INIT_VALUES:
+        raise ValueError(f"init must be one of {KMEDOIDS_SUMMARIZER_INIT_VALUES}.")
+    if method not in _KMEDOIDS_METHODS:
+        raise ValueError(f"method must be one of {list(_KMEDOIDS_METHODS)}.")
+    rng = np.random.default_rng(seed)
+    medoids = np.asarray(_initial_medoids(distances, n_clusters, init, rng), dtype=np.int64)
+    if method == "pam":
+        medoids, iterations = _pam_swaps(distances, medoids, max_iter)
+    else:
+        medoids, iterations = _alternate_updates(distances, medoids, max_iter)
+    to_medoids = distances[medoids]
+    labels = np.argmin(to_medoids, axis=0)
+    objective = float(to_medoids[labels, np.arange(len(distances))].sum())
+    logger.debug("k-medoids converged after %d iterations", iterations)
+    return KMedoidsResult(medoids, labels, objective, iterations)
+
+
+def _assign(
+    vectors: np.ndarray, medoid_vectors: np.ndarray, metric: str, shift: float
+) -> Tuple[np.ndarray, float]:
+    """Assigns each vector to its nearest medoid, one block of vectors at a time."""
+    labels = np.empty(len(vectors), dtype=np.int64)
+    objective = 0.0
+    for start in range(0, len(vectors), _ASSIGN_BLOCK_SIZE):
+        distances = _cross_distances(
+            vectors[start : start + _ASSIGN_BLOCK_SIZE], medoid_vectors, metric, shift
+        )
+        block_labels = np.argmin(distances, axis=1)
+        labels[start : start + len(block_labels)] = block_labels
+        objective += float(distances[np.arange(len(block_labels)), block_labels].sum())
+    return labels, objective
+
+
+def clara(
+    vectors: np.ndarray,
+    n_clusters: int,
+    metric: str = "euclidean",
+    init: str = "heuristic",
+    sample_size: int = 0,
+    n_samples: int = 5,
+    max_iter: int = 300,
+    seed: int = 0,
+) -> KMedoidsResult:
+    """Clusters vectors around medoids chosen by PAM on random samples (CLARA).
+
+    Each sample holds the best medoids found so far plus randomly drawn vectors.
+    After PAM runs on the distance matrix of the sample, all the vectors are
+    assigned to the sample medoids, and the medoids with the lowest objective over
+    all the vectors are kept. The memory use is quadratic in ``sample_size`` and
+    linear in the number of vectors, instead of quadratic in the number of vectors.
+
+    Args:
+        vectors (numpy.ndarray): A two-dimensional array with one vector per row.
+        n_clusters (int): The number of medoids, at most the number of vectors.
+        metric (str): The distance metric, see :func:`pairwise_distances`
+            (default: ``'euclidean'``).
+        init (str): The medoid initialization method of PAM on each sample, see
+            :func:`kmedoids` (default: ``'heuristic'``).
+        sample_size (int): The number of vectors in each sample (default: 0, which
+            uses ``80 + 4 * n_clusters``).
+        n_samples (int): The number of samples (default: 5).
+        max_iter (int): The maximum number of PAM swaps per sample (default: 300).
+        seed (int): The seed of the samples and of the random initializations
+            (default: 0).
+
+    Returns:
+        KMedoidsResult: The best medoids, the labels and the objective over all the
+        vectors. The iterations are summed over the samples.
+    """
+    vectors, shift = _prepare(vectors, metric)
+    count = len(vectors)
+    if not isinstance(n_clusters, int) or not 0 < n_clusters <= count:
+        raise ValueError("n_clusters must be a positive integer no larger than the vector count.")
+    if not isinstance(sample_size, int) or sample_size < 0:
+        raise ValueError("sample_size must be a non-negative integer.")
+    if not isinstance(n_samples, int) or n_samples <= 0:
+        raise ValueError("n_samples must be a positive integer.")
+    sample_size = min(count, max(sample_size or 80 + 4 * n_clusters, n_clusters))
+    rng = np.random.default_rng(seed)
+    best: Optional[KMedoidsResult] = None
+    iterations = 0
+    for _ in range(n_samples if sample_size < count else 1):
+        sample = np.arange(count)
+        if sample_size < count:
+            kept = np.zeros(0, dtype=np.int64) if best is None else best.medoids
+            others = np.setdiff1d(np.arange(count), kept)
+            drawn = rng.choice(others, size=sample_size - len(kept), replace=False)
+            sample = np.concatenate([kept, drawn])
+        sample_vectors = vectors[sample]
+        distances = _cross_distances(sample_vectors, sample_vectors, metric, shift)
+        if metric != "dot-product":
+            np.fill_diagonal(distances, 0.0)
+        result = kmedoids(
+            distances, n_clusters, init=init, max_iter=max_iter, seed=int(rng.integers(2**31))
+        )
+        iterations += result.iterations
+        medoids = sample[result.medoids]
+        labels, objective = _assign(vectors, vectors[medoids], metric, shift)
+        if best is None or objective < best.objective:
+            best = KMedoidsResult(medoids, labels, objective, 0)
+    if best is None:
+        raise ValueError("clara found no medoids; n_samples must be a positive integer.")
+    return best._replace(iterations=iterations)
+
+
+class KMedoidsComparison(NamedTuple):
+    """The comparison of CLARA with exact PAM on the same vectors.
+
+    Attributes:
+        clara_objective (float): The objective of the CLARA medoids.
+        pam_objective (float): The objective of the PAM medoids.
+        relative_gap (float): How much higher the CLARA objective is, as a fraction
+            of the PAM objective.
+        clara_seconds (float): The duration of CLARA.
+        pam_seconds (float): The duration of PAM, including the distance matrix.
+    """
+
+    clara_objective: float
+    pam_objective: float
+    relative_gap: float
+    clara_seconds: float
+    pam_seconds: float
+
+
+def compare_with_pam(
+    vectors: np.ndarray,
+    n_clusters: int,
+    metric: str = "euclidean",
+    init: str = "heuristic",
+    sample_size: int = 0,
+    n_samples: int = 5,
+    seed: int = 0,
+) -> KMedoidsComparison:
+    """Runs CLARA and exact PAM on the same vectors and compares their objectives.
+
+    PAM needs the distance matrix of all the vectors, so use this function to
+    choose the ``sample_size`` and ``n_samples`` of CLARA on representative
+    documents rather than on every document.
+
+    Args:
+        vectors (numpy.ndarray): A two-dimensional array with one vector per row.
+        n_clusters (int): The number of medoids.
+        metric (str): The distance metric (default: ``'euclidean'``).
+        init (str): The medoid initialization method (default: ``'heuristic'``).
+        sample_size (int): The number of vectors in each CLARA sample (default: 0,
+            which uses ``80 + 4 * n_clusters``).
+        n_samples (int): The number of CLARA samples (default: 5).
+        seed (int): The seed of both algorithms (default: 0).
+
+    Returns:
+        KMedoidsComparison: The objectives and the durations of both algorithms.
+    """
+    start = time.perf_counter()
+    approximate = clara(
+        vectors, n_clusters, metric, init, sample_size=sample_size, n_samples=n_samples, seed=seed
+    )
+    clara_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    exact = kmedoids(pairwise_distances(vectors, metric), n_clusters, init=init, seed=seed)
+    pam_seconds = time.perf_counter() - start
+    gap = (approximate.objective - exact.objective) / exact.objective if exact.objective else 0.0
+    logger.info(
+        "CLARA objective %.6g is %.2f%% above PAM (%.3fs vs %.3fs)",
+        approximate.objective,
+        100 * gap,
+        clara_seconds,
+        pam_seconds,
+    )
+    return KMedoidsComparison(
+        approximate.objective, exact.objective, gap, clara_seconds, pam_seconds
+    )
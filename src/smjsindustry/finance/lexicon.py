@@ -0,0 +1,530 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The module that compiles the word lists of the local NLP scorer.
+
+The word lists of an :class:`~smjsindustry.finance.processor_config.NLPScorerConfig`
+are stemmed and compiled into a :class:`CompiledLexicon`: a sorted array of the
+stems of the single words, and an Aho-Corasick automaton over the stems of the
+multi-word phrases. A compiled lexicon can be saved as a versioned directory of
+NumPy arrays, identified by a hash of its word lists, with the SHA-256 hash of
+each array checked and the arrays memory-mapped when it is loaded, so that large
+lexicons are not stemmed and compiled again for every batch.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections import deque
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from smjsindustry.finance.local_summarizer import SummarizerInput, _get_stemmer, tokenize
+from smjsindustry.finance.nlp_score_type import NLPSCORE_NO_WORD_LIST, NLPScoreType
+from smjsindustry.finance.processor_config import NLPScorerConfig
+
+logger = logging.getLogger(__name__)
+
+LEXICON_FORMAT_VERSION = 2
+_MANIFEST_FILE = "manifest.json"
+_STEMMER = "porter"
+# The lexicon groups of the tokens that are not words and of the unmatched words.
+_NON_WORD_GROUP = 0
+_UNMATCHED_GROUP = 1
+_FIRST_LEXICON_GROUP = 2
+
+WordLists = Mapping[str, Sequence[str]]
+
+
+def _normalize_entry(entry: str) -> str:
+    """Normalizes a word list entry to its lowercase tokens, joined by spaces."""
+    return " ".join(tokenize(entry))
+
+
+def _word_list_hash(word_list: Sequence[str]) -> str:
+    """Hashes the distinct normalized entries of a word list."""
+    entries = sorted({_normalize_entry(entry) for entry in word_list} - {""})
+    payload = json.dumps(
+        {"format_version": LEXICON_FORMAT_VERSION, "stemmer": _STEMMER, "entries": entries}
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _required_word_lists(nlp_scorer_config: NLPScorerConfig) -> List[str]:
+    """Returns the names of the word lists the score types of a config are computed from."""
+    names: List[str] = []
+    for score_name in nlp_scorer_config.get_config()["score_types"]:
+        if score_name == NLPScoreType.POLARITY:
+            required = [NLPScoreType.POSITIVE, NLPScoreType.NEGATIVE]
+        elif score_name in NLPSCORE_NO_WORD_LIST:
+            required = []
+        else:
+            required = [score_name]
+        names.extend(name for name in required if name not in names)
+    return names
+
+
+def _available_word_lists(
+    nlp_scorer_config: NLPScorerConfig, word_lists: Optional[WordLists]
+) -> Dict[str, List[str]]:
+    """Returns the required word lists that the config or ``word_lists`` provide.
+
+    The word list of the config is used when it is not empty, otherwise the word
+    list passed in ``word_lists``. The internal word lists of the default score
+    types, which are empty in the config, are left out when ``word_lists`` does
+    not provide them.
+    """
+    if word_lists is not None and not isinstance(word_lists, Mapping):
+        raise TypeError("The local NLP scorer requires word_lists to be a mapping.")
+    score_types = nlp_scorer_config.get_config()["score_types"]
+    available = {}
+    for name in _required_word_lists(nlp_scorer_config):
+        word_list = score_types.get(name) or (word_lists or {}).get(name)
+        if word_list:
+            available[name] = list(word_list)
+    return available
+
+
+def _missing_word_list_error(score_name: str) -> ValueError:
+    """Builds the error of a word list that is not available locally."""
+    return ValueError(
+        f"The internal {score_name} word list is not available locally. Pass the words "
+        f"in the word_list of NLPScoreType('{score_name}', ...), in word_lists, or in a "
+        "compiled lexicon."
+    )
+
+
+class _SortedLookup:
+    """Maps strings to integers with a binary search over a sorted string array."""
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def from_dict(cls, mapping: Dict[str, int]) -> "_SortedLookup":
+        """Builds a lookup from a dictionary."""
+        keys = sorted(mapping)
+        return cls(
+            np.array(keys, dtype=str) if keys else np.zeros(0, dtype="U1"),
+            np.array([mapping[key] for key in keys], dtype=np.int32),
+        )
+
+    def get(self, key: str, default: int) -> int:
+        """Returns the value of a key, or the default when the key is missing."""
+        position = int(np.searchsorted(self.keys, key))
+        if position < len(self.keys) and self.keys[position] == key:
+            return int(self.values[position])
+        return default
+
+
+class _PhraseAutomaton:
+    """An Aho-Corasick automaton over the stems of the multi-word word list entries.
+
+    The alphabet is the stems that occur in a phrase. The automaton is advanced
+    by one transition per token, and the state after a token stands for all the
+    phrases that end at that token, including the overlapping and nested ones.
+    The counts matrix has one row per state and one column per word list, so the
+    phrase matches of every word list are counted by a bincount of the states.
+
+    The edges of the trie are stored as sorted ``state * symbol_count + symbol``
+    keys, and the transitions that follow failure links are memoized as they are
+    first taken.
+    """
+
+    def __init__(
+        self,
+        symbols: _SortedLookup,
+        edge_keys: np.ndarray,
+        edge_targets: np.ndarray,
+        fail: np.ndarray,
+        counts: np.ndarray,
+    ):
+        self.symbols = symbols
+        self.counts = counts
+        self._symbol_count = max(len(symbols.keys), 1)
+        self._edge_keys = edge_keys
+        self._edge_targets = edge_targets
+        self._fail = fail
+        self._goto: Dict[int, int] = {}
+
+    @classmethod
+    def compile(
+        cls, phrases: Dict[Tuple[str, ...], List[int]], column_count: int
+    ) -> "_PhraseAutomaton":
+        """Compiles the stem sequences of the phrases, with the columns of their word lists."""
+        symbols: Dict[str, int] = {}
+        children: List[Dict[int, int]] = [{}]
+        ends: List[List[int]] = [[]]
+        for phrase, columns in phrases.items():
+            state = 0
+            for stemmed in phrase:
+                symbol = symbols.setdefault(stemmed, len(symbols))
+                child = children[state].get(symbol)
+                if child is None:
+                    child = children[state][symbol] = len(children)
+                    children.append({})
+                    ends.append([])
+                state = child
+            ends[state].extend(columns)
+
+        def transition(state: int, symbol: int) -> int:
+            while True:
+                child = children[state].get(symbol)
+                if child is not None or not state:
+                    return child or 0
+                state = fail[state]
+
+        fail = np.zeros(len(children), dtype=np.int32)
+        counts = np.zeros((len(children), column_count), dtype=np.int32)
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+            for column in ends[state]:
+                counts[state, column] += 1
+            # The states are visited breadth-first, so the failure state already
+            # holds the counts of the shorter phrases that end with this one.
+            counts[state] += counts[fail[state]]
+            for symbol, child in children[state].items():
+                fail[child] = transition(fail[state], symbol) if state else 0
+                queue.append(child)
+        symbol_count = max(len(symbols), 1)
+        edges = sorted(
+            (state * symbol_count + symbol, child)
+            for state, edges_of_state in enumerate(children)
+            for symbol, child in edges_of_state.items()
+        )
+        return cls(
+            _SortedLookup.from_dict(symbols),
+            np.array([key for key, _ in edges], dtype=np.int64),
+            np.array([child for _, child in edges], dtype=np.int32),
+            fail,
+            counts,
+        )
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays of the automaton, by file name."""
+        return {
+            "phrase_symbols": self.symbols.keys,
+            "phrase_symbol_ids": self.symbols.values,
+            "phrase_edge_keys": self._edge_keys,
+            "phrase_edge_targets": self._edge_targets,
+            "phrase_fail": self._fail,
+            "phrase_counts": self.counts,
+        }
+
+    def _next(self, state: int, symbol: int) -> int:
+        """Returns the state after a symbol, following the failure links, and memoizes it."""
+        key = state * self._symbol_count + symbol
+        target = self._goto.get(key)
+        if target is None:
+            position = int(np.searchsorted(self._edge_keys, key))
+            if position < len(self._edge_keys) and self._edge_keys[position] == key:
+                target = int(self._edge_targets[position])
+            else:
+                target = self._next(int(self._fail[state]), symbol) if state else 0
+            self._goto[key] = target
+        return target
+
+    def states(self, symbols: Sequence[int]) -> np.ndarray:
+        """Runs the automaton over the symbols of a document, -1 for the other tokens."""
+        states = np.zeros(len(symbols), dtype=np.intp)
+        state = 0
+        goto = self._goto
+        symbol_count = self._symbol_count
+        for position, symbol in enumerate(symbols):
+            if symbol < 0:
+                state = 0
+                continue
+            target = goto.get(state * symbol_count + symbol)
+            state = self._next(state, symbol) if target is None else target
+            states[position] = state
+        return states
+
+
+class CompiledLexicon:
+    """The stemmed and compiled word lists of the local NLP scorer.
+
+    Each stem of a single-word entry maps to a group, which stands for the set of
+    word lists that contain the stem. The membership matrix has one row per group
+    and one column per word list, so the matches of every word list in a document
+    are counted by a single bincount of the token groups, whatever the number of
+    word lists. The multi-word entries of all the word lists share one
+    :class:`_PhraseAutomaton`.
+
+    Use :func:`compile_lexicon` to compile the word lists of a config, and
+    :func:`load_lexicon` to load a saved lexicon.
+    """
+
+    def __init__(
+        self,
+        list_hashes: Dict[str, str],
+        stem_groups: _SortedLookup,
+        membership: np.ndarray,
+        automaton: Optional[_PhraseAutomaton],
+    ):
+        self._list_hashes = dict(list_hashes)
+        self._names = list(list_hashes)
+        self._stem_groups = stem_groups
+        self._automaton = automaton
+        self.membership = membership
+
+    @classmethod
+    def from_word_lists(cls, word_lists: WordLists) -> "CompiledLexicon":
+        """Stems and compiles word lists, by score name."""
+        stem = _get_stemmer()
+        stems: Dict[str, str] = {}
+
+        def stem_token(token: str) -> str:
+            stemmed = stems.get(token)
+            if stemmed is None:
+                stemmed = stems[token] = stem(token)
+            return stemmed
+
+        columns_of: Dict[str, List[int]] = {}
+        phrase_columns: Dict[Tuple[str, ...], List[int]] = {}
+        for column, word_list in enumerate(word_lists.values()):
+            entries = {tuple(stem_token(token) for token in tokenize(entry)) for entry in word_list}
+            for entry in entries:
+                if len(entry) == 1:
+                    columns_of.setdefault(entry[0], []).append(column)
+                elif entry:
+                    phrase_columns.setdefault(entry, []).append(column)
+        groups: Dict[Tuple[int, ...], int] = {}
+        stem_groups = {
+            stemmed: groups.setdefault(tuple(columns), _FIRST_LEXICON_GROUP + len(groups))
+            for stemmed, columns in columns_of.items()
+        }
+        membership = np.zeros((_FIRST_LEXICON_GROUP + len(groups), len(word_lists)), np.int32)
+        for columns, group in groups.items():
+            membership[group, list(columns)] = 1
+        automaton = None
+        if phrase_columns:
+            automaton = _PhraseAutomaton.compile(phrase_columns, len(word_lists))
+        return cls(
+            {name: _word_list_hash(word_list) for name, word_list in word_lists.items()},
+            _SortedLookup.from_dict(stem_groups),
+            membership,
+            automaton,
+        )
+
+    @property
+    def names(self) -> List[str]:
+        """Gets the names of the word lists, in the order of the columns."""
+        return list(self._names)
+
+    @property
+    def word_lists_hash(self) -> str:
+        """Gets the SHA-256 hash of the word lists the lexicon was compiled from."""
+        payload = json.dumps(self._list_hashes, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def automaton(self) -> Optional[_PhraseAutomaton]:
+        """Gets the phrase automaton, or None when no entry has several words."""
+        return self._automaton
+
+    def list_hash(self, score_name: str) -> str:
+        """Returns the hash of the word list of a score type."""
+        return self._list_hashes[score_name]
+
+    def column(self, score_name: str) -> int:
+        """Returns the column of the counts of a word list."""
+        return self._names.index(score_name)
+
+    def stem_group(self, stemmed: str) -> int:
+        """Returns the lexicon group of a stem."""
+        return self._stem_groups.get(stemmed, _UNMATCHED_GROUP)
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays of the lexicon, by file name."""
+        arrays = {
+            "stems": self._stem_groups.keys,
+            "stem_groups": self._stem_groups.values,
+            "membership": self.membership,
+        }
+        if self._automaton is not None:
+            arrays.update(self._automaton.arrays())
+        return arrays
+
+    def save(self, path: SummarizerInput) -> None:
+        """Saves the lexicon as a directory of NumPy arrays with a JSON manifest.
+
+        The lexicon is written to a temporary sibling directory that then replaces
+        ``path``, so an interrupted save leaves any previous lexicon at ``path``
+        intact. The manifest records the SHA-256 hash of every array file.
+        """
+        path = os.path.abspath(path)
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f".{os.path.basename(path)}.", dir=parent)
+        try:
+            arrays = self._arrays()
+            array_hashes = {}
+            for name, array in arrays.items():
+                array_path = os.path.join(staging, f"{name}.npy")
+                np.save(array_path, np.ascontiguousarray(array))
+                array_hashes[name] = _file_hash(array_path)
+            manifest = {
+                "format_version": LEXICON_FORMAT_VERSION,
+                "stemmer": _STEMMER,
+                "word_lists_hash": self.word_lists_hash,
+                "list_hashes": self._list_hashes,
+                "names": self._names,
+                "array_hashes": array_hashes,
+            }
+            with open(os.path.join(staging, _MANIFEST_FILE), "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=2)
+            _replace_directory(staging, path)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        logger.info(
+            "Saved lexicon %s with %d word lists", self.word_lists_hash[:12], len(self._names)
+        )
+
+    @classmethod
+    def load(cls, path: SummarizerInput, mmap: bool = True) -> "CompiledLexicon":
+        """Loads a lexicon saved by :meth:`save`. See :func:`load_lexicon`."""
+        manifest_path = os.path.join(path, _MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            raise ValueError(f"{path} is not a compiled lexicon: {_MANIFEST_FILE} is missing.")
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("format_version") != LEXICON_FORMAT_VERSION:
+            raise ValueError(
+                f"The lexicon at {path} has format version {manifest.get('format_version')}; "
+                f"this version of smjsindustry reads version {LEXICON_FORMAT_VERSION}. "
+                "Compile the lexicon again."
+            )
+        if manifest.get("stemmer") != _STEMMER:
+            raise ValueError(f"The lexicon at {path} was stemmed with {manifest.get('stemmer')}.")
+        list_hashes = {name: manifest["list_hashes"][name] for name in manifest["names"]}
+        arrays = {}
+        for name, expected_hash in manifest["array_hashes"].items():
+            array_path = os.path.join(path, f"{name}.npy")
+            if not os.path.exists(array_path) or _file_hash(array_path) != expected_hash:
+                raise ValueError(
+                    f"The array {name} of the lexicon at {path} does not match its manifest."
+                )
+            arrays[name] = np.load(array_path, mmap_mode="r" if mmap else None)
+        automaton = None
+        if "phrase_counts" in arrays:
+            automaton = _PhraseAutomaton(
+                _SortedLookup(arrays["phrase_symbols"], arrays["phrase_symbol_ids"]),
+                arrays["phrase_edge_keys"],
+                arrays["phrase_edge_targets"],
+                arrays["phrase_fail"],
+                arrays["phrase_counts"],
+            )
+        lexicon = cls(
+            list_hashes,
+            _SortedLookup(arrays["stems"], arrays["stem_groups"]),
+            arrays["membership"],
+            automaton,
+        )
+        if lexicon.word_lists_hash != manifest["word_lists_hash"]:
+            raise ValueError(f"The manifest of the lexicon at {path} is corrupted.")
+        return lexicon
+
+
+def _file_hash(path: str) -> str:
+    """Hashes the bytes of a file with SHA-256."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _replace_directory(source: str, target: str) -> None:
+    """Moves a directory to ``target``, replacing any directory already there."""
+    if not os.path.exists(target):
+        os.replace(source, target)
+        return
+    # A non-empty directory cannot be replaced in one rename, so the old one is
+    # first renamed aside; ``target`` is missing only between the two renames.
+    retired = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(target)}.old.", dir=os.path.dirname(target)
+    )
+    os.rmdir(retired)
+    os.replace(target, retired)
+    try:
+        os.replace(source, target)
+    except BaseException:
+        os.replace(retired, target)
+        raise
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def compile_lexicon(
+    nlp_scorer_config: NLPScorerConfig,
+    path: Optional[SummarizerInput] = None,
+    word_lists: Optional[WordLists] = None,
+) -> CompiledLexicon:
+    """Compiles the word lists of an NLP scorer config into a lexicon.
+
+    The entries of the word lists are tokenized and Porter-stemmed like the
+    documents. The single words are stored in a sorted array of stems, and the
+    multi-word phrases in an Aho-Corasick automaton.
+
+    Args:
+        nlp_scorer_config (NLPScorerConfig): The config with the score types.
+        path (str): An optional directory to save the lexicon to, see
+            :meth:`CompiledLexicon.save` (default: None).
+        word_lists (Mapping[str, Sequence[str]]): The word lists of the default
+            score types configured with an empty word list, by score name
+            (default: None).
+
+    Returns:
+        CompiledLexicon: The compiled lexicon, which can be passed to
+        :func:`~smjsindustry.finance.local_scorer.score_dataframe`.
+
+    Raises:
+        ValueError: if a configured word list is empty and not in ``word_lists``.
+    """
+    if not isinstance(nlp_scorer_config, NLPScorerConfig):
+        raise TypeError("compile_lexicon requires an NLPScorerConfig.")
+    available = _available_word_lists(nlp_scorer_config, word_lists)
+    for name in _required_word_lists(nlp_scorer_config):
+        if name not in available:
+            raise _missing_word_list_error(name)
+    lexicon = CompiledLexicon.from_word_lists(available)
+    if path is not None:
+        lexicon.save(path)
+    return lexicon
+
+
+def load_lexicon(path: SummarizerInput, mmap: bool = True) -> CompiledLexicon:
+    """Loads a lexicon saved by :func:`compile_lexicon`.
+
+    Every array file is checked against the SHA-256 hash recorded in the
+    manifest, then memory-mapped by default, so the lexicon is not stemmed and
+    compiled again and the processes that load the same lexicon share its pages.
+
+    Args:
+        path (str): The directory of the lexicon.
+        mmap (bool): Whether to memory-map the arrays instead of reading them
+            (default: True).
+
+    Returns:
+        CompiledLexicon: The loaded lexicon.
+
+    Raises:
+        ValueError: if the directory is not a lexicon, if it was saved in
+            another format version, or if an array does not match the manifest.
+    """
+    return CompiledLexicon.load(path, mmap)
@@ -0,0 +1,514 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The module that computes NLP scores in the current process.
+
+The functions in this module compute the scores of an
+:class:`~smjsindustry.finance.processor_config.NLPScorerConfig` without starting
+a SageMaker processing job, so single documents and small batches can be scored
+interactively.
+
+The internal word lists of the default score types are only available in the
+processing job. Locally, a default score type is scored with the word list of
+its :class:`~smjsindustry.finance.nlp_score_type.NLPScoreType`, or with a word
+list passed in ``word_lists``.
+"""
+
+import logging
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from smjsindustry.finance.lexicon import (
+    CompiledLexicon,
+    WordLists,
+    _NON_WORD_GROUP,
+    _PhraseAutomaton,
+    _available_word_lists,
+    _missing_word_list_error,
+    _required_word_lists,
+    _word_list_hash,
+    compile_lexicon,
+)
+from smjsindustry.finance.local_summarizer import (
+    SummarizerInput,
+    _get_stemmer,
+    split_sentences,
+    tokenize,
+)
+from smjsindustry.finance.nlp_score_type import NLPScoreType
+from smjsindustry.finance.processor_config import NLPScorerConfig
+
+logger = logging.getLogger(__name__)
+
+_VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+_SILENT_ENDING = re.compile(r"(?:[^aeiouy]e|es|ed)$")
+_COMPLEX_WORD_SYLLABLES = 3
+
+_Scorer = Callable[["_Document"], float]
+
+
+def count_syllables(word: str) -> int:
+    """Estimates the number of syllables of an English word.
+
+    The syllables are the groups of consecutive vowels, without a silent final
+    ``e``, ``es`` or ``ed``. Every word with a letter has at least one syllable.
+
+    Args:
+        word (str): A lowercase word.
+
+    Returns:
+        int: The estimated number of syllables.
+    """
+    groups = len(_VOWEL_GROUPS.findall(word))
+    if groups > 1 and _SILENT_ENDING.search(word) and not word.endswith(("le", "ted", "ded")):
+        groups -= 1
+    return max(groups, 1)
+
+
+def _is_word(token: str) -> bool:
+    """Checks whether a token has a letter, so numbers are not counted as words."""
+    return not token.isdigit() and any(character.isalpha() for character in token)
+
+
+def _get_sentiment_analyzer():
+    """Loads the VADER sentiment analyzer of nltk."""
+    try:
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer  # type: ignore[import]
+    except ImportError:
+        raise RuntimeError(
+            "nltk is required by the local sentiment score. "
+            "Install it with: pip install 'smjsindustry[nlp]'"
+        ) from None
+    try:
+        return SentimentIntensityAnalyzer()
+    except LookupError:
+        raise RuntimeError(
+            "The local sentiment score requires the VADER lexicon of nltk. "
+            "Download it with: python -m nltk.downloader vader_lexicon"
+        ) from None
+
+
+class _TokenSyllables(dict):
+    """Memoizes the syllable count of each distinct token, 0 for the tokens that are not words."""
+
+    def __missing__(self, token: str) -> int:
+        count = count_syllables(token) if _is_word(token) else 0
+        self[token] = count
+        return count
+
+    def count(self, tokens: List[str]) -> np.ndarray:
+        """Returns the syllable counts of the tokens of a document."""
+        return np.fromiter(map(self.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+
+
+def _readability_table(
+    syllables: List[np.ndarray], sentence_counts: np.ndarray, index: Optional[pd.Index] = None
+) -> pd.DataFrame:
+    """Computes the readability totals and indices of documents from their syllable counts.
+
+    The counts of all the documents are concatenated, so the totals of each
+    document are computed by bincounts over the whole batch, and the indices are
+    array expressions over the totals.
+    """
+    count = len(syllables)
+    lengths = np.fromiter(map(len, syllables), dtype=np.int64, count=count)
+    document = np.repeat(np.arange(count), lengths)
+    flat = np.concatenate(syllables) if count else np.zeros(0, dtype=np.int64)
+    words = np.bincount(document, weights=flat > 0, minlength=count)
+    complex_words = np.bincount(
+        document, weights=flat >= _COMPLEX_WORD_SYLLABLES, minlength=count
+    )
+    syllable_totals = np.bincount(document, weights=flat, minlength=count)
+    sentences = np.maximum(np.asarray(sentence_counts, dtype=np.float64), 1.0)
+    has_words = words > 0
+    per_word = np.maximum(words, 1.0)
+    words_per_sentence = words / sentences
+    syllables_per_word = syllable_totals / per_word
+    return pd.DataFrame(
+        {
+            "sentences": np.asarray(sentence_counts, dtype=np.int64),
+            "words": words.astype(np.int64),
+            "syllables": syllable_totals.astype(np.int64),
+            "complex_words": complex_words.astype(np.int64),
+            "gunning_fog": np.where(
+                has_words, 0.4 * (words_per_sentence + 100.0 * complex_words / per_word), 0.0
+            ),
+            "flesch_reading_ease": np.where(
+                has_words, 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 0.0
+            ),
+            "flesch_kincaid_grade": np.where(
+                has_words, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 0.0
+            ),
+        },
+        index=index,
+    )
+
+
+def readability_scores(texts: Union[pd.Series, Iterable[str]]) -> pd.DataFrame:
+    """Computes the readability of a column of documents.
+
+    The documents are tokenized like in :func:`score_text`, and the syllables of
+    each distinct word are counted once for the whole column. The sentence, word,
+    syllable and complex word totals are then reduced with NumPy, and the
+    readability indices are evaluated over the whole column at once.
+
+    Args:
+        texts (pandas.Series or Iterable[str]): The documents.
+
+    Returns:
+        pandas.DataFrame: The ``sentences``, ``words``, ``syllables`` and
+        ``complex_words`` (words of at least three syllables) of each document,
+        with its ``gunning_fog`` index, which is the ``readability`` score, its
+        ``flesch_reading_ease`` and its ``flesch_kincaid_grade``. The rows are in
+        the order of ``texts``, with its index when it is a series. Missing and
+        empty documents get zeros.
+    """
+    index = texts.index if isinstance(texts, pd.Series) else None
+    syllables_of = _TokenSyllables()
+    syllables = []
+    sentence_counts = []
+    for text in texts:
+        valid = isinstance(text, str) and bool(text.strip())
+        syllables.append(syllables_of.count(tokenize(text) if valid else []))
+        sentence_counts.append(len(split_sentences(text)) if valid else 0)
+    return _readability_table(syllables, np.asarray(sentence_counts), index)
+
+
+class _TokenGroups(dict):
+    """Memoizes the lexicon group of each distinct token of a batch of documents."""
+
+    def __init__(self, stem: Callable[[str], str], lexicon: CompiledLexicon):
+        super().__init__()
+        self._stem = stem
+        self._lexicon = lexicon
+
+    def __missing__(self, token: str) -> int:
+        if _is_word(token):
+            group = self._lexicon.stem_group(self._stem(token))
+        else:
+            group = _NON_WORD_GROUP
+        self[token] = group
+        return group
+
+
+class _TokenSymbols(dict):
+    """Memoizes the phrase automaton symbol of each distinct token, -1 outside phrases."""
+
+    def __init__(self, stem: Callable[[str], str], automaton: _PhraseAutomaton):
+        super().__init__()
+        self._stem = stem
+        self._symbols = automaton.symbols
+
+    def __missing__(self, token: str) -> int:
+        symbol = self._symbols.get(self._stem(token), -1) if _is_word(token) else -1
+        self[token] = symbol
+        return symbol
+
+
+def _check_lexicon(
+    lexicon: CompiledLexicon, nlp_scorer_config: NLPScorerConfig, word_lists: Optional[WordLists]
+) -> None:
+    """Checks that a compiled lexicon has the word lists that a config is scored with.
+
+    The word lists that the config or ``word_lists`` provide must have the hash of
+    the compiled ones. The internal word lists of the default score types, which
+    the config leaves empty, are taken from the lexicon.
+    """
+    if not isinstance(lexicon, CompiledLexicon):
+        raise TypeError("The local NLP scorer requires lexicon to be a CompiledLexicon.")
+    available = _available_word_lists(nlp_scorer_config, word_lists)
+    for name in _required_word_lists(nlp_scorer_config):
+        if name not in lexicon.names:
+            raise _missing_word_list_error(name)
+        if name in available and _word_list_hash(available[name]) != lexicon.list_hash(name):
+            raise ValueError(
+                f"The {name} word list of the lexicon differs from the word list of the "
+                "config. Compile the lexicon again."
+            )
+
+
+class _Document(NamedTuple):
+    """A tokenized document, with the counts of the matches of every word list."""
+
+    tokens: List[str]
+    word_count: int
+    lexicon_counts: np.ndarray
+    sentences: List[str]
+
+
+class _ScoringPipeline:
+    """The text processing of the NLP scorer, shared by a batch of documents.
+
+    The word lists are compiled into a
+    :class:`~smjsindustry.finance.lexicon.CompiledLexicon` once, unless a compiled
+    lexicon is given, and the lexicon group of each distinct token is memoized
+    across all the documents of the batch. Each document is then tokenized and
+    scanned once for all the score types.
+    """
+
+    def __init__(
+        self,
+        nlp_scorer_config: NLPScorerConfig,
+        word_lists: Optional[WordLists],
+        lexicon: Optional[CompiledLexicon] = None,
+    ):
+        """Initializes a pipeline for the score types of the given config."""
+        if not isinstance(nlp_scorer_config, NLPScorerConfig):
+            raise TypeError("The local NLP scorer requires an NLPScorerConfig.")
+        if lexicon is None:
+            lexicon = compile_lexicon(nlp_scorer_config, word_lists=word_lists)
+        else:
+            _check_lexicon(lexicon, nlp_scorer_config, word_lists)
+        self._stem = _get_stemmer()
+        self._stems: Dict[str, str] = {}
+        self._score_types = nlp_scorer_config.get_config()["score_types"]
+        self._lexicon = lexicon
+        self._token_groups = _TokenGroups(self._stem_token, lexicon)
+        if lexicon.automaton is not None:
+            self._token_symbols = _TokenSymbols(self._stem_token, lexicon.automaton)
+        self._scorers: Dict[str, _Scorer] = {}
+        self._syllables: Optional[_TokenSyllables] = None
+        for score_name in self._score_types:
+            if score_name == NLPScoreType.POLARITY:
+                self._scorers[score_name] = self._polarity_scorer(
+                    self._lexicon.column(NLPScoreType.POSITIVE),
+                    self._lexicon.column(NLPScoreType.NEGATIVE),
+                )
+            elif score_name == NLPScoreType.SENTIMENT:
+                self._scorers[score_name] = self._sentiment_scorer(_get_sentiment_analyzer())
+            elif score_name == NLPScoreType.READABILITY:
+                self._syllables = _TokenSyllables()
+            else:
+                self._scorers[score_name] = self._word_list_scorer(self._lexicon.column(score_name))
+        self._needs_sentences = (
+            NLPScoreType.SENTIMENT in self._scorers or self._syllables is not None
+        )
+
+    @property
+    def score_names(self) -> List[str]:
+        """Gets the names of the scores, in the order of the config."""
+        return list(self._score_types)
+
+    def _stem_token(self, token: str) -> str:
+        """Stems a lowercase token, memoizing the stem."""
+        stemmed = self._stems.get(token)
+        if stemmed is None:
+            stemmed = self._stems[token] = self._stem(token)
+        return stemmed
+
+    @staticmethod
+    def _word_list_scorer(column: int) -> _Scorer:
+        """Scores the fraction of the words of a document in a word list."""
+
+        def score(document: _Document) -> float:
+            if not document.word_count:
+                return 0.0
+            return float(document.lexicon_counts[column]) / document.word_count
+
+        return score
+
+    @staticmethod
+    def _polarity_scorer(positive: int, negative: int) -> _Scorer:
+        """Scores the balance of the positive and the negative words, from -1 to 1."""
+
+        def score(document: _Document) -> float:
+            positives = document.lexicon_counts[positive]
+            negatives = document.lexicon_counts[negative]
+            total = positives + negatives
+            return float(positives - negatives) / total if total else 0.0
+
+        return score
+
+    @staticmethod
+    def _sentiment_scorer(analyzer) -> _Scorer:
+        """Scores the mean VADER compound sentiment of the sentences, from -1 to 1."""
+
+        def score(document: _Document) -> float:
+            if not document.sentences:
+                return 0.0
+            compounds = [
+                analyzer.polarity_scores(sentence)["compound"] for sentence in document.sentences
+            ]
+            return sum(compounds) / len(compounds)
+
+        return score
+
+    def _document(self, text: str) -> _Document:
+        """Tokenizes a document and counts the matches of every word list in one scan."""
+        if not isinstance(text, str) or not text.strip():
+            return _Document([], 0, np.zeros(len(self._lexicon.names)), [])
+        tokens = tokenize(text)
+        groups = np.fromiter(
+            map(self._token_groups.__getitem__, tokens), dtype=np.intp, count=len(tokens)
+        )
+        group_counts = np.bincount(groups, minlength=len(self._lexicon.membership))
+        lexicon_counts = group_counts @ self._lexicon.membership
+        automaton = self._lexicon.automaton
+        if automaton is not None:
+            states = automaton.states([self._token_symbols[token] for token in tokens])
+            state_counts = np.bincount(states, minlength=len(automaton.counts))
+            lexicon_counts += state_counts @ automaton.counts
+        return _Document(
+            tokens,
+            len(tokens) - int(group_counts[_NON_WORD_GROUP]),
+            lexicon_counts,
+            split_sentences(text) if self._needs_sentences else [],
+        )
+
+    def score_batch(self, texts: Iterable[str], index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """Scores a batch of documents, with one column per score type.
+
+        The readability of the whole batch is computed at once by
+        :func:`_readability_table` from the syllable counts of the documents.
+        """
+        rows = []
+        syllables = []
+        sentence_counts = []
+        for text in texts:
+            document = self._document(text)
+            rows.append([scorer(document) for scorer in self._scorers.values()])
+            if self._syllables is not None:
+                syllables.append(self._syllables.count(document.tokens))
+                sentence_counts.append(len(document.sentences))
+        scores = pd.DataFrame(rows, index=index, columns=list(self._scorers), dtype=float)
+        if self._syllables is not None:
+            scores[NLPScoreType.READABILITY] = _readability_table(
+                syllables, np.asarray(sentence_counts, dtype=np.int64), scores.index
+            )["gunning_fog"]
+        return scores[self.score_names]
+
+    def score(self, text: str) -> Dict[str, float]:
+        """Scores one document."""
+        return {
+            score_name: float(value)
+            for score_name, value in self.score_batch([text]).iloc[0].items()
+        }
+
+
+def score_text(
+    text: str,
+    nlp_scorer_config: NLPScorerConfig,
+    word_lists: Optional[WordLists] = None,
+    lexicon: Optional[CompiledLexicon] = None,
+) -> Dict[str, float]:
+    """Computes the NLP scores of one document.
+
+    The document is tokenized with the ``\\w+`` pattern, the tokens without a
+    letter are dropped, and the remaining words are Porter-stemmed, like the
+    entries of the word lists. The scores are:
+
+    - for a score type with a word list, the number of words whose stem is in the
+      word list, plus the number of occurrences of its multi-word entries, such as
+      ``"going concern"``, over the number of words. Overlapping and nested
+      occurrences of the phrases are all counted;
+    - ``polarity``: the positive minus the negative words, over the positive plus
+      the negative words, from the ``positive`` and ``negative`` word lists;
+    - ``sentiment``: the mean VADER compound score of the sentences, which needs
+      the ``vader_lexicon`` resource of nltk;
+    - ``readability``: the Gunning fog index, in which the complex words have at
+      least three syllables.
+
+    Args:
+        text (str): The document to score.
+        nlp_scorer_config (NLPScorerConfig): The config with the score types.
+        word_lists (Mapping[str, Sequence[str]]): The word lists of the default
+            score types configured with an empty word list, such as ``positive`` or
+            ``risk``, by score name (default: None).
+        lexicon (CompiledLexicon): The word lists compiled by
+            :func:`~smjsindustry.finance.lexicon.compile_lexicon` or loaded by
+            :func:`~smjsindustry.finance.lexicon.load_lexicon` (default: None, which
+            compiles the word lists of the config). The lexicon also provides the
+            default word lists that the config and ``word_lists`` leave empty.
+
+    Returns:
+        Dict[str, float]: The scores by score name, in the order of the config.
+
+    Raises:
+        ValueError: if a configured word list is empty and not in ``word_lists`` or
+            ``lexicon``, or if a word list of ``lexicon`` differs from the one of
+            the config.
+        RuntimeError: if nltk, or its VADER lexicon for the sentiment score, is
+            not available.
+    """
+    return _ScoringPipeline(nlp_scorer_config, word_lists, lexicon).score(text)
+
+
+def score_dataframe(
+    df: pd.DataFrame,
+    nlp_scorer_config: NLPScorerConfig,
+    text_column_name: str,
+    word_lists: Optional[WordLists] = None,
+    lexicon: Optional[CompiledLexicon] = None,
+) -> pd.DataFrame:
+    """Computes the NLP scores of the text column of a dataframe without a processing job.
+
+    Args:
+        df (pandas.DataFrame): The dataframe with the documents to score.
+        nlp_scorer_config (NLPScorerConfig): The config with the score types.
+        text_column_name (str): The name of the column with the documents.
+        word_lists (Mapping[str, Sequence[str]]): The word lists of the default
+            score types configured with an empty word list (default: None). See
+            :func:`score_text`.
+        lexicon (CompiledLexicon): The compiled word lists (default: None, which
+            compiles the word lists of the config). See :func:`score_text`.
+
+    Returns:
+        pandas.DataFrame: A copy of ``df`` with one column per score type, named
+        after the score. Missing and empty documents get zero scores.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("score_dataframe requires df to be a pandas.DataFrame.")
+    if text_column_name not in df.columns:
+        raise ValueError(f"Column {text_column_name} is not in the dataframe.")
+    pipeline = _ScoringPipeline(nlp_scorer_config, word_lists, lexicon)
+    scores = pipeline.score_batch(df[text_column_name], df.index)
+    result = df.copy()
+    for score_name in pipeline.score_names:
+        result[score_name] = scores[score_name]
+    logger.info("Scored %d documents with %d score types", len(df), len(pipeline.score_names))
+    return result
+
+
+def score_csv(
+    input_file_path: SummarizerInput,
+    nlp_scorer_config: NLPScorerConfig,
+    text_column_name: str,
+    output_file_name: Optional[SummarizerInput] = None,
+    word_lists: Optional[WordLists] = None,
+    lexicon: Optional[CompiledLexicon] = None,
+) -> pd.DataFrame:
+    """Computes the NLP scores of the text column of a CSV file without a processing job.
+
+    Args:
+        input_file_path (str): The path of the CSV file with the documents.
+        nlp_scorer_config (NLPScorerConfig): The config with the score types.
+        text_column_name (str): The name of the column with the documents.
+        output_file_name (str): An optional path of a CSV file to write the scored
+            rows to (default: None).
+        word_lists (Mapping[str, Sequence[str]]): The word lists of the default
+            score types configured with an empty word list (default: None). See
+            :func:`score_text`.
+        lexicon (CompiledLexicon): The compiled word lists (default: None, which
+            compiles the word lists of the config). See :func:`score_text`.
+
+    Returns:
+        pandas.DataFrame: The rows of the CSV file with the score columns added.
+    """
+    result = score_dataframe(
+        pd.read_csv(input_file_path), nlp_scorer_config, text_column_name, word_lists, lexicon
+    )
+    if output_file_name is not None:
+        result.to_csv(output_file_name, index=False)
+    return result
@@ -0,0 +1,1025 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""The module that runs the summarizers in the current process.
+
+The functions in this module compute the same extractive summaries as the
+:class:`~smjsindustry.finance.processor.Summarizer` processing job, without
+starting a SageMaker job, so small and medium batches can be summarized directly
+from a dataframe or a CSV file.
+"""
+
+import logging
+import math
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from smjsindustry.finance.embeddings import (
+    Doc2VecEmbedder,
+    EmbeddingCache,
+    SentenceEmbedder,
+)
+from smjsindustry.finance.kmedoids import clara, kmedoids, pairwise_distances
+from smjsindustry.finance.processor_config import (
+    JaccardSummarizerConfig,
+    KMedoidsSummarizerConfig,
+)
+
+try:
+    from nltk.stem import PorterStemmer  # type: ignore[import]
+except ImportError:  # pragma: no cover - nltk is an optional dependency
+    PorterStemmer = None
+
+try:
+    from scipy import sparse  # type: ignore[import]
+except ImportError:  # pragma: no cover - scipy is an optional dependency
+    sparse = None
+
+logger = logging.getLogger(__name__)
+
+
+ENGLISH_STOP_WORDS: FrozenSet[str] = frozenset(
+    """
+    a about above after again against ain all am an and any are aren aren't as at be
+    because been before being below between both but by can couldn couldn't d did didn
+    didn't do does doesn doesn't doing don don't down during each few for from further
+    had hadn hadn't has hasn hasn't have haven haven't having he her here hers herself
+    him himself his how i if in into is isn isn't it it's its itself just ll m ma me
+    mightn mightn't more most mustn mustn't my myself needn needn't no nor not now o of
+    off on once only or other our ours ourselves out over own re s same shan shan't she
+    she's should should've shouldn shouldn't so some such t than that that'll the their
+    theirs them themselves then there these they this those through to too under until
+    up ve very was wasn wasn't we were weren weren't what when where which while who whom
+    why will with won won't wouldn wouldn't y you you'd you'll you're you've your yours
+    yourself yourselves
+    """.split()
+)
+
+_SENTENCE_BOUNDARY = re.compile(
+    r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+(?=[\"'(\[]?[A-Z0-9])"
+)
+_TOKEN_PATTERN = re.compile(r"\w+")
+# Like the regexp_tokenize step of the summarizer job, numbers and underscores are
+# not part of the tokens of a sentence.
+_SUMMARY_TOKEN_PATTERN = re.compile(r"[^\W\d_]+")
+_SIMILARITY_BLOCK_SIZE = 1024
+_MINHASH_PRIME = (1 << 31) - 1
+_MINHASH_SEED = 0
+_BAND_KEY_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_CHUNKS_PER_WORKER = 4
+_KMEDOIDS_SEED = 0
+_RESUME_SCAN_BLOCK_SIZE = 1 << 24
+
+SummarizerInput = Union[str, "os.PathLike[str]"]
+SummarizerConfig = Union[JaccardSummarizerConfig, KMedoidsSummarizerConfig]
+
+
+def split_sentences(text: str) -> List[str]:
+    """Splits a document into sentences.
+
+    A sentence ends at a ``.``, ``!`` or ``?``, optionally followed by closing quotes
+    or brackets, when the next non-space character starts a new sentence.
+
+    Args:
+        text (str): The document to split.
+
+    Returns:
+        List[str]: The non-empty sentences of the document, in document order.
+    """
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def tokenize(sentence: str) -> List[str]:
+    """Splits a sentence into lower-case word tokens with the ``\\w+`` pattern.
+
+    Args:
+        sentence (str): The sentence to tokenize.
+
+    Returns:
+        List[str]: The tokens of the sentence.
+    """
+    return _TOKEN_PATTERN.findall(sentence.lower())
+
+
+def _summary_tokens(sentence: str) -> List[str]:
+    """Splits a sentence into the lower-case runs of letters the summarizers compare."""
+    return _SUMMARY_TOKEN_PATTERN.findall(sentence.lower())
+
+
+def _get_stemmer() -> Callable[[str], str]:
+    """Returns the Porter stemmer used by the remote summarizer."""
+    if PorterStemmer is None:
+        raise RuntimeError(
+            "nltk is required to run the summarizers locally. "
+            "Install it with: pip install 'smjsindustry[nlp]'"
+        )
+    return PorterStemmer().stem
+
+
+def _incidence_matrix(token_sets: List[Set[str]]) -> "sparse.csr_matrix":
+    """Encodes each sentence as a binary row of the tokens it contains."""
+    if sparse is None:
+        raise RuntimeError(
+            "scipy is required to run the summarizers locally. "
+            "Install it with: pip install 'smjsindustry[nlp]'"
+        )
+    columns: Dict[str, int] = {}
+    indices = [columns.setdefault(token, len(columns)) for tokens in token_sets for token in tokens]
+    indptr = np.zeros(len(token_sets) + 1, dtype=np.int64)
+    np.cumsum([len(tokens) for tokens in token_sets], out=indptr[1:])
+    return sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), np.asarray(indices, dtype=np.int64), indptr),
+        shape=(len(token_sets), len(columns)),
+    )
+
+
+def _jaccard_blocks(
+    token_sets: List[Set[str]],
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yields the non-zero off-diagonal Jaccard similarities, one block of rows at a time.
+
+    The intersections of a block of sentences with every sentence are the non-zeros
+    of one sparse product of incidence matrices, and the unions follow from the row
+    cardinalities, so each block only holds the pairs that share a token.
+    """
+    incidence = _incidence_matrix(token_sets)
+    cardinality = np.diff(incidence.indptr)
+    transposed = incidence.T.tocsc()
+    for start in range(0, incidence.shape[0], _SIMILARITY_BLOCK_SIZE):
+        product = (incidence[start : start + _SIMILARITY_BLOCK_SIZE] @ transposed).tocoo()
+        rows = product.row.astype(np.int64) + start
+        off_diagonal = rows != product.col
+        rows, cols = rows[off_diagonal], product.col[off_diagonal].astype(np.int64)
+        intersections = product.data[off_diagonal]
+        unions = cardinality[rows] + cardinality[cols] - intersections
+        yield start, rows - start, cols, intersections / unions
+
+
+def jaccard_similarity(token_sets: List[Set[str]]) -> "sparse.csr_matrix":
+    """Computes the pairwise Jaccard similarity matrix of the sentences.
+
+    Args:
+        token_sets (List[Set[str]]): The set of normalized tokens of each sentence.
+
+    Returns:
+        scipy.sparse.csr_matrix: The symmetric similarity matrix with a zero diagonal.
+        Only the pairs of sentences that share a token are stored.
+    """
+    count = len(token_sets)
+    blocks = [
+        (rows + start, cols, similarity)
+        for start, rows, cols, similarity in _jaccard_blocks(token_sets)
+    ]
+    if not blocks:
+        return sparse.csr_matrix((count, count))
+    rows, cols, similarity = (np.concatenate(parts) for parts in zip(*blocks))
+    return sparse.csr_matrix((similarity, (rows, cols)), shape=(count, count))
+
+
+def jaccard_scores(token_sets: List[Set[str]]) -> np.ndarray:
+    """Scores sentences by their Jaccard similarity to the other sentences.
+
+    The score of a sentence is the row sum of the pairwise Jaccard similarity matrix
+    without the diagonal, divided by the number of other sentences, so it is the
+    mean similarity of the sentence to the rest of the document, between 0 and 1.
+    The row sums are accumulated block by block, without building the matrix.
+
+    Args:
+        token_sets (List[Set[str]]): The set of normalized tokens of each sentence.
+
+    Returns:
+        numpy.ndarray: The score of each sentence.
+    """
+    count = len(token_sets)
+    scores = np.zeros(count)
+    if count < 2:
+        return scores
+    for start, rows, _, similarity in _jaccard_blocks(token_sets):
+        block = scores[start : start + _SIMILARITY_BLOCK_SIZE]
+        block += np.bincount(rows, weights=similarity, minlength=len(block))
+    return scores / (count - 1)
+
+
+def _minhash_signatures(token_sets: List[Set[str]], num_permutations: int) -> np.ndarray:
+    """Computes the MinHash signature of each sentence.
+
+    Every token is hashed by ``num_permutations`` universal hash functions
+    ``(a * x + b) mod p`` of a seeded random token number ``x``, and each signature
+    component is the minimum of one hash function over the tokens of the sentence.
+    The minima are folded in one token position at a time, over the sentences
+    sorted by decreasing length. Sentences without tokens get ``p`` in every component.
+    """
+    incidence = _incidence_matrix(token_sets)
+    rng = np.random.default_rng(_MINHASH_SEED)
+    token_numbers = rng.integers(0, _MINHASH_PRIME, size=incidence.shape[1], dtype=np.int64)
+    a = rng.integers(1, _MINHASH_PRIME, size=(num_permutations, 1), dtype=np.int64)
+    b = rng.integers(0, _MINHASH_PRIME, size=(num_permutations, 1), dtype=np.int64)
+    hashes = ((a * token_numbers % _MINHASH_PRIME + b) % _MINHASH_PRIME).T.astype(np.int32)
+    lengths = np.diff(incidence.indptr)
+    order = np.argsort(-lengths, kind="stable")
+    starts, lengths = incidence.indptr[:-1][order], lengths[order]
+    minima = np.full((len(token_sets), num_permutations), _MINHASH_PRIME, dtype=np.int32)
+    for position in range(lengths.max(initial=0)):
+        count = np.searchsorted(-lengths, -position, side="left")
+        tokens = incidence.indices[starts[:count] + position]
+        np.minimum(minima[:count], hashes[tokens], out=minima[:count])
+    signatures = np.empty_like(minima)
+    signatures[order] = minima
+    return signatures
+
+
+def _band_keys(signatures: np.ndarray, num_bands: int) -> np.ndarray:
+    """Combines the signature components of each LSH band into one bucket key per band."""
+    keys = np.zeros((len(signatures), num_bands), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for column, band in enumerate(np.split(signatures.astype(np.uint64), num_bands, axis=1)):
+            key = keys[:, column]
+            for component in band.T:
+                key *= _BAND_KEY_MULTIPLIER
+                key += component
+    return keys
+
+
+def minhash_jaccard_scores(
+    token_sets: List[Set[str]], num_permutations: int = 128, num_bands: int = 128
+) -> np.ndarray:
+    """Estimates the Jaccard scores of the sentences with MinHash and LSH buckets.
+
+    The MinHash signatures are split into ``num_bands`` bands, and each band hashes
+    the sentences into buckets. The neighbors of a sentence in a band are the other
+    sentences in its bucket, and its score is its mean number of neighbors per band,
+    normalized like :func:`jaccard_scores`. Two sentences share a one-row bucket with
+    a probability equal to their Jaccard similarity, so with one row per band (the
+    default) the scores are unbiased estimates of the exact scores, with an error
+    that shrinks with ``num_permutations``. Wider bands only count near-duplicate
+    sentences as neighbors. The scores take linear time in the number of sentences.
+
+    Args:
+        token_sets (List[Set[str]]): The set of normalized tokens of each sentence.
+        num_permutations (int): The length of the MinHash signatures (default: 128).
+        num_bands (int): The number of LSH bands, which must divide
+            ``num_permutations`` (default: 128).
+
+    Returns:
+        numpy.ndarray: The estimated score of each sentence.
+    """
+    count = len(token_sets)
+    scores = np.zeros(count)
+    if count < 2:
+        return scores
+    signatures = _minhash_signatures(token_sets, num_permutations)
+    non_empty = np.flatnonzero(signatures[:, 0] < _MINHASH_PRIME)
+    for key in _band_keys(signatures[non_empty], num_bands).T:
+        _, buckets, sizes = np.unique(key, return_inverse=True, return_counts=True)
+        scores[non_empty] += sizes[buckets] - 1
+    return scores / (num_bands * (count - 1))
+
+
+def _top_ranked(scores: np.ndarray, size: int) -> np.ndarray:
+    """Returns the positions of the ``size`` highest scores, ranked.
+
+    The scores are ranked by descending value, ties by position. Only the ``size``
+    selected scores are sorted: the rest are split off by a linear-time partition
+    around the score at the boundary.
+    """
+    count = len(scores)
+    if size >= count:
+        return np.argsort(-scores, kind="stable")
+    if size <= 0:
+        return np.zeros(0, dtype=np.int64)
+    threshold = np.partition(scores, count - size)[count - size]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[: size - len(above)]
+    selected = np.concatenate([above, ties])
+    return selected[np.argsort(-scores[selected], kind="stable")]
+
+
+def _select_within_budget(
+    scores: np.ndarray, sentence_tokens: List[List[str]], max_tokens: int
+) -> np.ndarray:
+    """Selects the top-ranked sentences that fit in ``max_tokens`` tokens.
+
+    The ranking is extended by doubling its length until the running token count
+    exceeds the budget, so a small budget only ranks and counts the tokens of a
+    few more sentences than it selects.
+    """
+    count = len(scores)
+    token_total = sum(len(tokens) for tokens in sentence_tokens[: min(count, 64)])
+    mean_tokens = max(1, token_total // max(1, min(count, 64)))
+    size = min(count, max_tokens // mean_tokens + 1)
+    while True:
+        ranking = _top_ranked(scores, size)
+        running = np.cumsum(
+            np.fromiter((len(sentence_tokens[position]) for position in ranking), np.int64, size)
+        )
+        if size == count or (size and running[-1] > max_tokens):
+            return ranking[: np.searchsorted(running, max_tokens, side="right")]
+        size = min(count, max(1, 2 * size))
+
+
+def _select_sentences(
+    scores: np.ndarray,
+    sentence_tokens: List[List[str]],
+    summarizer_config: JaccardSummarizerConfig,
+) -> List[int]:
+    """Selects the positions of the summary sentences from the sentence scores.
+
+    Sentences are ranked by descending score, ties by document order. The ranking is
+    cut after ``summary_size`` sentences, after ``summary_percentage`` of the sentences
+    (at least one), before the sentence that would exceed ``max_tokens``, or before
+    the first sentence scoring below ``cutoff``. The full ranking is never sorted:
+    the sizes are partial selections, the token budget stops once it is spent, and
+    the cutoff is a filter in document order.
+    """
+    if summarizer_config.summary_size:
+        selected = _top_ranked(scores, summarizer_config.summary_size)
+    elif summarizer_config.summary_percentage:
+        size = max(1, math.floor(len(scores) * summarizer_config.summary_percentage))
+        selected = _top_ranked(scores, size)
+    elif summarizer_config.max_tokens:
+        selected = _select_within_budget(scores, sentence_tokens, summarizer_config.max_tokens)
+    else:
+        return np.flatnonzero(scores >= summarizer_config.cutoff).tolist()
+    return sorted(selected.tolist())
+
+
+class _SummaryPipeline(ABC):
+    """The text processing of a summarizer, shared by a batch of documents."""
+
+    def summarize(self, text: str) -> str:
+        """Summarizes one document."""
+        if not isinstance(text, str) or not text.strip():
+            return ""
+        sentences = split_sentences(text)
+        sentence_tokens = [_summary_tokens(sentence) for sentence in sentences]
+        selected = self.select(sentences, sentence_tokens)
+        return " ".join(sentences[position] for position in selected)
+
+    @abstractmethod
+    def select(self, sentences: List[str], sentence_tokens: List[List[str]]) -> List[int]:
+        """Returns the positions of the summary sentences, in document order."""
+
+    def timed_summarize(self, text: str) -> Tuple[str, float]:
+        """Summarizes one document and measures the duration in seconds."""
+        start = time.perf_counter()
+        summary = self.summarize(text)
+        return summary, time.perf_counter() - start
+
+
+class _JaccardPipeline(_SummaryPipeline):
+    """The text processing of the Jaccard summarizer.
+
+    The stems of the tokens are memoized across all the documents of the batch, and
+    the stop words are removed once per distinct token of a document.
+    """
+
+    def __init__(self, summarizer_config: JaccardSummarizerConfig):
+        """Initializes a pipeline for the given summarizer config."""
+        self._config = summarizer_config
+        self._stem = _get_stemmer()
+        self._stems: Dict[str, str] = {}
+        self._vocabulary_stems: Optional[FrozenSet[str]] = None
+        if summarizer_config.vocabulary is not None:
+            self._vocabulary_stems = frozenset(
+                self._stem(word.lower()) for word in summarizer_config.vocabulary
+            )
+
+    def token_sets(self, sentence_tokens: List[List[str]]) -> List[Set[str]]:
+        """Removes stop words and stems the tokens of each sentence.
+
+        With a vocabulary, only the tokens whose stem is the stem of a vocabulary
+        word are kept.
+        """
+        stems = self._stems
+        stem_of = {}
+        for token in set().union(*sentence_tokens).difference(ENGLISH_STOP_WORDS):
+            stemmed = stems.get(token)
+            if stemmed is None:
+                stemmed = stems[token] = self._stem(token)
+            if self._vocabulary_stems is None or stemmed in self._vocabulary_stems:
+                stem_of[token] = stemmed
+        return [
+            {stem_of[token] for token in tokens if token in stem_of} for tokens in sentence_tokens
+        ]
+
+    def select(self, sentences: List[str], sentence_tokens: List[List[str]]) -> List[int]:
+        """Selects the sentences with the highest Jaccard scores."""
+        summarizer_config = self._config
+        token_sets = self.token_sets(sentence_tokens)
+        if summarizer_config.approximate:
+            scores = minhash_jaccard_scores(
+                token_sets, summarizer_config.num_permutations, summarizer_config.num_bands
+            )
+        else:
+            scores = jaccard_scores(token_sets)
+        return _select_sentences(scores, sentence_tokens, summarizer_config)
+
+
+class _KMedoidsPipeline(_SummaryPipeline):
+    """The text processing of the K-medoids summarizer.
+
+    The sentences of each document are embedded, through the embedding cache when
+    there is one, and the sentences at the medoids of ``summary_size`` clusters
+    form the summary.
+    """
+
+    def __init__(
+        self,
+        summarizer_config: KMedoidsSummarizerConfig,
+        embedder: Optional[SentenceEmbedder] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ):
+        """Initializes a pipeline for the given summarizer config."""
+        if embedder is None:
+            embedder = Doc2VecEmbedder.from_config(summarizer_config)
+        if not isinstance(embedder, SentenceEmbedder):
+            raise TypeError("The K-medoids summarizer requires embedder to be a SentenceEmbedder.")
+        if embedding_cache is not None and not isinstance(embedding_cache, EmbeddingCache):
+            raise TypeError(
+                "The K-medoids summarizer requires embedding_cache to be an EmbeddingCache."
+            )
+        self._config = summarizer_config
+        self._embedder = embedder
+        self._embedding_cache = embedding_cache
+
+    def embed(self, sentences: List[str], sentence_tokens: List[List[str]]) -> np.ndarray:
+        """Embeds the sentences of one document."""
+        if self._embedding_cache is None:
+            return self._embedder.embed(sentences, sentence_tokens)
+        return self._embedding_cache.embed(self._embedder, sentences, sentence_tokens)
+
+    def select(self, sentences: List[str], sentence_tokens: List[List[str]]) -> List[int]:
+        """Selects the sentences at the cluster medoids."""
+        summarizer_config = self._config
+        if len(sentence_tokens) <= summarizer_config.summary_size:
+            return list(range(len(sentence_tokens)))
+        if not summarizer_config.summary_size:
+            return []
+        vectors = self.embed(sentences, sentence_tokens)
+        if summarizer_config.method == "clara":
+            result = clara(
+                vectors,
+                summarizer_config.summary_size,
+                metric=summarizer_config.metric,
+                init=summarizer_config.init,
+                sample_size=summarizer_config.sample_size,
+                n_samples=summarizer_config.n_samples,
+                seed=_KMEDOIDS_SEED,
+            )
+        else:
+            result = kmedoids(
+                pairwise_distances(vectors, summarizer_config.metric),
+                summarizer_config.summary_size,
+                init=summarizer_config.init,
+                method=summarizer_config.method,
+                seed=_KMEDOIDS_SEED,
+            )
+        return sorted(result.medoids.tolist())
+
+
+def _make_pipeline(
+    summarizer_config: SummarizerConfig,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> _SummaryPipeline:
+    """Builds the pipeline of the summarizer that the config selects."""
+    if isinstance(summarizer_config, JaccardSummarizerConfig):
+        if embedder is not None or embedding_cache is not None:
+            raise ValueError(
+                "embedder and embedding_cache are only used by the K-medoids summarizer."
+            )
+        return _JaccardPipeline(summarizer_config)
+    if isinstance(summarizer_config, KMedoidsSummarizerConfig):
+        return _KMedoidsPipeline(summarizer_config, embedder, embedding_cache)
+    raise TypeError(
+        "The local summarizer requires summarizer_config to be a "
+        "JaccardSummarizerConfig or a KMedoidsSummarizerConfig."
+    )
+
+
+class SummaryBatch(NamedTuple):
+    """The result of a :func:`summarize_batch` run.
+
+    Attributes:
+        summaries (pandas.Series): The summary of each document.
+        seconds (pandas.Series): The duration of the summarization of each document.
+    """
+
+    summaries: pd.Series
+    seconds: pd.Series
+
+
+def summarize_text(
+    text: str,
+    summarizer_config: SummarizerConfig,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> str:
+    """Summarizes one document with an extractive summarizer.
+
+    The document is split into sentences, and each sentence is split into
+    lower-case runs of letters, so that numbers such as ``2021`` are dropped like
+    in the summarizer job.
+
+    With a :class:`JaccardSummarizerConfig`, English stop words are removed and the
+    remaining tokens are Porter-stemmed. Each sentence is scored by the row sum of
+    the pairwise Jaccard similarity matrix, and the top-ranked sentences form the
+    summary. With ``approximate`` set in the config, the scores are estimated by
+    :func:`minhash_jaccard_scores` instead.
+
+    With a :class:`KMedoidsSummarizerConfig`, the sentences are embedded, by
+    default with a Doc2Vec model trained on the document, and the ``summary_size``
+    sentences at the medoids of the clusters found by
+    :func:`~smjsindustry.finance.kmedoids.kmedoids` form the summary. With the
+    ``'clara'`` method, :func:`~smjsindustry.finance.kmedoids.clara` clusters
+    samples of the sentences, which bounds the memory use on long documents.
+
+    Args:
+        text (str): The document to summarize.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            config that selects the summarizer and sets the size of the summary.
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+
+    Returns:
+        str: The summary sentences in document order, joined by spaces.
+    """
+    return _make_pipeline(summarizer_config, embedder, embedding_cache).summarize(text)
+
+
+_worker_pipeline: Optional[_SummaryPipeline] = None
+
+
+def _initialize_worker(
+    summarizer_config: SummarizerConfig,
+    embedder: Optional[SentenceEmbedder],
+    embedding_cache: Optional[EmbeddingCache],
+) -> None:
+    """Builds the summary pipeline of a worker process once, before its first chunk.
+
+    The stop words, the stemmer and the stem memo are then reused by every chunk the
+    worker summarizes, instead of being pickled with each task.
+    """
+    global _worker_pipeline
+    _worker_pipeline = _make_pipeline(summarizer_config, embedder, embedding_cache)
+
+
+def _summarize_chunk_in_worker(texts: List[str]) -> List[Tuple[str, float]]:
+    """Summarizes a chunk of documents with the pipeline of the worker process."""
+    if _worker_pipeline is None:
+        raise RuntimeError("The summary pipeline of the worker process is not initialized.")
+    return [_worker_pipeline.timed_summarize(text) for text in texts]
+
+
+def _check_parallelism(function_name: str, n_jobs: int, chunk_size: Optional[int]) -> None:
+    """Validates the worker count and the chunk size of a summarization call."""
+    if not isinstance(n_jobs, int) or n_jobs < 1:
+        raise ValueError(f"{function_name} requires n_jobs to be a positive integer.")
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(f"{function_name} requires chunk_size to be a positive integer.")
+
+
+def _make_executor(
+    n_jobs: int,
+    summarizer_config: SummarizerConfig,
+    embedder: Optional[SentenceEmbedder],
+    embedding_cache: Optional[EmbeddingCache],
+) -> ProcessPoolExecutor:
+    """Starts a pool of worker processes that each build the summary pipeline once."""
+    return ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_initialize_worker,
+        initargs=(summarizer_config, embedder, embedding_cache),
+    )
+
+
+def _summarize_texts(
+    pipeline: _SummaryPipeline,
+    executor: Optional[ProcessPoolExecutor],
+    texts: List[str],
+    n_jobs: int,
+    chunk_size: Optional[int],
+) -> List[Tuple[str, float]]:
+    """Summarizes documents in the current process, or in contiguous chunks on a pool."""
+    if executor is None or len(texts) < 2:
+        return [pipeline.timed_summarize(text) for text in texts]
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(texts) / (n_jobs * _CHUNKS_PER_WORKER)))
+    chunks = [texts[start : start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    return [
+        result
+        for chunk_results in executor.map(_summarize_chunk_in_worker, chunks)
+        for result in chunk_results
+    ]
+
+
+def summarize_batch(
+    texts: Union[pd.Series, Iterable[str]],
+    summarizer_config: SummarizerConfig,
+    n_jobs: int = 1,
+    chunk_size: Optional[int] = None,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> SummaryBatch:
+    """Summarizes many documents with one shared text processing pipeline.
+
+    The documents share the memoized token stems, so each distinct word of the
+    corpus is stemmed once per process. With more than one job, the documents are
+    sharded into contiguous chunks that a pool of worker processes summarizes; each
+    worker builds its pipeline when it starts, and the chunks are reassembled in
+    their original order.
+
+    Args:
+        texts (pandas.Series or Iterable[str]): The documents to summarize.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            summarizer config.
+        n_jobs (int): The number of worker processes that summarize the documents
+            (default: 1, which summarizes them in the current process).
+        chunk_size (int): The number of documents sent to a worker in one task
+            (default: None, which splits the documents into four chunks per worker).
+            Larger chunks lower the inter-process overhead, smaller ones balance
+            documents of uneven length better.
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+
+    Returns:
+        SummaryBatch: The summaries and the summarization time of each document, in
+        the order of ``texts`` and with its index when it is a series. Missing and
+        empty documents get empty summaries.
+    """
+    _check_parallelism("summarize_batch", n_jobs, chunk_size)
+    index = texts.index if isinstance(texts, pd.Series) else None
+    texts = list(texts)
+    pipeline = _make_pipeline(summarizer_config, embedder, embedding_cache)
+    if n_jobs == 1 or len(texts) < 2:
+        results = _summarize_texts(pipeline, None, texts, n_jobs, chunk_size)
+    else:
+        with _make_executor(n_jobs, summarizer_config, embedder, embedding_cache) as executor:
+            results = _summarize_texts(pipeline, executor, texts, n_jobs, chunk_size)
+    summaries = [summary for summary, _ in results]
+    seconds = [elapsed for _, elapsed in results]
+    logger.info("Summarized %d documents in %.3f seconds", len(texts), sum(seconds))
+    return SummaryBatch(
+        pd.Series(summaries, index=index, dtype=object),
+        pd.Series(seconds, index=index, dtype=np.float64),
+    )
+
+
+def summarize_dataframe(
+    df: pd.DataFrame,
+    summarizer_config: SummarizerConfig,
+    text_column_name: str,
+    new_summary_column_name: str = "summary",
+    n_jobs: int = 1,
+    chunk_size: Optional[int] = None,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> pd.DataFrame:
+    """Summarizes the text column of a dataframe without a processing job.
+
+    Args:
+        df (pandas.DataFrame): The dataframe with the documents to summarize.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            summarizer config.
+        text_column_name (str): The name of the column with the documents.
+        new_summary_column_name (str): The name of the column that stores the
+            summaries (default: ``"summary"``).
+        n_jobs (int): The number of worker processes the rows are sharded across
+            (default: 1, which summarizes them in the current process).
+        chunk_size (int): The number of rows sent to a worker in one task
+            (default: None, four chunks per worker). See :func:`summarize_batch`.
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+
+    Returns:
+        pandas.DataFrame: A copy of ``df`` with the summary column added. Missing
+        and empty documents get empty summaries.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("summarize_dataframe requires df to be a pandas.DataFrame.")
+    if text_column_name not in df.columns:
+        raise ValueError(f"Column {text_column_name} is not in the dataframe.")
+    _check_parallelism("summarize_dataframe", n_jobs, chunk_size)
+    summaries = summarize_batch(
+        df[text_column_name],
+        summarizer_config,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        embedder=embedder,
+        embedding_cache=embedding_cache,
+    ).summaries
+    result = df.copy()
+    result[new_summary_column_name] = summaries
+    return result
+
+
+def summarize_csv(
+    input_file_path: SummarizerInput,
+    summarizer_config: SummarizerConfig,
+    text_column_name: str,
+    output_file_name: Optional[SummarizerInput] = None,
+    new_summary_column_name: str = "summary",
+    n_jobs: int = 1,
+    chunk_size: Optional[int] = None,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+) -> pd.DataFrame:
+    """Summarizes the text column of a CSV file without a processing job.
+
+    The whole file is loaded in memory; :func:`summarize_csv_streaming` summarizes
+    files that do not fit in memory.
+
+    Args:
+        input_file_path (str): The path of the CSV file with the documents.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            summarizer config.
+        text_column_name (str): The name of the column with the documents.
+        output_file_name (str): An optional path of a CSV file to write the
+            summarized rows to (default: None).
+        new_summary_column_name (str): The name of the column that stores the
+            summaries (default: ``"summary"``).
+        n_jobs (int): The number of worker processes the rows are sharded across
+            (default: 1, which summarizes them in the current process).
+        chunk_size (int): The number of rows sent to a worker in one task
+            (default: None, four chunks per worker). See :func:`summarize_batch`.
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+
+    Returns:
+        pandas.DataFrame: The rows of the CSV file with the summary column added.
+    """
+    _check_parallelism("summarize_csv", n_jobs, chunk_size)
+    df = pd.read_csv(input_file_path)
+    result = summarize_dataframe(
+        df,
+        summarizer_config,
+        text_column_name,
+        new_summary_column_name,
+        n_jobs,
+        chunk_size,
+        embedder,
+        embedding_cache,
+    )
+    if output_file_name is not None:
+        result.to_csv(output_file_name, index=False)
+    return result
+
+
+class SummaryStreamStats(NamedTuple):
+    """Statistics of a :func:`summarize_csv_streaming` run.
+
+    Attributes:
+        chunks (int): The number of chunks that were summarized.
+        rows (int): The number of rows that were summarized and written.
+        resumed_rows (int): The number of rows already in the output file, which
+            were skipped.
+        elapsed_seconds (float): The wall-clock duration of the run.
+    """
+
+    chunks: int
+    rows: int
+    resumed_rows: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Gets the number of rows summarized per second."""
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def iter_summarized_csv(
+    input_file_path: SummarizerInput,
+    summarizer_config: SummarizerConfig,
+    text_column_name: str,
+    new_summary_column_name: str = "summary",
+    chunksize: int = 1000,
+    skip_rows: int = 0,
+    n_jobs: int = 1,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+    read_csv_kwargs: Optional[Dict[str, Any]] = None,
+) -> Iterator[pd.DataFrame]:
+    """Lazily summarizes the text column of a CSV file, one chunk of rows at a time.
+
+    The next chunk is read only after the previous one was consumed, so memory is
+    bounded by one chunk. With more than one job, one pool of worker processes
+    summarizes every chunk.
+
+    Args:
+        input_file_path (str): The path of the CSV file with the documents.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            summarizer config.
+        text_column_name (str): The name of the column with the documents.
+        new_summary_column_name (str): The name of the column that stores the
+            summaries (default: ``"summary"``).
+        chunksize (int): The number of rows read per chunk (default: 1000).
+        skip_rows (int): The number of leading rows to read past without summarizing
+            them, for example the rows of an earlier, interrupted run (default: 0).
+        n_jobs (int): The number of worker processes each chunk is sharded across
+            (default: 1, which summarizes the rows in the current process).
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+        read_csv_kwargs (Dict[str, Any]): Extra arguments passed to
+            ``pandas.read_csv``, such as ``dtype`` (default: None).
+
+    Yields:
+        pandas.DataFrame: The rows of each chunk with the summary column added.
+    """
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        raise ValueError("iter_summarized_csv requires chunksize to be a positive integer.")
+    if not isinstance(skip_rows, int) or skip_rows < 0:
+        raise ValueError("iter_summarized_csv requires skip_rows to be a non-negative integer.")
+    _check_parallelism("iter_summarized_csv", n_jobs, None)
+    pipeline = _make_pipeline(summarizer_config, embedder, embedding_cache)
+    executor = None
+    try:
+        if n_jobs > 1:
+            executor = _make_executor(n_jobs, summarizer_config, embedder, embedding_cache)
+        with pd.read_csv(input_file_path, chunksize=chunksize, **(read_csv_kwargs or {})) as reader:
+            for chunk in reader:
+                if text_column_name not in chunk.columns:
+                    raise ValueError(f"Column {text_column_name} is not in the CSV file.")
+                if skip_rows >= len(chunk):
+                    skip_rows -= len(chunk)
+                    continue
+                chunk = chunk.iloc[skip_rows:].copy()
+                skip_rows = 0
+                results = _summarize_texts(
+                    pipeline, executor, chunk[text_column_name].tolist(), n_jobs, None
+                )
+                chunk[new_summary_column_name] = [summary for summary, _ in results]
+                yield chunk
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _complete_csv_records(path: SummarizerInput) -> Tuple[int, int]:
+    """Counts the complete records of a CSV file, including its header.
+
+    A record is complete when it ends with a newline outside of a quoted field.
+    Returns the number of complete records and their size in bytes, so a record cut
+    short by an interrupted write can be truncated.
+    """
+    if not os.path.exists(path):
+        return 0, 0
+    records = end = offset = 0
+    quoted = False
+    with open(path, "rb") as stream:
+        while True:
+            block = np.frombuffer(stream.read(_RESUME_SCAN_BLOCK_SIZE), dtype=np.uint8)
+            if not len(block):
+                break
+            # Escaped quotes come in pairs, so the parity of the quotes seen so far
+            # tells whether a newline is inside a quoted field.
+            inside = (np.cumsum(block == ord('"')) % 2).astype(bool) ^ quoted
+            newlines = np.flatnonzero((block == ord("\n")) & ~inside)
+            if len(newlines):
+                records += len(newlines)
+                end = offset + int(newlines[-1]) + 1
+            quoted = bool(inside[-1])
+            offset += len(block)
+    return records, end
+
+
+def summarize_csv_streaming(
+    input_file_path: SummarizerInput,
+    summarizer_config: SummarizerConfig,
+    text_column_name: str,
+    output_file_name: SummarizerInput,
+    new_summary_column_name: str = "summary",
+    chunksize: int = 1000,
+    resume: bool = True,
+    n_jobs: int = 1,
+    embedder: Optional[SentenceEmbedder] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+    read_csv_kwargs: Optional[Dict[str, Any]] = None,
+) -> SummaryStreamStats:
+    """Summarizes a CSV file that does not fit in memory into another CSV file.
+
+    The rows are read and summarized chunk by chunk by :func:`iter_summarized_csv`,
+    and each chunk is appended to the output file and flushed to disk before the
+    next one is read, so memory stays bounded by one chunk and the written rows
+    survive a crash. With ``resume``, the rows already in the output file are
+    skipped, and a last row cut short by the crash is rewritten.
+
+    Args:
+        input_file_path (str): The path of the CSV file with the documents.
+        summarizer_config (JaccardSummarizerConfig or KMedoidsSummarizerConfig): The
+            summarizer config.
+        text_column_name (str): The name of the column with the documents.
+        output_file_name (str): The path of the CSV file the summarized rows are
+            appended to.
+        new_summary_column_name (str): The name of the column that stores the
+            summaries (default: ``"summary"``).
+        chunksize (int): The number of rows read, summarized and written per chunk
+            (default: 1000).
+        resume (bool): Whether to continue after the rows of an existing output
+            file, instead of overwriting it (default: True).
+        n_jobs (int): The number of worker processes each chunk is sharded across
+            (default: 1, which summarizes the rows in the current process).
+        embedder (SentenceEmbedder): The sentence embedder of the K-medoids
+            summarizer (default: None, a
+            :class:`~smjsindustry.finance.embeddings.Doc2VecEmbedder` with the
+            parameters of the config).
+        embedding_cache (EmbeddingCache): An optional on-disk cache of the sentence
+            vectors of the K-medoids summarizer (default: None).
+        read_csv_kwargs (Dict[str, Any]): Extra arguments passed to
+            ``pandas.read_csv``, such as ``dtype`` (default: None).
+
+    Returns:
+        SummaryStreamStats: The numbers of chunks and rows, and the throughput.
+    """
+    if not isinstance(resume, bool):
+        raise TypeError("summarize_csv_streaming requires resume to be a boolean.")
+    start = time.perf_counter()
+    records, end = _complete_csv_records(output_file_name) if resume else (0, 0)
+    resumed_rows = max(records - 1, 0)
+    header = records == 0
+    chunks = rows = 0
+    with open(output_file_name, "r+b" if records else "wb") as stream:
+        stream.truncate(end)
+        stream.seek(end)
+        for chunk in iter_summarized_csv(
+            input_file_path,
+            summarizer_config,
+            text_column_name,
+            new_summary_column_name,
+            chunksize,
+            resumed_rows,
+            n_jobs,
+            embedder,
+            embedding_cache,
+            read_csv_kwargs,
+        ):
+            stream.write(chunk.to_csv(index=False, header=header, lineterminator="\n").encode())
+            stream.flush()
+            os.fsync(stream.fileno())
+            header = False
+            chunks += 1
+            rows += len(chunk)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                "Summarized chunk %d: %d rows, %.1f rows/sec.",
+                chunks,
+                resumed_rows + rows,
+                rows / elapsed if elapsed else 0.0,
+            )
+    stats = SummaryStreamStats(chunks, rows, resumed_rows, time.perf_counter() - start)
+    logger.info(
+        "Summarized %d rows in %d chunks after %d resumed rows at %.1f rows/sec.",
+        stats.rows,
+        stats.chunks,
+        stats.resumed_rows,
+        stats.rows_per_second,
+    )
+    return stats
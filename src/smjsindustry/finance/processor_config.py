@@ -30,6 +30,7 @@ from smjsindustry.finance.constants import (
     SUPPORTED_SEC_FORMS,
     KMEDOIDS_SUMMARIZER_INIT_VALUES,
     KMEDOIDS_SUMMARIZER_METRIC_VALUES,
+    KMEDOIDS_SUMMARIZER_METHOD_VALUES,
 )
 from smjsindustry.finance.nlp_score_type import NLPScoreType
 
@@ -97,6 +98,18 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
         max_tokens (int): The max number of tokens in the summary (default: 0).
         cutoff (float): The similarity cut off (default: 0.0).
         vocabulary (Set[str]): A set of sentiment words (default: None).
+        approximate (bool): Whether the local summarizer estimates the Jaccard
+            scores of the sentences with MinHash signatures and LSH buckets instead
+            of computing them exactly, for very long documents (default: False).
+            The processing job always computes the exact scores.
+        num_permutations (int): The length of the MinHash signature of each
+            sentence in approximate mode. Longer signatures estimate the scores
+            more precisely but take longer to compute (default: 128).
+        num_bands (int): The number of LSH bands the signatures are split into in
+            approximate mode; it must divide ``num_permutations``. With one
+            signature component per band, the scores estimate the exact scores;
+            wider bands only count near-duplicate sentences as neighbors
+            (default: 128).
 
     """
 
@@ -107,6 +120,9 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
         max_tokens: int = 0,
         cutoff: float = 0.0,
         vocabulary: Optional[Set[str]] = None, # <-- CORRECTED TYPE HINT
+        approximate: bool = False,
+        num_permutations: int = 128,
+        num_bands: int = 128,
     ):
         """Initializes a ``JaccardSummarizerConfig`` instance.
 
@@ -119,6 +135,9 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
                 - if ``cutoff`` (float) is not a float
                 - if ``vocabulary`` (Set[str]) is not None and not a set Or any item
                      in the set is not a string
+                - if ``approximate`` (bool) is not a boolean
+                - if ``num_permutations`` (int) is not an integer
+                - if ``num_bands`` (int) is not an integer
 
             ValueError:
 
@@ -126,6 +145,8 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
                 - if ``summary_percentage`` (float) is not in the range of 0 to 1
                 - if ``max_tokens`` (int) is not a non-negative integer
                 - if ``cutoff`` (float) is not in the range of 0 to 1
+                - if ``num_permutations`` (int) is not a positive integer
+                - if ``num_bands`` (int) is not a positive divisor of ``num_permutations``
 
         """
         super().__init__(JACCARD_SUMMARIZER)
@@ -180,11 +201,29 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
                 raise TypeError(
                     "JaccardSummarizerConfig requires vocabulary to be a set of strings."
                 )
+        if not isinstance(approximate, bool):
+            raise TypeError("JaccardSummarizerConfig requires approximate to be a boolean.")
+        if not isinstance(num_permutations, int) or isinstance(num_permutations, bool):
+            raise TypeError("JaccardSummarizerConfig requires num_permutations to be an integer.")
+        if num_permutations <= 0:
+            raise ValueError(
+                "JaccardSummarizerConfig requires num_permutations to be a positive integer."
+            )
+        if not isinstance(num_bands, int) or isinstance(num_bands, bool):
+            raise TypeError("JaccardSummarizerConfig requires num_bands to be an integer.")
+        if num_bands <= 0 or num_permutations % num_bands:
+            raise ValueError(
+                "JaccardSummarizerConfig requires num_bands to be a positive divisor "
+                "of num_permutations."
+            )
         self._summary_size = summary_size
         self._summary_percentage = summary_percentage
         self._max_tokens = max_tokens
         self._cutoff = cutoff
         self._vocabulary = vocabulary
+        self._approximate = approximate
+        self._num_permutations = num_permutations
+        self._num_bands = num_bands
 
     def get_config(self) -> Dict[str, Union[str, int, float, Optional[Set[str]]]]:
         """Returns the config to be passed to a SageMaker JumpStart Industry Summarizer instance."""
@@ -222,6 +261,21 @@ class JaccardSummarizerConfig(FinanceProcessorConfig):
         """Gets the value of the ``vocabulary`` parameter."""
         return self._vocabulary
 
+    @property
+    def approximate(self) -> bool:
+        """Gets the value of the ``approximate`` parameter."""
+        return self._approximate
+
+    @property
+    def num_permutations(self) -> int:
+        """Gets the value of the ``num_permutations`` parameter."""
+        return self._num_permutations
+
+    @property
+    def num_bands(self) -> int:
+        """Gets the value of the ``num_bands`` parameter."""
+        return self._num_bands
+
 
 class KMedoidsSummarizerConfig(FinanceProcessorConfig):
     """Configuration class for ``KMedoidsSummarizer``.
@@ -271,6 +325,15 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
             Possible values are ``'random'``, ``'heuristic'``,
             ``'k-medoids++'``, ``'build'``
             (default: ``'heuristic'``).
+        method (str): The k-medoids algorithm of the local summarizer. Possible
+            values are ``'pam'``, ``'alternate'`` and ``'clara'``, which runs PAM on
+            ``n_samples`` random samples of ``sample_size`` sentences and keeps the
+            medoids that fit the whole document best, without a distance matrix
+            of all the sentences (default: ``'pam'``). The processing job always
+            uses its own algorithm.
+        sample_size (int): The number of sentences in each ``'clara'`` sample
+            (default: 0, which uses ``80 + 4 * summary_size``).
+        n_samples (int): The number of ``'clara'`` samples (default: 5).
 
     """
 
@@ -282,6 +345,9 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
         epochs: int = 60,
         metric: str = "euclidean",
         init: str = "heuristic",
+        method: str = "pam",
+        sample_size: int = 0,
+        n_samples: int = 5,
     ):
         """Initializes a ``KMedoidsSummarizerConfig`` instance.
 
@@ -294,6 +360,9 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
                 - if ``epochs`` (int) is not an integer
                 - if ``metric`` (str) is not a string
                 - if ``init`` (str) is not a string
+                - if ``method`` (str) is not a string
+                - if ``sample_size`` (int) is not an integer
+                - if ``n_samples`` (int) is not an integer
 
             ValueError:
 
@@ -303,6 +372,9 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
                 - if ``epochs`` (int) is not a positive integer
                 - if ``metric`` (str) is not from KMEDOIDS_SUMMARIZER_METRIC_VALUES
                 - if ``init`` (str) is not from KMEDOIDS_SUMMARIZER_INIT_VALUES
+                - if ``method`` (str) is not from KMEDOIDS_SUMMARIZER_METHOD_VALUES
+                - if ``sample_size`` (int) is not a non-negative integer
+                - if ``n_samples`` (int) is not a positive integer
 
         """
         super().__init__(KMEDOIDS_SUMMARIZER)
@@ -336,12 +408,31 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
             raise TypeError("KMedoidsSummarizerConfig requires init to be a string.")
         if init not in KMEDOIDS_SUMMARIZER_INIT_VALUES:
             raise ValueError(f"{init} not valid.")
+        if not isinstance(method, str):
+            raise TypeError("KMedoidsSummarizerConfig requires method to be a string.")
+        if method not in KMEDOIDS_SUMMARIZER_METHOD_VALUES:
+            raise ValueError(f"{method} not valid.")
+        if not isinstance(sample_size, int) or isinstance(sample_size, bool):
+            raise TypeError("KMedoidsSummarizerConfig requires sample_size to be an integer.")
+        if sample_size < 0:
+            raise ValueError(
+                "KMedoidsSummarizerConfig requires sample_size to be a non-negative integer."
+            )
+        if not isinstance(n_samples, int) or isinstance(n_samples, bool):
+            raise TypeError("KMedoidsSummarizerConfig requires n_samples to be an integer.")
+        if n_samples <= 0:
+            raise ValueError(
+                "KMedoidsSummarizerConfig requires n_samples to be a positive integer."
+            )
         self._summary_size = summary_size
         self._vector_size = vector_size
         self._min_count = min_count
         self._epochs = epochs
         self._metric = metric
         self._init = init
+        self._method = method
+        self._sample_size = sample_size
+        self._n_samples = n_samples
 
     def get_config(self) -> Dict[str, Union[str, int]]:
         """Returns the config to be passed to a SageMaker JumpStart Industry Summarizer instance."""
@@ -385,6 +476,21 @@ class KMedoidsSummarizerConfig(FinanceProcessorConfig):
         """Gets the value of the ``init`` parameter."""
         return self._init
 
+    @property
+    def method(self) -> str:
+        """Gets the value of the ``method`` parameter."""
+        return self._method
+
+    @property
+    def sample_size(self) -> int:
+        """Gets the value of the ``sample_size`` parameter."""
+        return self._sample_size
+
+    @property
+    def n_samples(self) -> int:
+        """Gets the value of the ``n_samples`` parameter."""
+        return self._n_samples
+
 
 class NLPScorerConfig(FinanceProcessorConfig):
     """Config class for :class:`~smjsindustry.finance.processor.NLPScorer`.
@@ -15,10 +15,13 @@
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Callable, Dict, Literal, Mapping
+from typing import Callable, Dict, Literal, Mapping, Optional, Tuple
 
 from pydantic import TypeAdapter, ValidationError
+import numpy as np
 import pandas as pd
 from smjsindustry.finance.constants import (
     IMAGE_CONFIG_FILE,
@@ -28,17 +31,37 @@ from smjsindustry.finance.constants import (
 )
 
 FreqLiteral = Literal["D", "W", "M", "Q", "Y"]
+FreqLabelBackend = Literal["native", "pandas"]
 FreqLabelHandler = Callable[[str], str]
 ImageConfig = Mapping[str, str]
 
 _IMAGE_CONFIG_VALIDATOR = TypeAdapter(dict[str, str])
 
+_DAY_PATTERN = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$")
+_MONTH_OR_DAY_PATTERN = re.compile(r"^\d{4}-\d{1,2}(-\d{1,2})?$")
+_YEAR_MONTH_OR_DAY_PATTERN = re.compile(r"^\d{4}(-\d{1,2}){0,2}$")
+_WEEK_LABEL_PATTERN = re.compile(r"^\d{4}W\d{1,2}$")
+_MONTH_LABEL_PATTERN = re.compile(r"^\d{4}M\d{1,2}$")
+_QUARTER_LABEL_PATTERN = re.compile(r"^\d{4}Q\d{1,2}$")
+_YEAR_LABEL_PATTERN = re.compile(r"^\d{4}$")
+_DATE_PARTS_PATTERN = re.compile(r"^(\d{4})(?:-(\d{1,2}))?(?:-(\d{1,2}))?$")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
 __all__ = [
     "FreqLiteral",
     "get_freq_label",
+    "get_freq_labels",
+    "get_freq_ordinals",
+    "convert_day_ordinals",
+    "format_freq_ordinals",
+    "is_temporal_dates",
+    "FreqLabelCache",
     "load_image_uri_config",
     "retrieve_image",
     "FREQ_LABEL_MAP",
+    "NATIVE_FREQ_LABEL_MAP",
+    "FREQ_LABEL_BACKENDS",
 ]
 
 
@@ -51,7 +74,7 @@ def _get_freq_label_by_day(date_value: str) -> str:
     Returns:
         str: The date value aggregated by day.
     """
-    if not bool(re.match(r"^\d{4}-\d{1,2}-\d{1,2}$", date_value)):
+    if not bool(_DAY_PATTERN.match(date_value)):
         raise ValueError("Date needs to be in yyyy-mm-dd format when freq is D")
     return date_value
 
@@ -65,9 +88,9 @@ def _get_freq_label_by_week(date_value: str) -> str:
     Returns:
         str: The date value aggregated by week.
     """
-    if bool(re.match(r"^\d{4}W\d{1,2}$", date_value)):
+    if bool(_WEEK_LABEL_PATTERN.match(date_value)):
         return date_value
-    if not bool(re.match(r"^\d{4}-\d{1,2}-\d{1,2}$", date_value)):
+    if not bool(_DAY_PATTERN.match(date_value)):
         raise ValueError("Date needs to be in yyyy-mm-dd format when freq is W")
     ts = pd.Timestamp(date_value)
     # Converted to f-string
@@ -83,9 +106,9 @@ def _get_freq_label_by_month(date_value: str) -> str:
     Returns:
         str: The date value aggregated by month.
     """
-    if bool(re.match(r"^\d{4}M\d{1,2}$", date_value)):
+    if bool(_MONTH_LABEL_PATTERN.match(date_value)):
         return date_value
-    if not bool(re.match(r"^\d{4}-\d{1,2}(-\d{1,2})?$", date_value)):
+    if not bool(_MONTH_OR_DAY_PATTERN.match(date_value)):
         raise ValueError("Date needs to be in yyyy-mm-dd or yyyy-mm format when freq is M")
     ts = pd.Timestamp(date_value)
     # Converted to f-string
@@ -101,9 +124,9 @@ def _get_freq_label_by_quarter(date_value: str) -> str:
     Returns:
         str: The date value aggregated by quarter.
     """
-    if bool(re.match(r"^\d{4}Q\d{1,2}$", date_value)):
+    if bool(_QUARTER_LABEL_PATTERN.match(date_value)):
         return date_value
-    if not bool(re.match(r"^\d{4}-\d{1,2}(-\d{1,2})?$", date_value)):
+    if not bool(_MONTH_OR_DAY_PATTERN.match(date_value)):
         raise ValueError("Date needs to be in yyyy-mm-dd or yyyy-mm format when freq is Q")
     ts = pd.Timestamp(date_value)
     # Converted to f-string
@@ -119,9 +142,9 @@ def _get_freq_label_by_year(date_value: str) -> str:
     Returns:
         str: The date value aggregated by year.
     """
-    if bool(re.match(r"^\d{4}$", date_value)):
+    if bool(_YEAR_LABEL_PATTERN.match(date_value)):
         return date_value
-    if not bool(re.match(r"^\d{4}(-\d{1,2}){0,2}$", date_value)):
+    if not bool(_YEAR_MONTH_OR_DAY_PATTERN.match(date_value)):
         raise ValueError("Date needs to be in yyyy-mm-dd, yyyy-mm or yyyy format when freq is Y")
     ts = pd.Timestamp(date_value)
     return str(ts.year)
@@ -136,7 +159,183 @@ FREQ_LABEL_MAP: Dict[FreqLiteral, FreqLabelHandler] = {
 }
 
 
-def get_freq_label(date_value: str, freq: str) -> str:
+def _is_leap_year(year: int) -> bool:
+    """Checks whether the year is a leap year of the proleptic Gregorian calendar."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _iso_weeks_in_year(year: int) -> int:
+    """Gets the number of ISO weeks, 52 or 53, in the year."""
+
+    def dec31_weekday(y: int) -> int:
+        return (y + y // 4 - y // 100 + y // 400) % 7
+
+    return 53 if dec31_weekday(year) == 4 or dec31_weekday(year - 1) == 3 else 52
+
+
+def _iso_week(year: int, month: int, day: int) -> int:
+    """Gets the ISO week of a valid date with integer arithmetic only.
+
+    Args:
+        year (int): The year.
+        month (int): The month, from 1 to 12.
+        day (int): The day of the month.
+
+    Returns:
+        int: The ISO 8601 week number, as returned by ``pandas.Timestamp.week``.
+    """
+    day_of_year = _DAYS_BEFORE_MONTH[month - 1] + day
+    if month > 2 and _is_leap_year(year):
+        day_of_year += 1
+    # Sakamoto's method gives the weekday with 0 for Sunday; ISO weekdays run from 1 to 7.
+    shifted_year = year - 1 if month < 3 else year
+    weekday = (
+        shifted_year
+        + shifted_year // 4
+        - shifted_year // 100
+        + shifted_year // 400
+        + (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)[month - 1]
+        + day
+    ) % 7 or 7
+    week = (day_of_year - weekday + 10) // 7
+    if week < 1:
+        return _iso_weeks_in_year(year - 1)
+    if week > _iso_weeks_in_year(year):
+        return 1
+    return week
+
+
+def _parse_date_parts(date_value: str) -> Optional[Tuple[int, Optional[int], Optional[int]]]:
+    """Parses a ``yyyy-mm-dd``, ``yyyy-mm`` or ``yyyy`` value into integers.
+
+    Args:
+        date_value (str): The date value.
+
+    Returns:
+        tuple: The year, month and day, where the month and day are None when they
+        are not part of the value, or None if the value is in none of the formats.
+    """
+    match = _DATE_PARTS_PATTERN.match(date_value)
+    if match is None:
+        return None
+    year, month, day = match.groups()
+    return (
+        int(year),
+        None if month is None else int(month),
+        None if day is None else int(day),
+    )
+
+
+def _is_native_date(year: int, month: int, day: int) -> bool:
+    """Checks whether the native handlers can label the date without ``pandas``.
+
+    Dates outside of the years 1 to 9999 and invalid calendar dates are left to
+    the ``pandas`` handlers, which label them or raise their usual errors.
+    """
+    if not 1 <= year <= 9999 or not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and _is_leap_year(year):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month - 1]
+
+
+def _get_native_freq_label_by_week(date_value: str) -> str:
+    """Gets the week label of the date value without building a ``pandas.Timestamp``.
+
+    Args:
+        date_value (str): The date value.
+
+    Returns:
+        str: The date value aggregated by week.
+    """
+    if _WEEK_LABEL_PATTERN.match(date_value):
+        return date_value
+    parts = _parse_date_parts(date_value)
+    if parts is None or parts[2] is None:
+        raise ValueError("Date needs to be in yyyy-mm-dd format when freq is W")
+    year, month, day = parts
+    if not _is_native_date(year, month, day):  # type: ignore[arg-type]
+        return _get_freq_label_by_week(date_value)
+    return f"{year}W{_iso_week(year, month, day)}"  # type: ignore[arg-type]
+
+
+def _get_native_freq_label_by_month(date_value: str) -> str:
+    """Gets the month label of the date value without building a ``pandas.Timestamp``.
+
+    Args:
+        date_value (str): The date value.
+
+    Returns:
+        str: The date value aggregated by month.
+    """
+    if _MONTH_LABEL_PATTERN.match(date_value):
+        return date_value
+    parts = _parse_date_parts(date_value)
+    if parts is None or parts[1] is None:
+        raise ValueError("Date needs to be in yyyy-mm-dd or yyyy-mm format when freq is M")
+    year, month, day = parts
+    if not _is_native_date(year, month, 1 if day is None else day):
+        return _get_freq_label_by_month(date_value)
+    return f"{year}M{month}"
+
+
+def _get_native_freq_label_by_quarter(date_value: str) -> str:
+    """Gets the quarter label of the date value without building a ``pandas.Timestamp``.
+
+    Args:
+        date_value (str): The date value.
+
+    Returns:
+        str: The date value aggregated by quarter.
+    """
+    if _QUARTER_LABEL_PATTERN.match(date_value):
+        return date_value
+    parts = _parse_date_parts(date_value)
+    if parts is None or parts[1] is None:
+        raise ValueError("Date needs to be in yyyy-mm-dd or yyyy-mm format when freq is Q")
+    year, month, day = parts
+    if not _is_native_date(year, month, 1 if day is None else day):
+        return _get_freq_label_by_quarter(date_value)
+    return f"{year}Q{(month - 1) // 3 + 1}"
+
+
+def _get_native_freq_label_by_year(date_value: str) -> str:
+    """Gets the year label of the date value without building a ``pandas.Timestamp``.
+
+    Args:
+        date_value (str): The date value.
+
+    Returns:
+        str: The date value aggregated by year.
+    """
+    if _YEAR_LABEL_PATTERN.match(date_value):
+        return date_value
+    parts = _parse_date_parts(date_value)
+    if parts is None:
+        raise ValueError("Date needs to be in yyyy-mm-dd, yyyy-mm or yyyy format when freq is Y")
+    year, month, day = parts
+    if not _is_native_date(year, 1 if month is None else month, 1 if day is None else day):
+        return _get_freq_label_by_year(date_value)
+    return str(year)
+
+
+# The native handlers parse the date with one precompiled pattern and compute the
+# labels with integer arithmetic. They return the same labels as ``FREQ_LABEL_MAP``.
+NATIVE_FREQ_LABEL_MAP: Dict[FreqLiteral, FreqLabelHandler] = {
+    "D": _get_freq_label_by_day,
+    "W": _get_native_freq_label_by_week,
+    "M": _get_native_freq_label_by_month,
+    "Q": _get_native_freq_label_by_quarter,
+    "Y": _get_native_freq_label_by_year,
+}
+
+FREQ_LABEL_BACKENDS: Dict[FreqLabelBackend, Dict[FreqLiteral, FreqLabelHandler]] = {
+    "native": NATIVE_FREQ_LABEL_MAP,
+    "pandas": FREQ_LABEL_MAP,
+}
+
+
+def get_freq_label(date_value: str, freq: str, backend: FreqLabelBackend = "native") -> str:
     """Gets frequency label for the date value.
 
     Args:
@@ -144,12 +343,19 @@ def get_freq_label(date_value: str, freq: str) -> str:
         freq (str): The frequency value specifies how the date field should be aggregated,
             by year, quarter, month, week, day. Available values:
             ``{'Y', 'Q', 'M', 'W', 'D'}``, default ``'Q'``.
+        backend (str): The label handlers to use. ``'native'`` parses the date with
+            integer arithmetic and ``'pandas'`` builds a ``pandas.Timestamp``; both
+            return the same labels. Available values: ``{'native', 'pandas'}``
+            (default: ``'native'``).
 
     Returns:
         str: The date value aggregated by the specified frequency.
     """
+    handlers = FREQ_LABEL_BACKENDS.get(backend)
+    if handlers is None:
+        raise ValueError(f"backend {backend} not supported")
     freq = freq.upper()
-    handler = FREQ_LABEL_MAP.get(freq)
+    handler = handlers.get(freq)  # type: ignore[call-overload]
     if handler is None:
         raise ValueError(f"frequency {freq} not supported")
     if not isinstance(date_value, str):
@@ -157,6 +363,377 @@ def get_freq_label(date_value: str, freq: str) -> str:
     return handler(date_value.upper())
 
 
+# Patterns used by the columnar normalizer. Each entry holds the pattern of values
+# that are already labelled for the frequency (returned unchanged) and the pattern
+# of the accepted date formats, mirroring the per-row ``_get_freq_label_by_*`` handlers.
+_FREQ_LABEL_PATTERNS: Dict[FreqLiteral, Tuple[Optional[str], str]] = {
+    "D": (None, _DAY_PATTERN.pattern),
+    "W": (_WEEK_LABEL_PATTERN.pattern, _DAY_PATTERN.pattern),
+    "M": (_MONTH_LABEL_PATTERN.pattern, _MONTH_OR_DAY_PATTERN.pattern),
+    "Q": (_QUARTER_LABEL_PATTERN.pattern, _MONTH_OR_DAY_PATTERN.pattern),
+    "Y": (_YEAR_LABEL_PATTERN.pattern, _YEAR_MONTH_OR_DAY_PATTERN.pattern),
+}
+_DATE_FORMATS = [
+    ("%Y-%m-%d", _DAY_PATTERN.pattern),
+    ("%Y-%m", r"^\d{4}-\d{1,2}$"),
+    ("%Y", _YEAR_LABEL_PATTERN.pattern),
+]
+
+
+def _format_freq_labels(dates: pd.Series, freq: str) -> pd.Series:
+    """Formats the labels of parsed dates for the ``W``, ``M``, ``Q`` and ``Y`` frequencies.
+
+    Args:
+        dates (pandas.Series): The parsed ``datetime64`` values.
+        freq (str): The upper-cased frequency.
+
+    Returns:
+        pandas.Series: The labels, formatted as the per-row handlers format them.
+    """
+    year = dates.dt.year.astype("int64").astype(str)
+    if freq == "Y":
+        return year
+    if freq == "W":
+        period = dates.dt.isocalendar().week.astype("int64")
+    elif freq == "M":
+        period = dates.dt.month.astype("int64")
+    else:
+        period = dates.dt.quarter.astype("int64")
+    return year + freq + period.astype(str)
+
+
+def _compute_freq_labels(values: pd.Series, freq: str) -> np.ndarray:
+    """Computes frequency labels for upper-cased date values without a per-row call.
+
+    Args:
+        values (pandas.Series): The upper-cased date values; missing values stand for
+            values that are not strings.
+        freq (str): The upper-cased, supported frequency.
+
+    Returns:
+        numpy.ndarray: The labels, as an object array aligned with ``values``.
+    """
+    raw = values.to_numpy(dtype=object)
+    labels = np.empty(len(raw), dtype=object)
+    missing = values.isna().to_numpy(dtype=bool)
+    label_pattern, date_pattern = _FREQ_LABEL_PATTERNS[freq]  # type: ignore[index]
+    if label_pattern is not None:
+        labelled = values.str.match(label_pattern).fillna(False).to_numpy(dtype=bool)
+    else:
+        labelled = np.zeros(len(raw), dtype=bool)
+    labels[labelled] = raw[labelled]
+
+    pending = ~labelled
+    invalid = pending & (
+        missing | ~values.str.match(date_pattern).fillna(False).to_numpy(dtype=bool)
+    )
+    if freq == "D":
+        if invalid.any():
+            get_freq_label(raw[int(invalid.argmax())], freq)
+        labels[pending] = raw[pending]
+        return labels
+
+    positions = np.flatnonzero(pending & ~invalid)
+    candidates = values.iloc[positions]
+    parsed_dates = np.full(len(positions), np.datetime64("NaT"), dtype="datetime64[s]")
+    for date_format, pattern in _DATE_FORMATS:
+        matched = candidates.str.match(pattern).to_numpy(dtype=bool)
+        if matched.any():
+            parsed_dates[matched] = pd.to_datetime(
+                candidates[matched], format=date_format, errors="coerce"
+            ).to_numpy(dtype="datetime64[s]")
+    parsed = ~np.isnat(parsed_dates)
+    labels[positions[parsed]] = _format_freq_labels(
+        pd.Series(parsed_dates[parsed]), freq
+    ).to_numpy(dtype=object)
+    # Invalid values and dates that cannot be represented as ``datetime64`` go
+    # through the per-row function in row order, so the first offending value
+    # raises the same error as the row-wise normalization would.
+    for position in np.union1d(np.flatnonzero(invalid), positions[~parsed]):
+        labels[position] = get_freq_label(raw[position], freq)
+    return labels
+
+
+class FreqLabelCache:
+    """A bounded cache of frequency labels shared across normalization calls.
+
+    Entries are keyed by ``(date value, freq)`` and evicted in least recently used
+    order once ``maxsize`` entries are stored. Pass the same instance to
+    :func:`get_freq_labels` or :func:`~smjsindustry.build_tabText` to make repeated
+    normalizations of the same panel almost free.
+
+    Args:
+        maxsize (int): The maximum number of cached labels (default: 100000).
+
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        """Initializes a ``FreqLabelCache`` instance.
+
+        Raises:
+            TypeError: if ``maxsize`` (int) is not an integer
+            ValueError: if ``maxsize`` (int) is not a positive integer
+        """
+        if not isinstance(maxsize, int):
+            raise TypeError("FreqLabelCache requires maxsize to be an integer.")
+        if maxsize <= 0:
+            raise ValueError("FreqLabelCache requires maxsize to be a positive integer.")
+        self._maxsize = maxsize
+        self._labels: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, date_values: np.ndarray, freq: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Looks up the labels of unique date values.
+
+        Args:
+            date_values (numpy.ndarray): The unique, upper-cased date values.
+            freq (str): The upper-cased frequency.
+
+        Returns:
+            tuple: The labels as an object array, and a boolean mask of the values
+            that were found in the cache.
+        """
+        labels = np.empty(len(date_values), dtype=object)
+        found = np.zeros(len(date_values), dtype=bool)
+        with self._lock:
+            for position, date_value in enumerate(date_values):
+                label = self._labels.get((date_value, freq))
+                if label is not None:
+                    self._labels.move_to_end((date_value, freq))
+                    labels[position] = label
+                    found[position] = True
+            hits = int(found.sum())
+            self._hits += hits
+            self._misses += len(date_values) - hits
+        return labels, found
+
+    def update(self, date_values: np.ndarray, labels: np.ndarray, freq: str):
+        """Stores the labels of date values, evicting the least recently used entries.
+
+        Args:
+            date_values (numpy.ndarray): The upper-cased date values.
+            labels (numpy.ndarray): The labels of ``date_values``.
+            freq (str): The upper-cased frequency.
+        """
+        with self._lock:
+            for date_value, label in zip(date_values, labels):
+                self._labels[(date_value, freq)] = label
+                self._labels.move_to_end((date_value, freq))
+            while len(self._labels) > self._maxsize:
+                self._labels.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached labels and resets the hit and miss counters."""
+        with self._lock:
+            self._labels.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        """Gets the number of cached labels."""
+        return len(self._labels)
+
+    @property
+    def maxsize(self) -> int:
+        """Gets the value of the ``maxsize`` parameter."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of unique date values whose label was found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of unique date values whose label had to be computed."""
+        return self._misses
+
+
+def get_freq_labels(
+    date_values: pd.Series, freq: str, cache: Optional[FreqLabelCache] = None
+) -> pd.Series:
+    """Gets frequency labels for a whole column of date values.
+
+    This is the columnar counterpart of :func:`get_freq_label`. The column is
+    factorized first, so labels are only computed for its distinct values and then
+    broadcast back through the codes. The formats of the distinct values are
+    validated with vectorized regular expressions and the dates are parsed with
+    ``pandas.to_datetime`` once per accepted format. The labels and the raised
+    ``ValueError`` are the same as calling :func:`get_freq_label` on each value in order.
+
+    Datetime, ``Period`` and ``datetime.date`` columns are labeled from their
+    :func:`get_freq_ordinals` instead, without parsing any string.
+
+    Args:
+        date_values (pandas.Series): The date values, as strings, datetimes, periods
+            or dates.
+        freq (str): The frequency value specifies how the date field should be aggregated,
+            by year, quarter, month, week, day. Available values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}``.
+        cache (FreqLabelCache): An optional cache of labels shared across calls
+            (default: None).
+
+    Returns:
+        pandas.Series: The date values aggregated by the specified frequency,
+        aligned with the index of ``date_values``.
+    """
+    freq = freq.upper()
+    if freq not in FREQ_LABEL_MAP:
+        raise ValueError(f"frequency {freq} not supported")
+    if is_temporal_dates(date_values):
+        return pd.Series(
+            format_freq_ordinals(get_freq_ordinals(date_values, freq), freq),
+            index=date_values.index,
+            name=date_values.name,
+        )
+    if date_values.dtype == object:
+        is_string = date_values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        values = date_values.where(is_string).astype(str).str.upper()
+    else:
+        values = date_values.astype(str).str.upper()
+
+    # Unique values keep the order of their first occurrence, so the first invalid
+    # unique value is also the first invalid row.
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    unique_values = pd.Series(uniques)
+    if cache is None:
+        unique_labels = _compute_freq_labels(unique_values, freq)
+    else:
+        unique_labels, found = cache.lookup(unique_values.to_numpy(dtype=object), freq)
+        computed = np.flatnonzero(~found)
+        if len(computed):
+            missed = unique_values.iloc[computed].reset_index(drop=True)
+            unique_labels[computed] = _compute_freq_labels(missed, freq)
+            cache.update(missed.to_numpy(dtype=object), unique_labels[computed], freq)
+    return pd.Series(unique_labels.take(codes), index=date_values.index, name=date_values.name)
+
+
+# Week ordinals number the (calendar year, ISO week) pairs of the week labels,
+# which are not periods of a single calendar: ``2021-01-01`` is labeled ``2021W53``.
+_WEEKS_PER_ORDINAL_YEAR = 53
+_ORDINAL_EPOCH_YEAR = 1970
+
+
+def is_temporal_dates(date_values: pd.Series) -> bool:
+    """Checks whether a column holds dates as datetimes, periods or ``datetime.date`` objects.
+
+    Args:
+        date_values (pandas.Series): The date values.
+
+    Returns:
+        bool: Whether the column can be normalized with :func:`get_freq_ordinals`.
+    """
+    dtype = date_values.dtype
+    if isinstance(dtype, pd.PeriodDtype) or pd.api.types.is_datetime64_any_dtype(dtype):
+        return True
+    return dtype == object and pd.api.types.infer_dtype(date_values, skipna=True) in (
+        "date",
+        "datetime",
+        "datetime64",
+    )
+
+
+def _to_days(date_values: pd.Series) -> np.ndarray:
+    """Converts temporal date values to days since 1970-01-01, dropping any time of day."""
+    if date_values.isna().any():
+        raise ValueError("The date column needs to have no missing dates")
+    if isinstance(date_values.dtype, pd.PeriodDtype):
+        date_values = date_values.dt.start_time
+    elif not pd.api.types.is_datetime64_any_dtype(date_values.dtype):
+        date_values = pd.to_datetime(date_values)
+    if getattr(date_values.dt, "tz", None) is not None:
+        # Time zone aware dates are bucketed by their local calendar date.
+        date_values = date_values.dt.tz_localize(None)
+    return date_values.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+
+def get_freq_ordinals(date_values: pd.Series, freq: str) -> np.ndarray:
+    """Gets integer period ordinals for a column of datetimes, periods or dates.
+
+    The ordinals are computed with integer arithmetic on the dates, without
+    formatting or parsing any string, and two dates get the same ordinal exactly
+    when :func:`get_freq_label` gives them the same label. Day, month, quarter and
+    year ordinals count the periods since 1970, like ``pandas.Period`` ordinals.
+    Use :func:`format_freq_ordinals` to render the labels.
+
+    Args:
+        date_values (pandas.Series): The ``datetime64``, ``Period`` or
+            ``datetime.date`` values. Any time of day is ignored.
+        freq (str): The frequency value specifies how the date field should be aggregated,
+            by year, quarter, month, week, day. Available values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}``.
+
+    Returns:
+        numpy.ndarray: The ``int64`` ordinal of each date.
+    """
+    freq = freq.upper()
+    if freq not in FREQ_LABEL_MAP:
+        raise ValueError(f"frequency {freq} not supported")
+    if not is_temporal_dates(date_values):
+        raise TypeError("get_freq_ordinals requires datetime, Period or date values.")
+    return convert_day_ordinals(_to_days(date_values), freq)
+
+
+def convert_day_ordinals(days: np.ndarray, freq: str) -> np.ndarray:
+    """Converts day ordinals from :func:`get_freq_ordinals` to the ordinals of another frequency.
+
+    Dates only have to be converted to days once to be bucketed by several frequencies.
+
+    Args:
+        days (numpy.ndarray): The ``'D'`` ordinals, the days since 1970-01-01.
+        freq (str): The frequency of the returned ordinals. Available values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}``.
+
+    Returns:
+        numpy.ndarray: The ``int64`` ordinal of each day.
+    """
+    freq = freq.upper()
+    if freq not in FREQ_LABEL_MAP:
+        raise ValueError(f"frequency {freq} not supported")
+    days = np.asarray(days, dtype=np.int64)
+    if freq == "D":
+        return days
+    if freq == "W":
+        years = days.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64)
+        # 1970-01-01 was a Thursday; the ISO week of a day is the week of its Thursday.
+        thursdays = days - (days + 3) % 7 + 3
+        first_days = thursdays.astype("datetime64[D]").astype("datetime64[Y]")
+        weeks = (thursdays - first_days.astype("datetime64[D]").astype(np.int64)) // 7 + 1
+        return years * _WEEKS_PER_ORDINAL_YEAR + weeks - 1
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    if freq == "M":
+        return months
+    return months // (3 if freq == "Q" else 12)
+
+
+def format_freq_ordinals(ordinals: np.ndarray, freq: str) -> np.ndarray:
+    """Renders period ordinals from :func:`get_freq_ordinals` as frequency labels.
+
+    Args:
+        ordinals (numpy.ndarray): The period ordinals.
+        freq (str): The frequency of the ordinals. Available values:
+            ``{'Y', 'Q', 'M', 'W', 'D'}``.
+
+    Returns:
+        numpy.ndarray: The labels, such as ``"2021Q3"``, as returned by
+        :func:`get_freq_label`.
+    """
+    freq = freq.upper()
+    if freq not in FREQ_LABEL_MAP:
+        raise ValueError(f"frequency {freq} not supported")
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if freq == "D":
+        return ordinals.astype("datetime64[D]").astype(str).astype(object)
+    periods_per_year = {"W": _WEEKS_PER_ORDINAL_YEAR, "M": 12, "Q": 4, "Y": 1}[freq]
+    years, periods = np.divmod(ordinals, periods_per_year)
+    year_labels = pd.Series(years + _ORDINAL_EPOCH_YEAR).astype(str)
+    if freq == "Y":
+        return year_labels.to_numpy(dtype=object)
+    return (year_labels + freq + pd.Series(periods + 1).astype(str)).to_numpy(dtype=object)
+
+
 @lru_cache(maxsize=1)
 def load_image_uri_config() -> ImageConfig:
     """Loads the JSON config for the image URI.
@@ -13,7 +13,15 @@
 """Tests build_tabText module."""
 
 import pandas as pd
-from smjsindustry import build_tabText
+import pytest
+from pandas.errors import MergeError
+from smjsindustry import (
+    build_tabText,
+    build_tabText_arrow,
+    build_tabText_chunked,
+    build_tabText_multi_freq,
+)
+from smjsindustry.finance.utils import FreqLabelCache
 
 
 def test_build_tabText_by_quarter():
@@ -74,4 +82,362 @@ def test_build_tabText_by_year():
     )
     assert set(joined.columns) == set(["ticker1", "date1", "ticker2", "date2", "doc", "price"])
     assert joined.loc[0, "doc"] == text_df.loc[0, "doc"]
-    assert joined.loc[1, "doc"] == text_df.loc[1, "doc"]
\ No newline at end of file
+    assert joined.loc[1, "doc"] == text_df.loc[1, "doc"]
+
+
+def test_build_tabText_with_label_cache():
+    tabular_df = pd.DataFrame(
+        {
+            "ticker": ["ticker1", "ticker1", "ticker2"],
+            "date": ["2019-01-01", "2019-04-01", "2019-01-15"],
+            "price": [2000.00, 2100.00, 100.00],
+        }
+    )
+    text_df = pd.DataFrame(
+        {
+            "ticker": ["ticker1", "ticker2"],
+            "date": ["2019-02-01", "2019-02-02"],
+            "doc": ["doc1", "doc2"],
+        }
+    )
+    cache = FreqLabelCache()
+
+    first = build_tabText(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", label_cache=cache
+    )
+    misses = cache.misses
+    second = build_tabText(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", label_cache=cache
+    )
+
+    pd.testing.assert_frame_equal(first, second)
+    assert first["doc"].tolist() == ["doc1", "doc2"]
+    assert cache.misses == misses
+    assert cache.hits == misses
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("text_key", ["ticker", "symbol"])
+def test_build_tabText_matches_merge_without_modifying_inputs(how, text_key):
+    tabular_df = pd.DataFrame(
+        {
+            "ticker": ["ticker1", "ticker2", "ticker3", "ticker1"],
+            "date": ["2019-01-01", "2020-01-01", "2020-01-01", "2019-05-01"],
+            "volume": [10, 20, 30, 40],
+        },
+        index=[7, 5, 3, 1],
+    )
+    text_df = pd.DataFrame(
+        {
+            text_key: ["ticker1", "ticker2", "ticker4"],
+            "date": ["2019-02-01", "2020-02-02", "2020-03-03"],
+            "volume": [1, 2, 3],
+            "doc": ["doc1", "doc2", "doc4"],
+        }
+    )
+    tabular_copy, text_copy = tabular_df.copy(), text_df.copy()
+
+    joined = build_tabText(tabular_df, "ticker", "date", text_df, text_key, "date", how=how)
+
+    pd.testing.assert_frame_equal(tabular_df, tabular_copy)
+    pd.testing.assert_frame_equal(text_df, text_copy)
+    tabular_copy["quarter"] = ["2019Q1", "2020Q1", "2020Q1", "2019Q2"]
+    text_copy["quarter"] = ["2019Q1", "2020Q1", "2020Q1"]
+    expected = pd.merge(
+        tabular_copy,
+        text_copy,
+        left_on=["ticker", "quarter"],
+        right_on=[text_key, "quarter"],
+        how=how,
+    ).drop(columns=["quarter"])
+    pd.testing.assert_frame_equal(joined, expected)
+
+
+def test_build_tabText_suffix_collision():
+    tabular_df = pd.DataFrame(
+        {"ticker": ["ticker1"], "date": ["2019-01-01"], "a": [1], "a_x": [10]}
+    )
+    text_df = pd.DataFrame({"ticker": ["ticker1"], "date": ["2019-02-01"], "a": ["t"]})
+
+    with pytest.raises(MergeError, match="duplicate columns {'a_x'}"):
+        build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date")
+
+
+def _chunked_frames():
+    tabular_df = pd.DataFrame(
+        {
+            "ticker": ["ticker1", "ticker2", "ticker3", "ticker1"],
+            "date": ["2019-01-01", "2020-01-01", "2020-01-01", "2019-05-01"],
+            "price": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    text_df = pd.DataFrame(
+        {
+            "ticker": ["ticker2", "ticker1", "ticker4", "ticker1", "ticker1"],
+            "date": ["2020-02-02", "2019-02-01", "2020-03-03", "2019-06-01", "2019-03-03"],
+            "doc": ["doc1", "doc2", "doc3", "doc4", "doc5"],
+        }
+    )
+    return tabular_df, text_df
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_build_tabText_chunked(how):
+    tabular_df, text_df = _chunked_frames()
+    chunks = []
+
+    stats = build_tabText_chunked(
+        tabular_df,
+        "ticker",
+        "date",
+        (text_df.iloc[start : start + 2] for start in range(0, len(text_df), 2)),
+        "ticker",
+        "date",
+        chunks.append,
+        how=how,
+    )
+
+    joined = pd.concat(chunks, ignore_index=True)
+    expected = build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date", how=how)
+    assert list(joined.columns) == list(expected.columns)
+    assert sorted(zip(joined["price"], joined["doc"].fillna(""))) == sorted(
+        zip(expected["price"], expected["doc"].fillna(""))
+    )
+    # Rows are written chunk by chunk; unmatched tabular rows come last for a left join.
+    assert joined["doc"].tolist()[:4] == ["doc2", "doc1", "doc4", "doc5"]
+    if how == "left":
+        assert joined["ticker"].tolist()[4:] == ["ticker3"]
+    assert (stats.chunks, stats.text_rows, stats.output_rows) == (3, 5, len(expected))
+    assert stats.rows_per_second > 0
+
+
+def test_build_tabText_chunked_csv(tmp_path):
+    tabular_df, text_df = _chunked_frames()
+    text_path = tmp_path / "text.csv"
+    output_path = tmp_path / "joined.csv"
+    text_df.to_csv(text_path, index=False)
+
+    build_tabText_chunked(
+        tabular_df,
+        "ticker",
+        "date",
+        str(text_path),
+        "ticker",
+        "date",
+        str(output_path),
+        chunksize=2,
+    )
+
+    joined = pd.read_csv(output_path)
+    expected = build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date")
+    assert sorted(joined["doc"]) == sorted(expected["doc"])
+    assert list(joined.columns) == list(expected.columns)
+
+
+def test_build_tabText_chunked_invalid_how():
+    tabular_df, text_df = _chunked_frames()
+    with pytest.raises(ValueError, match="does not support how='outer'"):
+        build_tabText_chunked(
+            tabular_df, "ticker", "date", [text_df], "ticker", "date", print, how="outer"
+        )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_build_tabText_datetime(n_jobs):
+    if n_jobs > 1:
+        pytest.importorskip("pyarrow")
+    tabular_df, text_df = _chunked_frames()
+    # Datetimes with a time of day are bucketed without formatting them as strings.
+    tabular_dt = tabular_df.assign(date=pd.to_datetime(tabular_df["date"]) + pd.Timedelta("9h"))
+    text_dt = text_df.assign(date=pd.to_datetime(text_df["date"]))
+
+    joined = build_tabText(tabular_dt, "ticker", "date", text_dt, "ticker", "date", n_jobs=n_jobs)
+
+    expected = build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date")
+    assert sorted(joined["doc"]) == sorted(expected["doc"])
+    assert joined["date_x"].dtype == tabular_dt["date"].dtype
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_build_tabText_parallel(how):
+    pytest.importorskip("pyarrow")
+    tabular_df, text_df = _chunked_frames()
+
+    joined = build_tabText(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", how=how, n_jobs=2
+    )
+
+    expected = build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date", how=how)
+    if how == "inner":
+        # Inner joins keep the tabular rows in order.
+        assert joined["doc"].tolist() == ["doc2", "doc5", "doc1", "doc4"]
+        expected = expected.sort_values(["price", "doc"], ignore_index=True)
+    pd.testing.assert_frame_equal(joined, expected)
+
+
+def test_build_tabText_invalid_n_jobs():
+    tabular_df, text_df = _chunked_frames()
+    with pytest.raises(ValueError, match="n_jobs to be a positive integer"):
+        build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date", n_jobs=0)
+
+
+@pytest.mark.parametrize(
+    "direction, docs",
+    [
+        ("backward", ["d1", "d2", None, None]),
+        ("forward", ["d2", "d2", "d4", None]),
+        ("nearest", ["d1", "d2", "d4", None]),
+    ],
+)
+def test_build_tabText_asof(direction, docs):
+    tabular_df = pd.DataFrame(
+        {
+            "ticker": ["a", "a", "b", "c"],
+            "date": ["2020-03-31", "2020-06-30", "2020-03-31", "2020"],
+            "price": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    text_df = pd.DataFrame(
+        {
+            "ticker": ["a", "a", "b", "b"],
+            "date": ["2020-02-01", "2020-06-30", "2019-01-01", "2020-04-15"],
+            "doc": ["d1", "d2", "d3", "d4"],
+        }
+    )
+
+    joined = build_tabText(
+        tabular_df,
+        "ticker",
+        "date",
+        text_df,
+        "ticker",
+        "date",
+        how="asof",
+        tolerance="120D",
+        direction=direction,
+    )
+
+    assert list(joined.columns) == ["ticker", "date_x", "price", "date_y", "doc"]
+    assert joined["ticker"].tolist() == tabular_df["ticker"].tolist()
+    assert [None if pd.isna(doc) else doc for doc in joined["doc"]] == docs
+
+
+def test_build_tabText_asof_invalid_direction():
+    tabular_df, text_df = _chunked_frames()
+    with pytest.raises(ValueError, match="does not support direction='later'"):
+        build_tabText(
+            tabular_df, "ticker", "date", text_df, "ticker", "date", how="asof", direction="later"
+        )
+
+
+@pytest.mark.parametrize("how", ["left", "right", "outer"])
+def test_build_tabText_arrow(how):
+    pa = pytest.importorskip("pyarrow")
+    tabular_df, text_df = _chunked_frames()
+
+    joined = build_tabText_arrow(
+        pa.Table.from_pandas(tabular_df),
+        "ticker",
+        "date",
+        pa.Table.from_pandas(text_df),
+        "ticker",
+        "date",
+        how=how,
+    )
+
+    expected = build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date", how=how)
+    assert isinstance(joined, pa.Table)
+    assert joined.column_names == list(expected.columns)
+    assert joined.column("doc").to_pylist() == [
+        None if pd.isna(doc) else doc for doc in expected["doc"]
+    ]
+
+
+def test_build_tabText_arrow_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    tabular_df, text_df = _chunked_frames()
+    text_df.to_parquet(tmp_path / "text.parquet")
+
+    joined = build_tabText_arrow(
+        tabular_df,
+        "ticker",
+        "date",
+        str(tmp_path / "text.parquet"),
+        "ticker",
+        "date",
+        output_format="pandas",
+    )
+
+    assert joined["doc"].dtype == pd.StringDtype("pyarrow")
+    assert joined["doc"].tolist() == ["doc2", "doc5", "doc1", "doc4"]
+
+
+def test_build_tabText_arrow_invalid_date():
+    pytest.importorskip("pyarrow")
+    tabular_df, text_df = _chunked_frames()
+    text_df.loc[2, "date"] = "2020-02-30"
+    with pytest.raises(ValueError, match="day is out of range for month"):
+        build_tabText_arrow(tabular_df, "ticker", "date", text_df, "ticker", "date")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_build_tabText_multi_freq(how):
+    tabular_df, text_df = _chunked_frames()
+
+    joined = build_tabText_multi_freq(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", ["Y", "Q", "M"], how=how
+    )
+
+    assert list(joined) == ["Y", "Q", "M"]
+    for freq, frame in joined.items():
+        expected = build_tabText(
+            tabular_df, "ticker", "date", text_df, "ticker", "date", how=how, freq=freq
+        )
+        assert list(frame.columns) == list(expected.columns)
+        assert sorted(zip(frame["price"].fillna(0), frame["doc"].fillna(""))) == sorted(
+            zip(expected["price"].fillna(0), expected["doc"].fillna(""))
+        )
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("empty", ["tabular", "text", "both"])
+def test_build_tabText_multi_freq_empty(how, empty):
+    tabular_df, text_df = _chunked_frames()
+    if empty in ("tabular", "both"):
+        tabular_df = tabular_df.iloc[:0]
+    if empty in ("text", "both"):
+        text_df = text_df.iloc[:0]
+
+    joined = build_tabText_multi_freq(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", ["Y", "Q"], how=how
+    )
+
+    for freq, frame in joined.items():
+        expected = build_tabText(
+            tabular_df, "ticker", "date", text_df, "ticker", "date", how=how, freq=freq
+        )
+        assert list(frame.columns) == list(expected.columns)
+        assert len(frame) == len(expected)
+        assert sorted(frame["doc"].fillna("")) == sorted(expected["doc"].fillna(""))
+
+
+def test_build_tabText_multi_freq_long():
+    tabular_df, text_df = _chunked_frames()
+
+    joined = build_tabText_multi_freq(
+        tabular_df, "ticker", "date", text_df, "ticker", "date", ["Q", "Y"], output_format="long"
+    )
+
+    expected_rows = {
+        freq: len(build_tabText(tabular_df, "ticker", "date", text_df, "ticker", "date", freq=freq))
+        for freq in ["Q", "Y"]
+    }
+    assert joined["freq"].value_counts().to_dict() == expected_rows
+    assert joined["freq"].tolist() == ["Q"] * expected_rows["Q"] + ["Y"] * expected_rows["Y"]
+
+
+@pytest.mark.parametrize("freqs", [[], ["Q", "Q"], ["H"]])
+def test_build_tabText_multi_freq_invalid_freqs(freqs):
+    tabular_df, text_df = _chunked_frames()
+    with pytest.raises(ValueError):
+        build_tabText_multi_freq(tabular_df, "ticker", "date", text_df, "ticker", "date", freqs)
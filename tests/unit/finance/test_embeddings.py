@@ -0,0 +1,153 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Tests embeddings module."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from smjsindustry.finance.embeddings import (
+    Doc2VecEmbedder,
+    EmbeddingCache,
+    HashingEmbedder,
+    PrecomputedEmbedder,
+)
+from smjsindustry.finance.local_summarizer import (
+    split_sentences,
+    summarize_batch,
+    summarize_text,
+    tokenize,
+)
+from smjsindustry.finance.processor_config import (
+    JaccardSummarizerConfig,
+    KMedoidsSummarizerConfig,
+)
+
+SENTENCES = [
+    "Revenue increased in the third quarter.",
+    "Net revenue increased due to higher product sales.",
+    "The company opened a new office in Seattle.",
+    "The weather was pleasant.",
+]
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self, contextual=False):
+        super().__init__(vector_size=16)
+        self.contextual = contextual
+        self.embedded = []
+
+    def embed(self, sentences, sentence_tokens):
+        self.embedded.extend(sentences)
+        return super().embed(sentences, sentence_tokens)
+
+
+def _tokens(sentences):
+    return [tokenize(sentence) for sentence in sentences]
+
+
+def test_hashing_embedder():
+    embedder = HashingEmbedder(vector_size=32)
+    sentences = SENTENCES + ["pleasant the was weather", "..."]
+    vectors = embedder.embed(sentences, _tokens(sentences))
+    assert vectors.shape == (6, 32)
+    np.testing.assert_allclose(np.linalg.norm(vectors[:5], axis=1), 1.0)
+    np.testing.assert_allclose(vectors[3], vectors[4])
+    assert not vectors[5].any()
+    again = HashingEmbedder(vector_size=32).embed(sentences[::-1], _tokens(sentences[::-1]))
+    np.testing.assert_allclose(again[::-1], vectors)
+    other_seed = HashingEmbedder(vector_size=32, seed=1).embed(sentences, _tokens(sentences))
+    assert not np.allclose(other_seed, vectors)
+    assert HashingEmbedder().embed([], []).shape == (0, 256)
+    with pytest.raises(ValueError):
+        HashingEmbedder(vector_size=0)
+
+
+def test_precomputed_embedder():
+    vectors = {sentence: np.full(3, position) for position, sentence in enumerate(SENTENCES)}
+    embedder = PrecomputedEmbedder(vectors)
+    embedded = embedder.embed(SENTENCES[:2], _tokens(SENTENCES[:2]))
+    np.testing.assert_array_equal(embedded, [[0, 0, 0], [1, 1, 1]])
+    with pytest.raises(ValueError):
+        embedder.embed(["Unknown sentence."], [["unknown", "sentence"]])
+
+
+def test_doc2vec_embedder_from_config():
+    pytest.importorskip("gensim")
+    summarizer_config = KMedoidsSummarizerConfig(summary_size=2, vector_size=8, epochs=3)
+    embedder = Doc2VecEmbedder.from_config(summarizer_config)
+    assert embedder.contextual
+    assert embedder.parameters["vector_size"] == 8
+    assert embedder.embed(SENTENCES, _tokens(SENTENCES)).shape == (4, 8)
+
+
+def test_embedding_cache_embeds_only_new_sentences(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    embedder = CountingEmbedder()
+    first = cache.embed(embedder, SENTENCES, _tokens(SENTENCES))
+    assert embedder.embedded == SENTENCES
+    assert (cache.hits, cache.misses, len(cache)) == (0, 4, 4)
+
+    revised = SENTENCES[:3] + ["Operating costs decreased."]
+    embedder.embedded.clear()
+    second = cache.embed(embedder, revised, _tokens(revised))
+    assert embedder.embedded == ["Operating costs decreased."]
+    np.testing.assert_allclose(second[:3], first[:3])
+    np.testing.assert_allclose(second, embedder.embed(revised, _tokens(revised)))
+    assert (cache.hits, cache.misses, len(cache)) == (3, 5, 5)
+
+    restored = pickle.loads(pickle.dumps(cache))
+    embedder.embedded.clear()
+    restored.embed(embedder, SENTENCES, _tokens(SENTENCES))
+    assert embedder.embedded == []
+    assert restored.path == cache.path
+
+    other = HashingEmbedder(vector_size=8)
+    assert cache.embed(other, SENTENCES, _tokens(SENTENCES)).shape == (4, 8)
+    assert len(cache) == 9
+
+
+def test_embedding_cache_contextual(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    embedder = CountingEmbedder(contextual=True)
+    cache.embed(embedder, SENTENCES, _tokens(SENTENCES))
+    embedder.embedded.clear()
+    cache.embed(embedder, SENTENCES, _tokens(SENTENCES))
+    assert embedder.embedded == []
+    revised = SENTENCES[:3] + ["Operating costs decreased."]
+    cache.embed(embedder, revised, _tokens(revised))
+    assert embedder.embedded == revised
+
+
+def test_summarize_with_embedder_and_cache(tmp_path):
+    pytest.importorskip("nltk")
+    document = " ".join(SENTENCES + ["Product sales and revenue increased."])
+    summarizer_config = KMedoidsSummarizerConfig(summary_size=2, metric="cosine")
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    embedder = HashingEmbedder(vector_size=64)
+    summary = summarize_text(document, summarizer_config, embedder, cache)
+    assert len(split_sentences(summary)) == 2
+    assert summarize_text(document, summarizer_config, embedder) == summary
+    assert len(cache) == 5
+
+    batch = summarize_batch(
+        [document, document], summarizer_config, n_jobs=2, embedder=embedder, embedding_cache=cache
+    )
+    assert batch.summaries.tolist() == [summary, summary]
+    assert len(cache) == 5
+
+    with pytest.raises(ValueError):
+        summarize_text(document, JaccardSummarizerConfig(summary_size=2), embedder)
+    with pytest.raises(TypeError):
+        summarize_text(document, summarizer_config, embedder="hashing")
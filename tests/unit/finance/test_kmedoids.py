@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Tests kmedoids module."""
+
+import itertools
+import sys
+
+import numpy as np
+import pytest
+
+from smjsindustry.finance.kmedoids import clara, compare_with_pam, kmedoids, pairwise_distances
+
+INIT_VALUES = ["random", "heuristic", "k-medoids++", "build"]
+
+
+def _objective(distances, medoids):
+    return distances[list(medoids)].min(axis=0).sum()
+
+
+def test_pairwise_distances():
+    vectors = np.array([[0.0, 0.0], [3.0, 4.0], [1.0, 0.0], [0.0, 2.0]])
+    euclidean = pairwise_distances(vectors, "euclidean")
+    expected = np.linalg.norm(vectors[:, None, :] - vectors[None, :, :], axis=2)
+    np.testing.assert_allclose(euclidean, expected, atol=1e-12)
+
+    cosine = pairwise_distances(vectors, "cosine")
+    assert cosine[2, 3] == pytest.approx(1.0)
+    assert cosine[1, 2] == pytest.approx(1 - 3 / 5)
+    assert cosine[0, 1] == pytest.approx(1.0)
+
+    dot_product = pairwise_distances(vectors, "dot-product")
+    products = vectors @ vectors.T
+    np.testing.assert_allclose(dot_product, products.max() - products)
+
+    with pytest.raises(ValueError):
+        pairwise_distances(vectors, "manhattan")
+    with pytest.raises(ValueError):
+        pairwise_distances(vectors[0], "euclidean")
+
+
+@pytest.mark.parametrize("init", INIT_VALUES)
+@pytest.mark.parametrize("metric", ["euclidean", "cosine", "dot-product"])
+def test_pam_matches_exhaustive_search(metric, init):
+    rng = np.random.default_rng(3)
+    centers = np.array([[5.0, 0.0, 0.0], [0.0, 5.0, 0.0], [0.0, 0.0, 5.0]])
+    vectors = np.concatenate([center + rng.normal(size=(6, 3)) for center in centers])
+    distances = pairwise_distances(vectors, metric)
+    result = kmedoids(distances, 3, init=init, seed=11)
+    best = min(
+        _objective(distances, medoids) for medoids in itertools.combinations(range(18), 3)
+    )
+    assert result.objective == pytest.approx(_objective(distances, result.medoids))
+    assert result.objective == pytest.approx(best)
+    assert len(set(result.medoids.tolist())) == 3
+    assert result.labels.tolist() == np.argmin(distances[result.medoids], axis=0).tolist()
+
+
+@pytest.mark.parametrize("init", INIT_VALUES)
+def test_kmedoids_is_locally_optimal_and_seeded(init):
+    rng = np.random.default_rng(5)
+    distances = pairwise_distances(rng.normal(size=(40, 5)))
+    result = kmedoids(distances, 4, init=init, seed=1)
+    for position, candidate in itertools.product(range(4), range(40)):
+        if candidate in result.medoids:
+            continue
+        swapped = result.medoids.copy()
+        swapped[position] = candidate
+        assert _objective(distances, swapped) >= result.objective - 1e-9
+    again = kmedoids(distances, 4, init=init, seed=1)
+    assert np.array_equal(again.medoids, result.medoids)
+
+    alternate = kmedoids(distances, 4, init=init, method="alternate", seed=1)
+    assert len(set(alternate.medoids.tolist())) == 4
+    assert alternate.objective == pytest.approx(_objective(distances, alternate.medoids))
+
+
+@pytest.mark.parametrize("method", ["pam", "alternate"])
+@pytest.mark.parametrize("init", INIT_VALUES)
+@pytest.mark.parametrize("metric", ["euclidean", "cosine", "dot-product"])
+def test_kmedoids_medoids_are_unique(metric, init, method):
+    rng = np.random.default_rng(7)
+    for seed in range(20):
+        distances = pairwise_distances(rng.normal(size=(12, 4)), metric)
+        result = kmedoids(distances, 6, init=init, method=method, seed=seed)
+        assert len(set(result.medoids.tolist())) == 6
+
+
+def test_kmedoids_invalid():
+    distances = pairwise_distances(np.eye(3))
+    with pytest.raises(ValueError):
+        kmedoids(distances, 4)
+    with pytest.raises(ValueError):
+        kmedoids(distances, 0)
+    with pytest.raises(ValueError):
+        kmedoids(distances, 2, init="farthest")
+    with pytest.raises(ValueError):
+        kmedoids(distances, 2, method="clara")
+    with pytest.raises(ValueError):
+        kmedoids(distances[:2], 1)
+
+
+def _clustered_vectors(count, clusters=8, dimensions=16, seed=3):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimensions)) * 4
+    return centers[rng.integers(0, clusters, count)] + rng.normal(size=(count, dimensions))
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cosine", "dot-product"])
+def test_clara_is_close_to_pam(metric):
+    vectors = _clustered_vectors(1500)
+    comparison = compare_with_pam(vectors, 8, metric, sample_size=200, n_samples=5)
+    assert comparison.relative_gap < 0.1
+    assert comparison.clara_objective >= comparison.pam_objective * (1 - 1e-9)
+    result = clara(vectors, 8, metric, sample_size=200, n_samples=5)
+    distances = pairwise_distances(vectors, metric)
+    labels = np.argmin(distances[:, result.medoids], axis=1)
+    np.testing.assert_array_equal(result.labels, labels)
+    assert np.isclose(result.objective, distances[np.arange(1500), result.medoids[labels]].sum())
+    assert len(set(result.medoids.tolist())) == 8
+
+
+def test_clara_small_input_is_exact_pam(monkeypatch):
+    monkeypatch.setattr(sys.modules[kmedoids.__module__], "_ASSIGN_BLOCK_SIZE", 7)
+    vectors = _clustered_vectors(40)
+    exact = kmedoids(pairwise_distances(vectors), 4)
+    result = clara(vectors, 4, sample_size=100)
+    assert sorted(result.medoids.tolist()) == sorted(exact.medoids.tolist())
+    assert np.isclose(result.objective, exact.objective)
+
+
+def test_clara_invalid():
+    vectors = _clustered_vectors(20)
+    with pytest.raises(ValueError):
+        clara(vectors, 0)
+    with pytest.raises(ValueError):
+        clara(vectors, 2, sample_size=-1)
+    with pytest.raises(ValueError):
+        clara(vectors, 2, n_samples=0)
+    with pytest.raises(ValueError):
+        clara(vectors, 2, metric="manhattan")
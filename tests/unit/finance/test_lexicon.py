@@ -0,0 +1,115 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Tests lexicon module."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smjsindustry.finance.lexicon import LEXICON_FORMAT_VERSION, compile_lexicon, load_lexicon
+from smjsindustry.finance.local_scorer import score_dataframe
+from smjsindustry.finance.nlp_score_type import NLPScoreType
+from smjsindustry.finance.processor_config import NLPScorerConfig
+
+pytest.importorskip("nltk")
+
+TEXTS = pd.Series(
+    [
+        "The auditor raised a going concern doubt and found a material weakness.",
+        "Revenue grew, and the litigation risk is low. The outlook improved.",
+        None,
+    ]
+)
+WORD_LISTS = {
+    NLPScoreType.POSITIVE: ["grew", "improved", "low risk"],
+    NLPScoreType.NEGATIVE: ["risk", "weakness", "doubt"],
+}
+
+
+def _config():
+    return NLPScorerConfig(
+        [
+            NLPScoreType(NLPScoreType.POSITIVE, []),
+            NLPScoreType(NLPScoreType.NEGATIVE, []),
+            NLPScoreType(NLPScoreType.POLARITY, None),
+            NLPScoreType("audit", ["going concern", "material weakness", "auditor"]),
+        ]
+    )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_saved_lexicon_scores_like_compiled_word_lists(tmp_path, mmap):
+    df = TEXTS.to_frame("text")
+    expected = score_dataframe(df, _config(), "text", word_lists=WORD_LISTS)
+    compiled = compile_lexicon(_config(), tmp_path / "lexicon", word_lists=WORD_LISTS)
+    loaded = load_lexicon(tmp_path / "lexicon", mmap=mmap)
+    assert loaded.names == ["positive", "negative", "audit"]
+    assert loaded.word_lists_hash == compiled.word_lists_hash
+    assert isinstance(loaded.membership, np.memmap) == mmap
+    # The internal word lists are taken from the lexicon when the config leaves them empty.
+    pd.testing.assert_frame_equal(score_dataframe(df, _config(), "text", lexicon=loaded), expected)
+    pd.testing.assert_frame_equal(
+        score_dataframe(df, _config(), "text", word_lists=WORD_LISTS, lexicon=loaded), expected
+    )
+
+
+def test_word_lists_hash_ignores_order_and_case():
+    config = NLPScorerConfig([NLPScoreType("audit", ["Going  concern", "auditor"])])
+    reordered = NLPScorerConfig([NLPScoreType("audit", ["auditor", "going concern", "auditor"])])
+    other = NLPScorerConfig([NLPScoreType("audit", ["auditor"])])
+    assert compile_lexicon(config).word_lists_hash == compile_lexicon(reordered).word_lists_hash
+    assert compile_lexicon(config).word_lists_hash != compile_lexicon(other).word_lists_hash
+
+
+def test_stale_or_invalid_lexicon(tmp_path):
+    lexicon = compile_lexicon(_config(), tmp_path, word_lists=WORD_LISTS)
+    changed = {**WORD_LISTS, NLPScoreType.NEGATIVE: ["risk"]}
+    with pytest.raises(ValueError):
+        score_dataframe(TEXTS.to_frame("text"), _config(), "text", changed, lexicon)
+    other = NLPScorerConfig([NLPScoreType("legal", ["court"])])
+    with pytest.raises(ValueError):
+        score_dataframe(TEXTS.to_frame("text"), other, "text", lexicon=lexicon)
+    with pytest.raises(TypeError):
+        score_dataframe(TEXTS.to_frame("text"), _config(), "text", lexicon=str(tmp_path))
+    with pytest.raises(ValueError):
+        compile_lexicon(_config())
+
+    manifest_path = tmp_path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["format_version"] = LEXICON_FORMAT_VERSION + 1
+    manifest_path.write_text(json.dumps(manifest))
+    with pytest.raises(ValueError):
+        load_lexicon(tmp_path)
+    with pytest.raises(ValueError):
+        load_lexicon(tmp_path / "missing")
+
+
+def test_resaved_lexicon_replaces_arrays(tmp_path):
+    first = NLPScorerConfig([NLPScoreType("mine", ["gold"])])
+    second = NLPScorerConfig([NLPScoreType("mine", ["ore"])])
+    compile_lexicon(first, tmp_path / "lexicon")
+    compile_lexicon(second, tmp_path / "lexicon")
+    loaded = load_lexicon(tmp_path / "lexicon")
+    assert loaded.word_lists_hash == compile_lexicon(second).word_lists_hash
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["lexicon"]
+
+
+def test_lexicon_arrays_must_match_manifest(tmp_path):
+    compile_lexicon(NLPScorerConfig([NLPScoreType("mine", ["gold"])]), tmp_path / "first")
+    compile_lexicon(NLPScorerConfig([NLPScoreType("mine", ["ore"])]), tmp_path / "second")
+    for array_path in (tmp_path / "second").glob("*.npy"):
+        (tmp_path / "first" / array_path.name).write_bytes(array_path.read_bytes())
+    with pytest.raises(ValueError, match="does not match its manifest"):
+        load_lexicon(tmp_path / "first")
@@ -0,0 +1,246 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Tests kmedoids module."""
+
+"""Tests local_scorer module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smjsindustry.finance import local_scorer
+from smjsindustry.finance.local_scorer import (
+    count_syllables,
+    readability_scores,
+    score_csv,
+    score_dataframe,
+    score_text,
+)
+from smjsindustry.finance.nlp_score_type import NLPScoreType
+from smjsindustry.finance.processor_config import NLPScorerConfig
+
+pytest.importorskip("nltk")
+
+TRANSCRIPT = (
+    "Revenue grew strongly and margins improved. "
+    "We see risks from litigation and a possible fraud investigation. "
+    "Overall, the outlook remains uncertain but promising in 2022."
+)
+WORD_LISTS = {
+    NLPScoreType.POSITIVE: ["grow", "improve", "promising"],
+    NLPScoreType.NEGATIVE: ["risk", "fraud", "uncertain"],
+}
+
+
+def _config(*score_types):
+    return NLPScorerConfig(list(score_types))
+
+
+@pytest.mark.parametrize(
+    "word, syllables",
+    [("the", 1), ("revenue", 3), ("improved", 2), ("litigation", 4), ("table", 2), ("a", 1)],
+)
+def test_count_syllables(word, syllables):
+    assert count_syllables(word) == syllables
+
+
+def test_score_text_word_lists():
+    scores = score_text(
+        TRANSCRIPT,
+        _config(
+            NLPScoreType(NLPScoreType.POSITIVE, []),
+            NLPScoreType(NLPScoreType.RISK, ["risk"]),
+            NLPScoreType("legal", ["litigation", "investigations"]),
+            NLPScoreType(NLPScoreType.POLARITY, None),
+        ),
+        word_lists=WORD_LISTS,
+    )
+    assert list(scores) == ["positive", "risk", "legal", "polarity"]
+    # 24 words, as the year is not a word; "grew" does not share the stem of "grow".
+    assert scores["positive"] == pytest.approx(2 / 24)
+    assert scores["risk"] == pytest.approx(1 / 24)
+    assert scores["legal"] == pytest.approx(2 / 24)
+    assert scores["polarity"] == pytest.approx((2 - 3) / (2 + 3))
+
+
+def test_score_text_readability():
+    scores = score_text(TRANSCRIPT, _config(NLPScoreType(NLPScoreType.READABILITY, None)))
+    words = [token for token in local_scorer.tokenize(TRANSCRIPT) if not token.isdigit()]
+    complex_words = sum(count_syllables(word) >= 3 for word in words)
+    expected = 0.4 * (len(words) / 3 + 100 * complex_words / len(words))
+    assert scores["readability"] == pytest.approx(expected)
+    assert score_text("", _config(NLPScoreType(NLPScoreType.READABILITY, None))) == {
+        "readability": 0.0
+    }
+
+
+class _LengthAnalyzer:
+    def polarity_scores(self, sentence):
+        return {"compound": len(sentence) / 100}
+
+
+def test_score_text_sentiment(monkeypatch):
+    nlp_scorer_config = _config(NLPScoreType(NLPScoreType.SENTIMENT, None))
+    try:
+        scores = score_text("Great results. Terrible losses.", nlp_scorer_config)
+        assert -1.0 <= scores["sentiment"] <= 1.0
+    except RuntimeError:
+        pass  # The VADER lexicon of nltk is not downloaded.
+    monkeypatch.setattr(local_scorer, "_get_sentiment_analyzer", _LengthAnalyzer)
+    scores = score_text("Great results. Terrible losses.", nlp_scorer_config)
+    assert scores["sentiment"] == pytest.approx((14 + 16) / 2 / 100)
+    assert score_text(" ", nlp_scorer_config) == {"sentiment": 0.0}
+
+
+def test_missing_internal_word_list():
+    with pytest.raises(ValueError):
+        score_text(TRANSCRIPT, _config(NLPScoreType(NLPScoreType.FRAUD, [])))
+    with pytest.raises(ValueError):
+        score_text(TRANSCRIPT, _config(NLPScoreType(NLPScoreType.POLARITY, None)))
+    with pytest.raises(TypeError):
+        score_text(TRANSCRIPT, {"score_types": {}})
+    with pytest.raises(TypeError):
+        score_text(TRANSCRIPT, _config(NLPScoreType("legal", ["court"])), word_lists=["court"])
+
+
+def test_score_dataframe_and_csv(tmp_path):
+    df = pd.DataFrame({"id": [1, 2, 3], "text": [TRANSCRIPT, None, "Fraud."]})
+    nlp_scorer_config = _config(
+        NLPScoreType("legal", ["litigation", "fraud"]),
+        NLPScoreType(NLPScoreType.READABILITY, None),
+    )
+    result = score_dataframe(df, nlp_scorer_config, "text")
+    assert list(result.columns) == ["id", "text", "legal", "readability"]
+    assert "legal" not in df.columns
+    assert result["legal"].tolist() == pytest.approx([2 / 24, 0.0, 1.0])
+    assert result["readability"].tolist() == pytest.approx(
+        [score_text(text, nlp_scorer_config)["readability"] for text in df["text"]]
+    )
+    with pytest.raises(ValueError):
+        score_dataframe(df, nlp_scorer_config, "missing")
+
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    df.to_csv(input_path, index=False)
+    from_csv = score_csv(input_path, nlp_scorer_config, "text", output_path)
+    pd.testing.assert_frame_equal(pd.read_csv(output_path), from_csv)
+    assert from_csv["legal"].tolist() == pytest.approx(result["legal"].tolist())
+
+
+def test_lexicon_index_matches_per_list_counts():
+    rng = np.random.default_rng(0)
+    vocabulary = [f"term{index}" for index in range(60)]
+    word_lists = {f"list{index}": list(rng.choice(vocabulary, 15)) for index in range(12)}
+    nlp_scorer_config = _config(
+        *(NLPScoreType(name, words) for name, words in word_lists.items()),
+        NLPScoreType(NLPScoreType.READABILITY, None),
+    )
+    pipeline = local_scorer._ScoringPipeline(nlp_scorer_config, None)
+    assert len(pipeline._lexicon.membership) <= 2 + 60
+    for _ in range(5):
+        words = list(rng.choice(vocabulary + ["2021", "plain"], 80))
+        scores = pipeline.score(" ".join(words))
+        counted = [word for word in words if word != "2021"]
+        for name, word_list in word_lists.items():
+            expected = sum(word in word_list for word in counted) / len(counted)
+            assert scores[name] == pytest.approx(expected)
+
+
+def _naive_phrase_count(stems, phrase):
+    return sum(
+        tuple(stems[start : start + len(phrase)]) == phrase
+        for start in range(len(stems) - len(phrase) + 1)
+    )
+
+
+def test_score_text_phrases():
+    nlp_scorer_config = _config(
+        NLPScoreType("audit", ["going concern", "material weakness", "weakness"]),
+        NLPScoreType("restatement", ["restatement of prior period", "prior period", "period"]),
+    )
+    text = (
+        "Material weaknesses raise going-concern doubts. The restatement of prior periods "
+        "followed a prior period restatement of prior period results."
+    )
+    scores = score_text(text, nlp_scorer_config)
+    # 20 words. Audit: one phrase of each kind and one single word "weaknesses".
+    assert scores["audit"] == pytest.approx(3 / 20)
+    # Two full restatements, three "prior period" and three "period" occurrences.
+    assert scores["restatement"] == pytest.approx(8 / 20)
+
+
+def test_phrase_automaton_matches_naive_counts():
+    rng = np.random.default_rng(5)
+    alphabet = ["a", "b", "c", "d"]
+    phrases = {tuple(rng.choice(alphabet, rng.integers(2, 5))) for _ in range(40)}
+    word_lists = [sorted(phrases)[index::3] for index in range(3)]
+    nlp_scorer_config = _config(
+        *(
+            NLPScoreType(f"list{index}", [" ".join(phrase) for phrase in word_list])
+            for index, word_list in enumerate(word_lists)
+        )
+    )
+    pipeline = local_scorer._ScoringPipeline(nlp_scorer_config, None)
+    for _ in range(5):
+        words = list(rng.choice(alphabet + ["zzz"], 300))
+        scores = pipeline.score(" ".join(words))
+        for index, word_list in enumerate(word_lists):
+            expected = sum(_naive_phrase_count(words, phrase) for phrase in word_list)
+            assert scores[f"list{index}"] == pytest.approx(expected / 300)
+
+
+def _naive_readability(text):
+    if not isinstance(text, str) or not text.strip():
+        return 0, 0, 0, 0
+    words = [token for token in local_scorer.tokenize(text) if not token.isdigit()]
+    syllables = [count_syllables(word) for word in words]
+    return (
+        len(local_scorer.split_sentences(text)),
+        len(words),
+        sum(syllables),
+        sum(count >= 3 for count in syllables),
+    )
+
+
+def test_readability_scores():
+    texts = pd.Series(
+        [TRANSCRIPT, None, "", "Litigation. Revenue grew 5%.", "2021"], index=list("abcde")
+    )
+    table = readability_scores(texts)
+    assert table.index.tolist() == list("abcde")
+    for label, text in texts.items():
+        sentences, words, syllables, complex_words = _naive_readability(text)
+        row = table.loc[label]
+        assert (row["sentences"], row["words"], row["syllables"], row["complex_words"]) == (
+            sentences,
+            words,
+            syllables,
+            complex_words,
+        )
+        if not words:
+            assert (row["gunning_fog"], row["flesch_reading_ease"]) == (0.0, 0.0)
+            continue
+        per_sentence = words / sentences
+        assert row["gunning_fog"] == pytest.approx(
+            0.4 * (per_sentence + 100 * complex_words / words)
+        )
+        assert row["flesch_reading_ease"] == pytest.approx(
+            206.835 - 1.015 * per_sentence - 84.6 * syllables / words
+        )
+        assert row["flesch_kincaid_grade"] == pytest.approx(
+            0.39 * per_sentence + 11.8 * syllables / words - 15.59
+        )
+    nlp_scorer_config = _config(NLPScoreType(NLPScoreType.READABILITY, None))
+    scored = score_dataframe(texts.to_frame("text"), nlp_scorer_config, "text")
+    assert scored["readability"].tolist() == pytest.approx(table["gunning_fog"].tolist())
+    assert readability_scores([]).empty
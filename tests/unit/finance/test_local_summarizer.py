@@ -0,0 +1,444 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Tests local_summarizer module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smjsindustry.finance import local_summarizer
+from smjsindustry.finance.local_summarizer import (
+    jaccard_scores,
+    jaccard_similarity,
+    minhash_jaccard_scores,
+    iter_summarized_csv,
+    split_sentences,
+    summarize_batch,
+    summarize_csv,
+    summarize_csv_streaming,
+    summarize_dataframe,
+    summarize_text,
+    tokenize,
+)
+from smjsindustry.finance.processor_config import (
+    JaccardSummarizerConfig,
+    KMedoidsSummarizerConfig,
+)
+
+pytest.importorskip("nltk")
+
+DOCUMENT = (
+    "Revenue increased in the third quarter. "
+    "Net revenue increased due to higher product sales. "
+    "The company opened a new office in Seattle. "
+    "Product sales and revenue increased across all segments. "
+    "The weather was pleasant."
+)
+
+
+def test_split_sentences():
+    text = 'He said "Sales rose." Then costs fell! Why? Revenue was $1.5 million. 2020 was good.'
+    assert split_sentences(text) == [
+        'He said "Sales rose."',
+        "Then costs fell!",
+        "Why?",
+        "Revenue was $1.5 million.",
+        "2020 was good.",
+    ]
+    assert split_sentences("  ") == []
+
+
+def test_tokenize():
+    tokens = tokenize("Net revenue, in 2020, ROSE 5%.")
+    assert tokens == ["net", "revenue", "in", "2020", "rose", "5"]
+
+
+def test_summary_ignores_numeric_tokens():
+    # The sentences with only numbers in common do not outrank the one sharing words.
+    document = (
+        "Margins were 10 percent in 2021. Revenue was 10 million in 2021. "
+        "Revenue grew and margins grew."
+    )
+    summary = summarize_text(document, JaccardSummarizerConfig(summary_size=1))
+    assert summary == "Revenue grew and margins grew."
+
+
+def test_jaccard_scores():
+    scores = jaccard_scores([{"a", "b"}, {"a", "c"}, {"d"}, set()])
+    expected = np.array([1 / 3, 1 / 3, 0.0, 0.0]) / 3
+    np.testing.assert_allclose(scores, expected)
+    assert jaccard_scores([{"a"}]).tolist() == [0.0]
+    assert jaccard_scores([]).tolist() == []
+
+
+def _dense_jaccard(token_sets):
+    count = len(token_sets)
+    similarity = np.zeros((count, count))
+    for i in range(count):
+        for j in range(count):
+            union = len(token_sets[i] | token_sets[j])
+            if i != j and union:
+                similarity[i, j] = len(token_sets[i] & token_sets[j]) / union
+    return similarity
+
+
+def test_sparse_jaccard_matches_dense(monkeypatch):
+    monkeypatch.setattr(local_summarizer, "_SIMILARITY_BLOCK_SIZE", 7)
+    rng = np.random.default_rng(0)
+    token_sets = [
+        {f"w{token}" for token in rng.integers(0, 40, size=rng.integers(0, 8))}
+        for _ in range(30)
+    ]
+    dense = _dense_jaccard(token_sets)
+    np.testing.assert_allclose(jaccard_similarity(token_sets).toarray(), dense)
+    np.testing.assert_allclose(jaccard_scores(token_sets), dense.sum(axis=1) / 29)
+    assert jaccard_similarity([set(), set()]).nnz == 0
+
+
+@pytest.mark.parametrize(
+    "summarizer_config, expected",
+    [
+        (
+            JaccardSummarizerConfig(summary_size=2),
+            "Net revenue increased due to higher product sales. "
+            "Product sales and revenue increased across all segments.",
+        ),
+        (
+            JaccardSummarizerConfig(summary_percentage=0.2),
+            "Product sales and revenue increased across all segments.",
+        ),
+        (
+            JaccardSummarizerConfig(max_tokens=16),
+            "Net revenue increased due to higher product sales. "
+            "Product sales and revenue increased across all segments.",
+        ),
+        (
+            JaccardSummarizerConfig(cutoff=0.15),
+            "Net revenue increased due to higher product sales. "
+            "Product sales and revenue increased across all segments.",
+        ),
+        (
+            JaccardSummarizerConfig(summary_size=1, vocabulary={"Revenue"}),
+            "Revenue increased in the third quarter.",
+        ),
+    ],
+)
+def test_summarize_text(summarizer_config, expected):
+    assert summarize_text(DOCUMENT, summarizer_config) == expected
+
+
+def test_summarize_text_empty_and_invalid():
+    summarizer_config = JaccardSummarizerConfig(summary_size=2)
+    assert summarize_text("", summarizer_config) == ""
+    assert summarize_text(None, summarizer_config) == ""
+    with pytest.raises(TypeError):
+        summarize_text(DOCUMENT, {"summary_size": 2})
+
+
+def test_summarize_dataframe_and_csv(tmp_path):
+    df = pd.DataFrame({"id": [1, 2, 3], "text": [DOCUMENT, None, "One sentence only."]})
+    summarizer_config = JaccardSummarizerConfig(summary_size=1)
+    result = summarize_dataframe(df, summarizer_config, "text", "digest")
+    assert "digest" not in df.columns
+    assert result["digest"].tolist() == [
+        "Product sales and revenue increased across all segments.",
+        "",
+        "One sentence only.",
+    ]
+    with pytest.raises(ValueError):
+        summarize_dataframe(df, summarizer_config, "missing")
+
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    df.to_csv(input_path, index=False)
+    from_csv = summarize_csv(input_path, summarizer_config, "text", output_path, "digest")
+    assert from_csv["digest"].tolist() == result["digest"].tolist()
+    written = pd.read_csv(output_path, keep_default_na=False)
+    assert written["digest"].tolist() == result["digest"].tolist()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_summarize_batch(n_jobs):
+    documents = [DOCUMENT, "", "One sentence only.", DOCUMENT.upper(), None, DOCUMENT[::-1]]
+    summarizer_config = JaccardSummarizerConfig(summary_size=2)
+    texts = pd.Series(documents, index=[10, 11, 12, 13, 14, 15])
+    batch = summarize_batch(texts, summarizer_config, n_jobs=n_jobs)
+    assert batch.summaries.index.tolist() == [10, 11, 12, 13, 14, 15]
+    assert batch.summaries.tolist() == [
+        summarize_text(document, summarizer_config) for document in documents
+    ]
+    assert batch.seconds.index.equals(batch.summaries.index)
+    assert (batch.seconds >= 0).all()
+    from_list = summarize_batch(documents, summarizer_config, n_jobs=n_jobs)
+    assert from_list.summaries.index.tolist() == list(range(6))
+    assert from_list.summaries.tolist() == batch.summaries.tolist()
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 5])
+def test_summarize_parallel_preserves_order(tmp_path, chunk_size):
+    sentences = split_sentences(DOCUMENT)
+    documents = [" ".join(sentences[shift:] + sentences[:shift]) for shift in range(5)] * 2
+    df = pd.DataFrame({"text": documents}, index=list(range(100, 110)))
+    summarizer_config = JaccardSummarizerConfig(summary_size=2)
+    expected = [summarize_text(document, summarizer_config) for document in documents]
+    result = summarize_dataframe(df, summarizer_config, "text", n_jobs=3, chunk_size=chunk_size)
+    assert result.index.tolist() == df.index.tolist()
+    assert result["summary"].tolist() == expected
+
+    input_path = tmp_path / "input.csv"
+    df.to_csv(input_path, index=False)
+    from_csv = summarize_csv(input_path, summarizer_config, "text", n_jobs=2, chunk_size=chunk_size)
+    assert from_csv["summary"].tolist() == expected
+
+
+def test_summarize_batch_invalid():
+    summarizer_config = JaccardSummarizerConfig(summary_size=2)
+    with pytest.raises(ValueError):
+        summarize_batch([DOCUMENT], summarizer_config, n_jobs=0)
+    with pytest.raises(ValueError):
+        summarize_batch([DOCUMENT], summarizer_config, n_jobs=2, chunk_size=0)
+    with pytest.raises(ValueError):
+        summarize_dataframe(
+            pd.DataFrame({"text": [DOCUMENT]}), summarizer_config, "text", n_jobs=-1
+        )
+    with pytest.raises(TypeError):
+        summarize_batch([DOCUMENT], None)
+
+
+def _reference_corpus(count):
+    rng = np.random.default_rng(7)
+    topics = [[f"topic{topic}_{word}" for word in range(30)] for topic in range(20)]
+    common = [f"common{word}" for word in range(3000)]
+    token_sets = []
+    for _ in range(count):
+        token_set = set(rng.choice(common, rng.integers(3, 12)))
+        if rng.random() < 0.7:
+            token_set |= set(rng.choice(topics[rng.integers(20)], rng.integers(3, 10)))
+        token_sets.append(token_set)
+    return token_sets + [set()]
+
+
+def test_minhash_scores_agree_with_exact_ranking():
+    token_sets = _reference_corpus(2000)
+    exact = pd.Series(jaccard_scores(token_sets))
+    approximate = pd.Series(minhash_jaccard_scores(token_sets))
+    assert approximate.iloc[-1] == 0.0
+    assert exact.corr(approximate, method="spearman") > 0.95
+    assert np.abs(exact - approximate).mean() < 0.005
+    coarse = pd.Series(minhash_jaccard_scores(token_sets, num_permutations=32, num_bands=32))
+    assert exact.corr(coarse, method="spearman") > 0.85
+    near_duplicates = minhash_jaccard_scores(
+        [{"a", "b", "c"}, {"a", "b", "c"}, {"a", "d", "e"}], num_permutations=64, num_bands=8
+    )
+    assert near_duplicates.tolist() == [0.5, 0.5, 0.0]
+    assert minhash_jaccard_scores([{"a"}]).tolist() == [0.0]
+
+
+def test_summarize_text_approximate():
+    exact = summarize_text(DOCUMENT, JaccardSummarizerConfig(summary_size=2))
+    approximate = summarize_text(
+        DOCUMENT, JaccardSummarizerConfig(summary_size=2, approximate=True)
+    )
+    assert approximate == exact
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"approximate": 1}, TypeError),
+        ({"num_permutations": 12.0}, TypeError),
+        ({"num_permutations": 0}, ValueError),
+        ({"num_bands": "4"}, TypeError),
+        ({"num_bands": 0}, ValueError),
+        ({"num_permutations": 128, "num_bands": 30}, ValueError),
+    ],
+)
+def test_approximate_config_validation(kwargs, error):
+    with pytest.raises(error):
+        JaccardSummarizerConfig(summary_size=2, **kwargs)
+
+
+def test_approximate_config_is_local_only():
+    summarizer_config = JaccardSummarizerConfig(
+        summary_size=2, approximate=True, num_permutations=64, num_bands=16
+    )
+    assert summarizer_config.approximate
+    assert summarizer_config.num_permutations == 64
+    assert summarizer_config.num_bands == 16
+    assert "approximate" not in summarizer_config.get_config()
+
+
+@pytest.mark.parametrize("init", ["random", "heuristic", "k-medoids++", "build"])
+@pytest.mark.parametrize("metric", ["euclidean", "cosine", "dot-product"])
+def test_summarize_text_kmedoids(metric, init):
+    pytest.importorskip("gensim")
+    sentences = split_sentences(DOCUMENT)
+    summarizer_config = KMedoidsSummarizerConfig(
+        summary_size=2, vector_size=8, epochs=5, metric=metric, init=init
+    )
+    summary = summarize_text(DOCUMENT, summarizer_config)
+    selected = split_sentences(summary)
+    assert len(selected) == 2
+    assert sorted(selected, key=sentences.index) == selected
+    assert set(selected) <= set(sentences)
+    assert summarize_text(DOCUMENT, summarizer_config) == summary
+
+
+def test_summarize_kmedoids_short_and_parallel():
+    pytest.importorskip("gensim")
+    summarizer_config = KMedoidsSummarizerConfig(summary_size=3, vector_size=8, epochs=5)
+    assert summarize_text("Only one. And two.", summarizer_config) == "Only one. And two."
+    assert summarize_text(DOCUMENT, KMedoidsSummarizerConfig(summary_size=0)) == ""
+    documents = [DOCUMENT, "", DOCUMENT.upper()]
+    batch = summarize_batch(documents, summarizer_config, n_jobs=2)
+    assert batch.summaries.tolist() == [
+        summarize_text(document, summarizer_config) for document in documents
+    ]
+
+
+@pytest.mark.parametrize("method", ["pam", "alternate", "clara"])
+def test_summarize_text_kmedoids_methods(method):
+    pytest.importorskip("gensim")
+    summarizer_config = KMedoidsSummarizerConfig(
+        summary_size=2, vector_size=8, epochs=5, method=method, sample_size=3, n_samples=2
+    )
+    assert summarizer_config.method == method
+    assert "method" not in summarizer_config.get_config()
+    selected = split_sentences(summarize_text(DOCUMENT, summarizer_config))
+    assert len(selected) == 2
+    assert set(selected) <= set(split_sentences(DOCUMENT))
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"method": 1}, TypeError),
+        ({"method": "fasterpam"}, ValueError),
+        ({"sample_size": 1.5}, TypeError),
+        ({"sample_size": -1}, ValueError),
+        ({"sample_size": True}, TypeError),
+        ({"n_samples": "5"}, TypeError),
+        ({"n_samples": 0}, ValueError),
+        ({"n_samples": True}, TypeError),
+    ],
+)
+def test_kmedoids_method_config_validation(kwargs, error):
+    with pytest.raises(error):
+        KMedoidsSummarizerConfig(summary_size=2, **kwargs)
+
+
+def _reference_selection(scores, token_counts, summarizer_config):
+    ranking = np.argsort(-scores, kind="stable")
+    if summarizer_config.summary_size:
+        selected = ranking[: summarizer_config.summary_size]
+    elif summarizer_config.summary_percentage:
+        selected = ranking[: max(1, int(len(ranking) * summarizer_config.summary_percentage))]
+    elif summarizer_config.max_tokens:
+        budget = np.cumsum(np.asarray(token_counts)[ranking])
+        selected = ranking[: np.searchsorted(budget, summarizer_config.max_tokens, side="right")]
+    else:
+        selected = ranking[scores[ranking] >= summarizer_config.cutoff]
+    return sorted(selected.tolist())
+
+
+@pytest.mark.parametrize("count", [0, 1, 7, 300])
+@pytest.mark.parametrize(
+    "summarizer_config",
+    [
+        JaccardSummarizerConfig(summary_size=1),
+        JaccardSummarizerConfig(summary_size=5),
+        JaccardSummarizerConfig(summary_size=500),
+        JaccardSummarizerConfig(summary_percentage=0.3),
+        JaccardSummarizerConfig(max_tokens=1),
+        JaccardSummarizerConfig(max_tokens=40),
+        JaccardSummarizerConfig(max_tokens=100000),
+        JaccardSummarizerConfig(cutoff=0.5),
+    ],
+)
+def test_select_sentences_matches_full_ranking(count, summarizer_config):
+    rng = np.random.default_rng(count)
+    scores = rng.integers(0, 6, size=count) / 5
+    sentence_tokens = [["token"] * size for size in rng.integers(0, 20, size=count)]
+    token_counts = [len(tokens) for tokens in sentence_tokens]
+    assert local_summarizer._select_sentences(
+        scores, sentence_tokens, summarizer_config
+    ) == _reference_selection(scores, token_counts, summarizer_config)
+
+
+def _streaming_input(tmp_path):
+    sentences = split_sentences(DOCUMENT)
+    documents = [" ".join(sentences[shift:] + sentences[:shift]) for shift in range(5)] * 5
+    documents[3] = 'A "quoted"\nmulti-line document. It has, commas.'
+    documents[7] = None
+    df = pd.DataFrame({"id": range(25), "text": documents})
+    input_path = tmp_path / "input.csv"
+    df.to_csv(input_path, index=False)
+    return input_path
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_summarize_csv_streaming(tmp_path, n_jobs):
+    input_path = _streaming_input(tmp_path)
+    summarizer_config = JaccardSummarizerConfig(summary_size=2)
+    expected = summarize_csv(input_path, summarizer_config, "text")
+    output_path = tmp_path / "output.csv"
+    stats = summarize_csv_streaming(
+        input_path, summarizer_config, "text", output_path, chunksize=4, n_jobs=n_jobs
+    )
+    assert (stats.chunks, stats.rows, stats.resumed_rows) == (7, 25, 0)
+    written = pd.read_csv(output_path, keep_default_na=False)
+    assert written["summary"].tolist() == expected["summary"].tolist()
+    assert written["id"].tolist() == list(range(25))
+
+    chunks = list(iter_summarized_csv(input_path, summarizer_config, "text", chunksize=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert pd.concat(chunks)["summary"].tolist() == expected["summary"].tolist()
+
+
+def test_summarize_csv_streaming_resumes_after_crash(tmp_path):
+    input_path = _streaming_input(tmp_path)
+    summarizer_config = JaccardSummarizerConfig(summary_size=1)
+    output_path = tmp_path / "output.csv"
+    summarize_csv_streaming(input_path, summarizer_config, "text", output_path, chunksize=6)
+    complete = output_path.read_bytes()
+
+    # Keep the header and the first rows, with the next row cut short.
+    partial = pd.read_csv(output_path, keep_default_na=False).iloc[:9]
+    cut = partial.to_csv(index=False, lineterminator="\n").encode()
+    output_path.write_bytes(cut + complete[len(cut) : len(cut) + 12])
+    stats = summarize_csv_streaming(
+        input_path, summarizer_config, "text", output_path, chunksize=6
+    )
+    assert (stats.resumed_rows, stats.rows) == (9, 16)
+    assert output_path.read_bytes() == complete
+
+    stats = summarize_csv_streaming(input_path, summarizer_config, "text", output_path)
+    assert (stats.resumed_rows, stats.rows) == (25, 0)
+    assert output_path.read_bytes() == complete
+    stats = summarize_csv_streaming(
+        input_path, summarizer_config, "text", output_path, resume=False
+    )
+    assert (stats.resumed_rows, stats.rows) == (0, 25)
+    assert output_path.read_bytes() == complete
+
+
+def test_summarize_csv_streaming_invalid(tmp_path):
+    input_path = _streaming_input(tmp_path)
+    summarizer_config = JaccardSummarizerConfig(summary_size=1)
+    output_path = tmp_path / "output.csv"
+    with pytest.raises(ValueError):
+        summarize_csv_streaming(input_path, summarizer_config, "missing", output_path)
+    with pytest.raises(ValueError):
+        summarize_csv_streaming(input_path, summarizer_config, "text", output_path, chunksize=0)
+    with pytest.raises(TypeError):
+        summarize_csv_streaming(input_path, summarizer_config, "text", output_path, resume=1)
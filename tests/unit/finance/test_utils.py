@@ -12,8 +12,20 @@
 # language governing permissions and limitations under the License.
 """Tests utils module."""
 
+import datetime
+import re
+
+import pandas as pd
 import pytest
-from smjsindustry.finance.utils import get_freq_label, retrieve_image
+from smjsindustry.finance.utils import (
+    FreqLabelCache,
+    _iso_week,
+    format_freq_ordinals,
+    get_freq_label,
+    get_freq_labels,
+    get_freq_ordinals,
+    retrieve_image,
+)
 from smjsindustry.finance.constants import REPOSITORY, CONTAINER_IMAGE_VERSION
 
 
@@ -61,6 +73,152 @@ def test_get_freq_label(date_value, freq):
             get_freq_label(date_value, freq)
 
 
+@pytest.mark.parametrize(
+    "date_value",
+    [
+        "2020-05-01",
+        "2020-5-1",
+        "2020-05",
+        "2020",
+        "2020W18",
+        "2020q2",
+        "2020M5",
+        "2021-01-01",
+        "2020-02-29",
+        "2019-02-29",
+        "2020-13-01",
+        "2020/05/01",
+    ],
+)
+@pytest.mark.parametrize("freq", ["Y", "Q", "M", "W", "D", "T", "y"])
+def test_get_freq_labels_matches_get_freq_label(date_value, freq):
+    try:
+        expected = get_freq_label(date_value, freq)
+    except ValueError as error:
+        with pytest.raises(ValueError, match=f"^{re.escape(str(error))}$"):
+            get_freq_labels(pd.Series([date_value]), freq)
+    else:
+        assert get_freq_labels(pd.Series([date_value]), freq).tolist() == [expected]
+
+
+def test_get_freq_labels_column():
+    date_values = pd.Series(
+        ["2019-01-01", "2019-02", "2019Q2", "2020-12-31", "2019-01-01"], index=[3, 3, 1, 0, 7]
+    )
+    actual = get_freq_labels(date_values, "Q")
+    assert actual.index.tolist() == [3, 3, 1, 0, 7]
+    assert actual.tolist() == ["2019Q1", "2019Q1", "2019Q2", "2020Q4", "2019Q1"]
+
+
+def test_get_freq_labels_raises_first_row_error():
+    with pytest.raises(ValueError, match="month must be in 1..12"):
+        get_freq_labels(pd.Series(["2020-01-01", "2020-13-01", "2020/01/01"]), "M")
+    with pytest.raises(ValueError, match="The date column needs to be string"):
+        get_freq_labels(pd.Series(["2020-01-01", 2020], dtype=object), "M")
+
+
+
+@pytest.mark.parametrize(
+    "date_value",
+    [
+        "2020-05-01",
+        "2021-01-01",
+        "2020-12-31",
+        "2018-12-31",
+        "2016-02-29",
+        "2017-02-29",
+        "2020-0-1",
+        "2020-1-32",
+        "0000-01-01",
+        "9999-12",
+        "2020W53",
+        "2020",
+        "2020-05-01\n",
+        "2020/05/01",
+    ],
+)
+@pytest.mark.parametrize("freq", ["Y", "Q", "M", "W", "D"])
+def test_get_freq_label_native_backend_matches_pandas(date_value, freq):
+    try:
+        expected = get_freq_label(date_value, freq, backend="pandas")
+    except ValueError as error:
+        with pytest.raises(ValueError, match=f"^{re.escape(str(error))}$"):
+            get_freq_label(date_value, freq, backend="native")
+    else:
+        assert get_freq_label(date_value, freq, backend="native") == expected
+
+
+def test_iso_week_matches_isocalendar():
+    day = datetime.date(1999, 1, 1)
+    while day.year < 2030:
+        assert _iso_week(day.year, day.month, day.day) == day.isocalendar()[1]
+        day += datetime.timedelta(days=1)
+
+
+def test_get_freq_label_unsupported_backend():
+    with pytest.raises(ValueError, match="backend numpy not supported"):
+        get_freq_label("2020-05-01", "Q", backend="numpy")  # type: ignore[arg-type]
+
+
+def test_get_freq_labels_missing_value():
+    with pytest.raises(ValueError, match="The date column needs to be string"):
+        get_freq_labels(pd.Series(["2020-01-01", None]).astype(str), "Q")
+
+
+def test_freq_label_cache():
+    cache = FreqLabelCache(maxsize=3)
+    date_values = pd.Series(["2020-01-01", "2020-02-01", "2020-01-01", "2020-05-01"])
+
+    first = get_freq_labels(date_values, "Q", cache)
+    assert first.tolist() == ["2020Q1", "2020Q1", "2020Q1", "2020Q2"]
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 3)
+
+    second = get_freq_labels(date_values, "q", cache)
+    assert second.tolist() == first.tolist()
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    assert get_freq_labels(pd.Series(["2020-05-01"]), "M", cache).tolist() == ["2020M5"]
+    assert (cache.hits, cache.misses, len(cache)) == (3, 4, 3)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("maxsize, error", [(0, ValueError), (1.5, TypeError)])
+def test_freq_label_cache_invalid_maxsize(maxsize, error):
+    with pytest.raises(error):
+        FreqLabelCache(maxsize=maxsize)
+
+
+@pytest.mark.parametrize("freq", ["D", "W", "M", "Q", "Y"])
+def test_get_freq_ordinals_match_labels(freq):
+    dates = pd.Series(pd.date_range("2018-12-24", "2021-01-10", freq="D"))
+
+    ordinals = get_freq_ordinals(dates + pd.Timedelta(hours=13), freq)
+
+    expected = [get_freq_label(value, freq) for value in dates.dt.strftime("%Y-%m-%d")]
+    assert list(format_freq_ordinals(ordinals, freq)) == expected
+
+
+@pytest.mark.parametrize(
+    "date_values",
+    [
+        pd.Series([datetime.date(2021, 7, 4)]),
+        pd.Series(pd.period_range("2021-07", periods=1, freq="M")),
+        pd.Series(pd.to_datetime(["2021-07-04 23:30"]).tz_localize("US/Eastern")),
+    ],
+)
+def test_get_freq_labels_temporal(date_values):
+    assert get_freq_labels(date_values, "Q").tolist() == ["2021Q3"]
+
+
+def test_get_freq_ordinals_invalid():
+    with pytest.raises(TypeError):
+        get_freq_ordinals(pd.Series(["2021-07-04"]), "Q")
+    with pytest.raises(ValueError, match="missing dates"):
+        get_freq_ordinals(pd.Series(pd.to_datetime(["2021-07-04", None])), "Q")
+
+
 @pytest.mark.parametrize(
     "region",
     [